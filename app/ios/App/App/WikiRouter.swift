@@ -30,12 +30,34 @@ struct WikiRouter: Router {
             return basePath + candidate
         }
 
+        // A page that moved: the site answers its old path with a 301 from
+        // _redirects, which this router never sees, so follow the same table
+        // (route-redirects.json, from scripts/rename_redirects.py).
+        if let moved = movedRoute(trimmed) {
+            let target = moved.isEmpty ? "/index.html" : "/" + moved + "/index.html"
+            if FileManager.default.fileExists(atPath: basePath + target) {
+                return basePath + target
+            }
+        }
+
         // Nothing there: serve the site's own 404 page if built, else home.
         if FileManager.default.fileExists(atPath: basePath + "/404.html") {
             return basePath + "/404.html"
         }
         return basePath + "/index.html"
     }
+
+    // Read on a miss only (a miss is rare), so an OTA content root that ships
+    // a newer table is picked up without caching a stale one.
+    private func movedRoute(_ path: String) -> String? {
+        guard let data = FileManager.default.contents(atPath: basePath + "/route-redirects.json"),
+              let json = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
+              let redirects = json["redirects"] as? [String: String] else {
+            return nil
+        }
+        let route = path.hasPrefix("/") ? String(path.dropFirst()) : path
+        return redirects[route]
+    }
 }
 
 class WikiBridgeViewController: CAPBridgeViewController {
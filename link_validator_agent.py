@@ -6,12 +6,26 @@ Scans all markdown files for broken internal and external links
 
 import re
 import os
+import posixpath
+import sys
+from collections import deque
+from collections.abc import Mapping
 from pathlib import Path
-from urllib.parse import urlparse, unquote
+from urllib.parse import urlparse, urlsplit, urlunsplit, unquote
 from datetime import datetime
+import hashlib
 import json
+import math
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import socket
+import sqlite3
+import subprocess
+import threading
+import zlib
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
 
 try:
     import requests
@@ -21,6 +35,17 @@ except ImportError:
     print("⚠ Warning: 'requests' module not available. External link checking disabled.")
     print("Install with: pip install requests")
 
+# Shared helpers live with the other link tooling in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from heading_index import HeadingIndex, split_fragment  # noqa: E402
+from route_manifest import REDIRECTS_FILE, RouteManifest, read_redirects  # noqa: E402
+from link_repair import RepairIndex, format_suggestions  # noqa: E402
+from findings_history import DEFAULT_PATH as HISTORY_PATH, FindingsHistory, section_of  # noqa: E402
+from rate_control import (  # noqa: E402
+    MAX_ATTEMPTS, MAX_RETRY_AFTER, THROTTLE_STATUSES, AimdLimit, HostBackoff, Throttled,
+    backoff_delay, parse_retry_after,
+)
+
 
 class Colors:
     """ANSI color codes"""
@@ -34,8 +59,753 @@ class Colors:
     NC = '\033[0m'
 
 
+USER_AGENT = 'Mozilla/5.0 (DisabilityWiki LinkValidator/1.0)'
+
+
+class HostThrottle:
+    """Per-host politeness for the async engine.
+
+    Caps how many requests one host has in flight and spaces request starts
+    at least ``min_interval`` seconds apart, so a page with forty links into
+    one government site queues behind itself instead of hammering it.
+
+    The cap adapts (AIMD): a 429/503 halves it and holds the host's next
+    start back by its Retry-After; successes grow it back up to ``per_host``.
+    """
+
+    def __init__(self, per_host, min_interval):
+        self.limit = AimdLimit(per_host)
+        self.in_flight = 0
+        self.ready = asyncio.Condition()
+        self.min_interval = min_interval
+        self.next_start = 0.0
+
+    async def acquire(self):
+        """Wait for one of this host's (current) concurrency slots"""
+        async with self.ready:
+            await self.ready.wait_for(lambda: self.in_flight < self.limit.allowed)
+            self.in_flight += 1
+
+    async def release(self, throttled=None, attempt=0):
+        """Give the slot back, adapting the cap to how the request went"""
+        async with self.ready:
+            self.in_flight -= 1
+            if throttled is None:
+                self.limit.on_success()
+            else:
+                self.limit.on_throttle()
+                resume = asyncio.get_running_loop().time() + \
+                    backoff_delay(throttled.retry_after, attempt)
+                self.next_start = max(self.next_start, resume)
+            self.ready.notify_all()
+
+    async def wait_turn(self):
+        """Sleep until this host's next start slot, then claim it"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class LinkRecord(Mapping):
+    """One markdown link, stored compactly
+
+    Slotted (no per-link __dict__) with the file path interned, so a corpus
+    of tens of thousands of links keeps one copy of each file name. It reads
+    like a read-only dict - link['url'], {**link}, dict(link) - so report
+    code and the JSON outputs see the same shape as before.
+    """
+
+    __slots__ = ('text', 'url', 'type', 'line', 'file')
+
+    def __init__(self, text, url, link_type, line, file):
+        self.text = text
+        self.url = url
+        self.type = link_type
+        self.line = line
+        self.file = sys.intern(file)
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['text'], d['url'], d['type'], d['line'], d['file'])
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return f"LinkRecord({dict(self)!r})"
+
+
+class FindingStream:
+    """Writes one JSON record per finding, as it is found (NDJSON)
+
+    Lets a consumer act on the first broken link seconds into a run rather
+    than after the whole report is assembled. Safe to call from the thread
+    engine's workers.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.f = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self.lock:
+            self.f.write(line + '\n')
+            self.f.flush()
+
+    def finding(self, kind, link, error):
+        self.write({'kind': kind, **link, 'error': error})
+
+    def close(self):
+        with self.lock:
+            self.f.close()
+
+
+# Where --journal checkpoints (and --resume looks) unless given a path
+JOURNAL_PATH = Path(__file__).parent / ".link_journal.ndjson"
+
+
+class RunJournal:
+    """Crash-safe checkpoint of a run's finished work (append-only NDJSON)
+
+    Every file scanned and every external verdict reached is appended as
+    one line and flushed, so a run killed halfway (OOM, a preempted CI
+    runner) loses at most the probes in flight. The file is fsynced every
+    ``sync_interval`` seconds. With ``resume``, the next run starts from it:
+    files whose size and mtime are unchanged keep their results (as long as
+    the set of pages is the same, since that decides internal links, and
+    the pages they link to a #fragment of are unchanged too, since that
+    decides the fragment) and URLs with a verdict are not probed again.
+    A torn last line is ignored.
+    The journal is removed once the run's report is saved.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, sync_interval=2.0):
+        self.path = Path(path)
+        self.root = None
+        self.sync_interval = sync_interval
+        self.lock = threading.Lock()
+        self.f = None
+        self.synced = 0.0
+        self.files = {}
+        self.verdicts = {}
+        self.redirects = {}
+        self.due = None
+        self.schedule = None
+
+    @staticmethod
+    def stamp(path):
+        st = path.stat()
+        return [st.st_mtime_ns, st.st_size]
+
+    def start(self, wiki_root, pages, resume=False):
+        """Open for this run; with ``resume``, first load what is there"""
+        header = {
+            'kind': 'run',
+            'version': self.VERSION,
+            'wiki_root': str(Path(wiki_root).resolve()),
+            'pages': hashlib.sha1('\n'.join(sorted(pages)).encode('utf-8')).hexdigest(),
+        }
+        self.root = Path(wiki_root)
+        if resume:
+            self._load(header)
+
+        # Rewrite compactly with what carries over, so a resumed run that is
+        # killed too still has it
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header) + '\n')
+            for key, (stamp, result, anchored) in self.files.items():
+                f.write(json.dumps({'kind': 'file', 'key': key, 'stamp': stamp,
+                                    'anchored': anchored, 'result': result},
+                                   default=dict) + '\n')
+            for url, result in self.verdicts.items():
+                f.write(json.dumps({'kind': 'verdict', 'url': url, 'result': list(result),
+                                    'redirect': self.redirects.get(url)}) + '\n')
+            if self.due is not None:
+                f.write(json.dumps({'kind': 'plan', 'due': sorted(self.due),
+                                    'schedule': self.schedule}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.f = open(self.path, 'a', encoding='utf-8')
+        self.synced = time.monotonic()
+
+    def _load(self, header):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                lines = f.read().split('\n')
+        except OSError:
+            print(f"{Colors.YELLOW}No journal at {self.path} - starting from scratch{Colors.NC}")
+            return
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break  # the write the crash interrupted
+        first = records[0] if records else {}
+        if (first.get('kind') != 'run' or first.get('version') != self.VERSION
+                or first.get('wiki_root') != header['wiki_root']):
+            print(f"{Colors.YELLOW}Journal {self.path} is for another run - "
+                  f"starting from scratch{Colors.NC}")
+            return
+        same_pages = first.get('pages') == header['pages']
+        for record in records[1:]:
+            if record['kind'] == 'file' and same_pages:
+                result = record['result']
+                for kind in ('internal_links', 'external_links'):
+                    result[kind] = [LinkRecord.from_dict(d) for d in result[kind]]
+                self.files[record['key']] = (record['stamp'], result,
+                                             record.get('anchored', {}))
+            elif record['kind'] == 'verdict':
+                self.verdicts[record['url']] = tuple(record['result'])
+                if record.get('redirect'):
+                    self.redirects[record['url']] = record['redirect']
+            elif record['kind'] == 'plan':
+                self.due, self.schedule = set(record['due']), record['schedule']
+        print(f"Resuming from {self.path.name}: {len(self.files)} file(s) and "
+              f"{len(self.verdicts)} URL verdict(s) already done"
+              + ("" if same_pages else " (pages added or removed: files re-read)"))
+
+    def resumed_file(self, key, path):
+        """This file's journaled result, if it and the pages it anchors into are unchanged"""
+        entry = self.files.get(key)
+        if not entry or entry[0] != self.stamp(path):
+            return None
+        for page, stamp in entry[2].items():
+            try:
+                if self.stamp(self.root / page) != stamp:
+                    return None
+            except OSError:
+                return None
+        return entry[1]
+
+    def file_done(self, key, path, result, anchored=()):
+        """Journal a file's result
+
+        ``anchored`` are the other pages whose headings its #fragment links
+        were checked against; a resumed run re-reads the file if one changed.
+        """
+        stamps = {}
+        for page in anchored:
+            try:
+                stamps[page] = self.stamp(self.root / page)
+            except OSError:
+                pass  # gone already: the page set changed, so nothing resumes
+        self._append({'kind': 'file', 'key': key, 'stamp': self.stamp(path),
+                      'anchored': stamps, 'result': result})
+
+    def verdict(self, url, result, redirect=None):
+        self._append({'kind': 'verdict', 'url': url, 'result': list(result),
+                      'redirect': redirect})
+
+    def planned(self, due, schedule):
+        """The rolling schedule's pick, so a resumed run keeps to it"""
+        self.due, self.schedule = set(due), schedule
+        self._append({'kind': 'plan', 'due': sorted(due), 'schedule': schedule})
+
+    def _append(self, record):
+        line = json.dumps(record, default=dict)
+        with self.lock:
+            if self.f is None:
+                return
+            self.f.write(line + '\n')
+            self.f.flush()
+            if time.monotonic() - self.synced >= self.sync_interval:
+                os.fsync(self.f.fileno())
+                self.synced = time.monotonic()
+
+    def close(self):
+        with self.lock:
+            if self.f is not None:
+                self.f.flush()
+                os.fsync(self.f.fileno())
+                self.f.close()
+                self.f = None
+
+    def finish(self):
+        """The run completed: nothing left to resume"""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class LinkIndexWriter:
+    """Writes the link index one file at a time, as the scan reaches it
+
+    Each file's results go straight to disk, so a scan need not hold every
+    file's links until the end; only the backlink sets are kept. The index
+    is written to a temporary file and moved into place by ``close()``, so a
+    run that dies halfway leaves the previous index intact.
+
+    ``backlinks`` maps each internal route to the files linking to it,
+    including routes that do not exist (yet), so adding a page also
+    re-checks the links that were broken for want of it.
+    ``anchor_backlinks`` is the subset linking to a #fragment of the
+    route: those are re-checked whenever the page itself is edited,
+    since an edit can rename the heading they point at.
+    """
+
+    def __init__(self, path, header):
+        self.path = Path(path)
+        self.tmp = self.path.with_name(self.path.name + '.tmp')
+        self.backlinks = {}
+        self.anchor_backlinks = {}
+        self.first = True
+        self.f = None
+        try:
+            self.f = open(self.tmp, 'w', encoding='utf-8')
+            self.f.write(json.dumps(header, separators=(',', ':'))[:-1] + ',"files":{')
+        except OSError as e:
+            self._failed(e)
+
+    def add(self, key, file_result):
+        for link in file_result['internal_links']:
+            if link['type'] == 'anchor':
+                continue  # same-page anchors: re-checked with the page
+            route = link_route(link, key)
+            self.backlinks.setdefault(route, set()).add(key)
+            if '#' in link['url']:
+                self.anchor_backlinks.setdefault(route, set()).add(key)
+        if self.f is None:
+            return
+        try:
+            self.f.write(('' if self.first else ',') + json.dumps(key) + ':'
+                         + json.dumps(file_result, separators=(',', ':'), default=dict))
+        except OSError as e:
+            self._failed(e)
+        self.first = False
+
+    def close(self):
+        if self.f is None:
+            return
+        tail = {
+            'backlinks': {route: sorted(files) for route, files in sorted(self.backlinks.items())},
+            'anchor_backlinks': {route: sorted(files)
+                                 for route, files in sorted(self.anchor_backlinks.items())},
+        }
+        try:
+            self.f.write('},' + json.dumps(tail, separators=(',', ':'))[1:])
+            self.f.close()
+            os.replace(self.tmp, self.path)
+        except OSError as e:
+            self._failed(e)
+        self.f = None
+
+    def _failed(self, e):
+        print(f"{Colors.RED}✗ Failed to save link index: {e}{Colors.NC}")
+        f, self.f = self.f, None
+        try:
+            if f is not None:
+                f.close()
+            self.tmp.unlink()
+        except OSError:
+            pass
+
+
+def route_key(path):
+    """Normalise a link target or file path to the route it serves
+
+    ``/rights/us/ada``, ``rights/us/ada.md`` and ``rights/us/ada/index.md``
+    all map to ``rights/us/ada``, so a link and the page it points at meet
+    on the same key in the backlink index. A ``#fragment`` is dropped.
+    """
+    key = unquote(path.split('#', 1)[0]).strip('/')
+    if key.endswith('.md'):
+        key = key[:-3]
+    if key == 'index':
+        return ''
+    if key.endswith('/index'):
+        key = key[:-len('/index')]
+    return key
+
+
+URL_SCHEME = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+
+
+def resolve_relative(url, page):
+    """Absolute wiki path for a relative link on a page, or None
+
+    ``../ssi``, ``medicaid.md`` and ``./index`` are resolved against the
+    directory of ``page`` (wiki-root-relative). Like a browser, ``..`` stops
+    at the root. Links with a scheme (``tel:``, ``ftp:``) are not paths and
+    give None. A ``#fragment`` is kept.
+    """
+    if URL_SCHEME.match(url):
+        return None
+    path, sep, fragment = url.partition('#')
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(page), path))
+    while resolved == '..' or resolved.startswith('../'):
+        resolved = resolved[3:]
+    if resolved in ('.', ''):
+        resolved = ''
+    return f"/{resolved}{sep}{fragment}"
+
+
+def link_route(link, page):
+    """Backlink-index route of an internal or relative link found on a page"""
+    if link['type'] == 'relative':
+        return route_key(resolve_relative(link['url'], page) or '')
+    return route_key(link['url'])
+
+
+class ExternalUrlCache:
+    """On-disk cache of external URL verdicts, keyed by URL (SQLite)
+
+    Each row keeps the verdict plus the ETag/Last-Modified the server sent,
+    so an expired healthy entry can be revalidated with a conditional
+    request instead of being probed from scratch, and the redirect chain,
+    so a URL that permanently redirects can be revalidated at its target. Failures expire sooner
+    than successes, and transient failures (timeouts, refused connections,
+    429/5xx) sooner still, so a flaky host is re-checked on the next run.
+    """
+
+    HOUR = 3600
+
+    def __init__(self, path, ttl_healthy=7 * 24 * HOUR, ttl_dead=24 * HOUR,
+                 ttl_transient=6 * HOUR):
+        self.path = Path(path)
+        self.ttl = {
+            'healthy': ttl_healthy,
+            'dead': ttl_dead,
+            'transient': ttl_transient,
+        }
+        self.lock = threading.Lock()
+        self.pending_writes = 0
+        self.db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS url_verdicts (
+                url TEXT PRIMARY KEY,
+                success INTEGER NOT NULL,
+                error TEXT,
+                status INTEGER,
+                checked_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                final_url TEXT,
+                redirects TEXT
+            )
+        """)
+        # Caches written before redirect capture lack the last two columns
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(url_verdicts)")}
+        for column in ('final_url', 'redirects'):
+            if column not in columns:
+                self.db.execute(f"ALTER TABLE url_verdicts ADD COLUMN {column} TEXT")
+        self.db.commit()
+
+    @staticmethod
+    def verdict_class(success, error):
+        """Bucket a verdict for TTL purposes: healthy, dead or transient"""
+        if success:
+            return 'healthy'
+        # A name that doesn't resolve today may tomorrow (lapsed registration,
+        # DNS outage on the checking machine)
+        if error in ('Timeout', 'Connection failed', 'Connection timed out',
+                     'DNS lookup failed'):
+            return 'transient'
+        if error and (error == 'HTTP 429' or error.startswith('HTTP 5')):
+            return 'transient'
+        return 'dead'
+
+    def get(self, url, now=None):
+        """Return the cached entry for a URL (with a 'fresh' flag), or None"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT success, error, status, checked_at, etag, last_modified, "
+                "final_url, redirects FROM url_verdicts WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        success, error, status, checked_at, etag, last_modified, final_url, redirects = row
+        age = (now or time.time()) - checked_at
+        return {
+            'success': bool(success),
+            'error': error,
+            'status': status,
+            'checked_at': checked_at,
+            'etag': etag,
+            'last_modified': last_modified,
+            'final_url': final_url,
+            'redirects': json.loads(redirects) if redirects else [],
+            'fresh': age < self.ttl[self.verdict_class(bool(success), error)],
+        }
+
+    def put(self, url, success, error, status=None, etag=None, last_modified=None,
+            now=None, final_url=None, redirects=None):
+        """Store a verdict; commits in small batches to keep writes cheap"""
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO url_verdicts "
+                "(url, success, error, status, checked_at, etag, last_modified, "
+                "final_url, redirects) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, int(bool(success)), error, status, now or time.time(),
+                 etag, last_modified, final_url,
+                 json.dumps(redirects) if redirects else None)
+            )
+            self.pending_writes += 1
+            if self.pending_writes >= 50:
+                self.db.commit()
+                self.pending_writes = 0
+
+    def close(self):
+        with self.lock:
+            self.db.commit()
+            self.db.close()
+
+
+PERMANENT_REDIRECTS = (301, 308)
+
+
+def redirect_entry(final_url, chain):
+    """Canonical-map entry for a URL that redirected through ``chain``
+
+    A chain is permanent only if every hop is (301/308); one temporary hop
+    means the source may point somewhere else tomorrow.
+    """
+    return {
+        'final_url': final_url,
+        'permanent': all(hop['status'] in PERMANENT_REDIRECTS for hop in chain),
+        'hops': len(chain),
+        'chain': chain,
+    }
+
+
+def url_host(url):
+    """Lower-cased hostname of a URL ('' if it has none)"""
+    return (urlparse(url).hostname or '').lower()
+
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters that only tag where a click came from. utm_* is matched
+# by prefix
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid'})
+
+UNRESERVED = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~')
+
+PERCENT_ESCAPE = re.compile(r'%[0-9A-Fa-f]{2}')
+
+
+def _normalise_escapes(text):
+    """%7e -> ~, %2f -> %2F: the same bytes on the wire either way"""
+    def fix(match):
+        char = chr(int(match.group()[1:], 16))
+        return char if char in UNRESERVED else match.group().upper()
+    return PERCENT_ESCAPE.sub(fix, text)
+
+
+def probe_key(url):
+    """The URL to actually probe for a link: equal keys, equal answers
+
+    Only rewrites that cannot change what a server sends back: the
+    #fragment (never sent), scheme and host case, a default port, an empty
+    path, percent-escape spelling, and click-tracking query parameters.
+    http vs https, a trailing slash and a www. prefix are left alone: each
+    can be a different page or a different server, and a redirect between
+    them is itself worth reporting.
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.username is not None or parts.password is not None or not parts.hostname:
+        return url.split('#', 1)[0]
+    scheme = parts.scheme.lower()
+    host = parts.hostname
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    netloc = host if port is None or port == DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    query = '&'.join(
+        pair for pair in parts.query.split('&')
+        if pair and not _is_tracking(pair.split('=', 1)[0])
+    ) if parts.query else ''
+    return urlunsplit((scheme, netloc, _normalise_escapes(parts.path) or '/',
+                       _normalise_escapes(query), ''))
+
+
+def _is_tracking(name):
+    name = unquote(name).lower()
+    return name.startswith('utm_') or name in TRACKING_PARAMS
+
+
+def shard_of(url, count):
+    """Shard (1..count) that checks a URL: a stable hash of its host
+
+    All of a host's URLs land on one shard, so per-host politeness limits
+    hold across runners. CRC32, unlike hash(), is the same on every machine.
+    """
+    return zlib.crc32(url_host(url).encode('utf-8')) % count + 1
+
+
+# Verdicts that mean "could not reach the host at all", as opposed to the
+# host answering with an error. These are what trip a host's circuit.
+HOST_FAILURES = ('Connection failed', 'Connection timed out', 'DNS lookup failed')
+
+
+class HostCircuitBreaker:
+    """Stops probing a host after repeated connection-level failures
+
+    A dead organisation's domain fails the same way for every deep link
+    into it, each after a full timeout. Once a host has failed ``threshold``
+    times in a row (or once, if its name does not exist), the circuit
+    opens and the host's remaining URLs get that same verdict unprobed.
+    A successful response resets the count.
+    """
+
+    def __init__(self, threshold=3):
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.tripped = {}
+        self.short_circuited = {}
+
+    def verdict(self, host):
+        """The verdict to reuse for this host, or None if the circuit is closed"""
+        with self.lock:
+            result = self.tripped.get(host)
+            if result is not None:
+                self.short_circuited[host] = self.short_circuited.get(host, 0) + 1
+            return result
+
+    def record(self, host, result):
+        if not self.threshold:
+            return
+        success, error = result
+        with self.lock:
+            if error not in HOST_FAILURES:
+                self.failures[host] = 0
+                return
+            self.failures[host] = self.failures.get(host, 0) + 1
+            if self.failures[host] >= self.threshold or error == 'DNS lookup failed':
+                self.tripped.setdefault(host, (False, error))
+
+
+class DnsCache:
+    """Resolves each hostname once per run
+
+    Used as a context manager around the external pass: it stands in for
+    socket.getaddrinfo, which is where requests/urllib3 resolve names, and
+    memoises answers per host. Of the failures only EAI_NONAME (the name
+    does not exist) is memoised; a temporary one (EAI_AGAIN, no resolver
+    reachable) is raised and the next lookup tries again. Lookups for the
+    same host on another port reuse the answer with the port swapped in.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.answers = {}
+        self.lookups = 0
+        self._getaddrinfo = socket.getaddrinfo
+
+    def __enter__(self):
+        self._installed_over = socket.getaddrinfo
+        socket.getaddrinfo = self.getaddrinfo
+        return self
+
+    def __exit__(self, *exc):
+        socket.getaddrinfo = self._installed_over
+        return False
+
+    def getaddrinfo(self, host, port, family=0, sock_type=0, proto=0, flags=0):
+        if isinstance(port, str) and port.isdigit():
+            port = int(port)
+        if not (port is None or isinstance(port, int)) or not isinstance(host, str):
+            return self._getaddrinfo(host, port, family, sock_type, proto, flags)
+
+        key = (host.lower(), family, sock_type, proto, flags)
+        with self.lock:
+            answer = self.answers.get(key)
+        if answer is None:
+            try:
+                answer = self._getaddrinfo(host, 0, family, sock_type, proto, flags)
+            except socket.gaierror as e:
+                answer = e
+            with self.lock:
+                self.lookups += 1
+                if not isinstance(answer, socket.gaierror) or answer.errno == socket.EAI_NONAME:
+                    self.answers.setdefault(key, answer)
+
+        if isinstance(answer, socket.gaierror):
+            raise answer
+        return [
+            (fam, typ, pro, name, (sockaddr[0], port or 0, *sockaddr[2:]))
+            for fam, typ, pro, name, sockaddr in answer
+        ]
+
+    def resolves(self, host):
+        """False only if the hostname definitely does not exist (memoised)
+
+        Any other resolver failure is not an answer about the host, so it
+        counts as resolving and the probe itself decides.
+        """
+        try:
+            self.getaddrinfo(host, None, 0, socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            return e.errno != socket.EAI_NONAME
+        return True
+
+
+class SessionPool:
+    """Keep-alive HTTP sessions, one per host
+
+    The module-level requests.head/get open a fresh TCP+TLS connection for
+    every probe. A Session per host keeps up to ``maxsize`` connections to
+    that host open for reuse, so the second and later URLs on a host skip
+    the handshake. Sessions are created on first use.
+    """
+
+    def __init__(self, maxsize=2):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.sessions = {}
+
+    def get(self, host):
+        with self.lock:
+            session = self.sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.maxsize
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers['User-Agent'] = USER_AGENT
+                self.sessions[host] = session
+            return session
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
 class LinkValidator:
-    def __init__(self, wiki_root=None):
+    def __init__(self, wiki_root=None, engine='threads', concurrency=20, per_host=2,
+                 host_delay=0.5, url_cache=None, index_path=None, stream=None, jobs=1,
+                 breaker_threshold=3, schedule_days=0, shard=None, journal=None,
+                 resume=False):
         if wiki_root is None:
             wiki_root = Path(__file__).parent / "disability-wiki"
         else:
@@ -56,6 +826,75 @@ class LinkValidator:
         # Cache for external URL checks (avoid duplicate requests)
         self.external_url_cache = {}
 
+        # Optional on-disk verdict cache shared across runs (ExternalUrlCache)
+        self.url_cache = url_cache
+
+        # Optional persisted per-file results + backlink index, used to
+        # rescan only what changed since a git ref
+        self.index_path = Path(index_path) if index_path else None
+
+        # Optional NDJSON output, written as findings are produced
+        # (FindingStream), and the occurrences of each URL being checked.
+        # With a stream, findings are only counted here, not kept in results
+        self.stream = stream
+        self.streamed = {'broken_internal': 0, 'broken_external': 0}
+        self._occurrences = {}
+
+        # Worker processes for reading and internal validation (1 = serial)
+        self.jobs = jobs
+
+        # Optional in-memory set of every file under wiki_root (posix paths
+        # relative to it) and the route manifest built from it; when set,
+        # internal and relative links are dict lookups instead of stat()ing
+        # candidates. Scans build them once (use_pages); watch mode keeps
+        # them current. Redirects the site declares count as routes
+        self.pages = None
+        self.routes = None
+        self.redirect_rules = read_redirects(self.wiki_root / REDIRECTS_FILE)
+
+        # Likely intended pages for links to missing ones (RepairIndex),
+        # built from the route manifest on the first such link
+        self.repairs = None
+
+        # Per-host circuit breaker and per-run resolver cache for external checks
+        self.breaker = HostCircuitBreaker(breaker_threshold)
+        self.dns = DnsCache()
+
+        # Rolling schedule: spread external probes over this many nights
+        # (0 = probe everything that isn't fresh in the cache every run)
+        self.schedule_days = schedule_days
+
+        # (i, N): check only the external URLs whose host hashes to shard i
+        # of N (see shard_of); merge_shard_reports() combines the N reports
+        self.shard = shard
+
+        # Optional checkpoint of finished files and verdicts (RunJournal);
+        # with resume, work already in it is not done again
+        self.journal = journal
+        self.resume = resume
+
+        # Redirect chains seen this run: source URL -> redirect_entry()
+        self.redirects = {}
+
+        # Probes answered 429/503 and re-queued instead of reported
+        self.requeued = 0
+
+        # Keep-alive sessions per host, sized to how many requests one host
+        # can have in flight
+        self.sessions = SessionPool(maxsize=per_host)
+
+        # External checking engine ('threads' or 'async'). Limits: total
+        # requests in flight (async; threads has a pool of 10), requests in
+        # flight per host, and minimum seconds between request starts on one
+        # host
+        self.engine = engine
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.host_delay = host_delay
+
+        # Anchor ids of each page, read once per page on first lookup
+        self.headings = HeadingIndex(self.wiki_root)
+
         # Pattern for markdown links: [text](url)
         self.link_pattern = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
 
@@ -65,17 +904,51 @@ class LinkValidator:
         print(f"Found {len(md_files)} markdown files")
         return md_files
 
+    def build_page_index(self):
+        """Every file under the wiki root, as posix paths relative to it"""
+        pages = set()
+        for dirpath, dirnames, filenames in os.walk(self.wiki_root):
+            dirnames[:] = [d for d in dirnames if d not in ('.git', 'node_modules')]
+            rel_dir = Path(dirpath).relative_to(self.wiki_root).as_posix()
+            pages.update(name if rel_dir == '.' else f"{rel_dir}/{name}" for name in filenames)
+        return pages
+
+    def use_pages(self, pages):
+        """Resolve links against this file set from now on"""
+        self.pages = pages
+        self.routes = RouteManifest(pages, self.redirect_rules)
+        self.repairs = None
+
+    def suggest_repairs(self, broken, page):
+        """``broken`` links of one page, with a ``repairs`` list added to
+        each link to a missing page: [(route, score, reason)], best first"""
+        annotated = []
+        for link in broken:
+            if link['error'].startswith('No file found'):
+                if self.repairs is None:
+                    self.repairs = RepairIndex.build(self.wiki_root, self.routes)
+                link = {**link, 'repairs': self.repairs.suggest(link_route(link, page),
+                                                                link['text'])}
+            annotated.append(link)
+        return annotated
+
     def extract_links(self, file_path):
         """Extract all links from a markdown file"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
+            # One (interned) path string shared by every link in the file
+            rel_file = str(file_path.relative_to(self.wiki_root.parent))
+
             links = []
+            line_num, counted_to = 1, 0
             for match in self.link_pattern.finditer(content):
                 text = match.group(1)
                 url = match.group(2)
-                line_num = content[:match.start()].count('\n') + 1
+                # Count newlines only since the previous match, not from the top
+                line_num += content.count('\n', counted_to, match.start())
+                counted_to = match.start()
 
                 # Categorize link
                 if url.startswith('http://') or url.startswith('https://'):
@@ -89,13 +962,7 @@ class LinkValidator:
                 else:
                     link_type = 'relative'
 
-                links.append({
-                    'text': text,
-                    'url': url,
-                    'type': link_type,
-                    'line': line_num,
-                    'file': str(file_path.relative_to(self.wiki_root.parent))
-                })
+                links.append(LinkRecord(text, url, link_type, line_num, rel_file))
 
             return links
 
@@ -108,29 +975,46 @@ class LinkValidator:
         # Wiki.js uses paths like /employment/job-searching
         # These correspond to files in the disability-wiki directory
 
-        # Remove leading slash and decode URL encoding
+        # Remove leading slash and decode URL encoding; a #fragment must
+        # also be a heading on the target page
+        url, fragment = split_fragment(url)
         path = unquote(url.lstrip('/'))
 
-        # Try multiple possible file locations
-        possible_paths = [
-            self.wiki_root / f"{path}.md",
-            self.wiki_root / path / "index.md",
-            self.wiki_root / f"{path}/index.md",
-        ]
-
-        # Also check if path already ends in .md
-        if not path.endswith('.md'):
-            possible_paths.insert(0, self.wiki_root / path)
+        if self.routes is not None:
+            # Page routes from the manifest; anything else (an image, a PDF)
+            # must be a file exactly as written
+            page = self.routes.resolve(path)
+            if page is None and posixpath.normpath(path) in self.pages:
+                page = posixpath.normpath(path)
+            if page is not None:
+                return self.validate_anchor(page, fragment)
+            return False, f"No file found at {path}"
+
+        # No page index (a single file checked on its own): try the possible
+        # file locations; the path as written comes first so that
+        # `medicaid.md` finds medicaid.md, not medicaid.md.md
+        possible_paths = [path, f"{path}.md", f"{path}/index.md"]
 
         for candidate in possible_paths:
-            if candidate.exists() and candidate.is_file():
-                return True, None
+            if (self.wiki_root / candidate).is_file():
+                return self.validate_anchor(posixpath.normpath(candidate), fragment)
 
         # Link not found
         return False, f"No file found at {path}"
 
-    def validate_external_link(self, url, timeout=10):
-        """Check if an external URL is accessible"""
+    def validate_anchor(self, page, fragment):
+        """Check that a page (wiki-root-relative) renders a #fragment id"""
+        if not fragment or self.headings.has_anchor(page, fragment):
+            return True, None
+        return False, f"No heading '#{fragment}' in {page}"
+
+    def validate_external_link(self, url, timeout=10, attempt=0):
+        """Check if an external URL is accessible
+
+        A 429/503 before the last attempt raises Throttled: the caller
+        re-queues the URL behind the host's backoff rather than a worker
+        waiting it out.
+        """
         if not REQUESTS_AVAILABLE:
             return None, "requests module not installed"
 
@@ -138,48 +1022,125 @@ class LinkValidator:
         if url in self.external_url_cache:
             return self.external_url_cache[url]
 
+        result = (self.breaker.verdict(url_host(url))
+                  or self._check_url(url, timeout, final=attempt + 1 >= MAX_ATTEMPTS))
+        self._settle(url, result)
+        return result
+
+    def _check_url(self, url, timeout=10, final=True):
+        """Probe one URL, revalidating against the on-disk cache if there is one
+
+        With ``final=False`` a 429/503 raises Throttled (nothing cached or
+        recorded) so the caller can re-queue the URL; on the last attempt,
+        or if the host asks for a longer wait than MAX_RETRY_AFTER, it is
+        the verdict.
+        """
+        host = url_host(url)
+        tripped = self.breaker.verdict(host)
+        if tripped:
+            return tripped
+
+        cached = self.url_cache.get(url) if self.url_cache else None
+
+        # Only a healthy entry is worth revalidating; a 404 page's ETag says
+        # nothing about whether the URL has come back
+        conditional = {}
+        known_chain = []
+        probe_url = url
+        if cached and cached['success']:
+            if cached['etag']:
+                conditional['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                conditional['If-Modified-Since'] = cached['last_modified']
+            # Hops that were all permanent last time need not be walked again;
+            # the validators above came from the final URL anyway
+            if cached['final_url'] and redirect_entry(None, cached['redirects'])['permanent']:
+                probe_url = cached['final_url']
+                known_chain = cached['redirects']
+
+        # Behind a proxy the proxy resolves the name, not this machine
+        if host and not self._proxied(probe_url) and not self.dns.resolves(host):
+            success, error, meta = False, 'DNS lookup failed', {}
+        else:
+            success, error, meta = self._probe_external(probe_url, timeout, conditional)
+        if (not final and meta.get('status') in THROTTLE_STATUSES
+                and (meta.get('retry_after') or 0) <= MAX_RETRY_AFTER):
+            raise Throttled(meta['status'], meta.get('retry_after'))
+        self.breaker.record(host, (success, error))
+
+        chain = known_chain + meta.get('redirects', [])
+        final_url = meta.get('final_url', probe_url) if chain else None
+        if chain:
+            self.redirects[url] = redirect_entry(final_url, chain)
+
+        if self.url_cache:
+            etag, last_modified = meta.get('etag'), meta.get('last_modified')
+            if meta.get('status') == 304:
+                # Unchanged since last check: keep the validators we sent
+                etag = etag or cached['etag']
+                last_modified = last_modified or cached['last_modified']
+            self.url_cache.put(url, success, error, meta.get('status'), etag, last_modified,
+                               final_url=final_url, redirects=chain)
+
+        return success, error
+
+    @staticmethod
+    def _proxied(url):
+        """True if requests would send this URL through a proxy (the
+        *_PROXY environment variables, honouring NO_PROXY)"""
+        return REQUESTS_AVAILABLE and bool(requests.utils.get_environ_proxies(url))
+
+    def _probe_external(self, url, timeout=10, extra_headers=None):
+        """Make the HTTP request(s) for one URL; no caching, no rate limiting
+
+        Returns (success, error, meta) where meta carries the final status
+        and the ETag/Last-Modified validators, if the server sent any.
+        """
+        session = self.sessions.get(url_host(url))
+        headers = dict(extra_headers or {})
         try:
-            # Use HEAD request for efficiency
-            response = requests.head(
-                url,
-                timeout=timeout,
-                allow_redirects=True,
-                headers={'User-Agent': 'Mozilla/5.0 (DisabilityWiki LinkValidator/1.0)'}
-            )
-
-            # Some servers don't support HEAD, try GET
-            if response.status_code in [405, 501]:
-                response = requests.get(
-                    url,
-                    timeout=timeout,
-                    allow_redirects=True,
-                    headers={'User-Agent': 'Mozilla/5.0 (DisabilityWiki LinkValidator/1.0)'},
-                    stream=True  # Don't download full content
-                )
-
-            success = response.status_code < 400
-            error = None if success else f"HTTP {response.status_code}"
-
-            # Cache result
-            self.external_url_cache[url] = (success, error)
-
-            # Rate limiting - be nice to servers
-            time.sleep(0.5)
-
-            return success, error
-
+            # Use HEAD request for efficiency; closing the response hands the
+            # connection back to the host's keep-alive pool
+            with session.head(url, timeout=timeout, allow_redirects=True,
+                              headers=headers) as response:
+                status = response.status_code
+                response_headers = response.headers
+                final = response
+
+            # Some servers don't support HEAD, try GET for the first byte only
+            if status in [405, 501]:
+                with session.get(url, timeout=timeout, allow_redirects=True,
+                                 headers={**headers, 'Range': 'bytes=0-0'},
+                                 stream=True) as response:
+                    status = response.status_code
+                    response_headers = response.headers
+                    final = response
+
+            # 416: the server honoured Range but the body is empty - it exists
+            success = status < 400 or status == 416
+            error = None if success else f"HTTP {status}"
+            meta = {
+                'status': status,
+                'etag': response_headers.get('ETag'),
+                'last_modified': response_headers.get('Last-Modified'),
+            }
+            if status in THROTTLE_STATUSES:
+                meta['retry_after'] = parse_retry_after(response_headers.get('Retry-After'))
+            if final.history:
+                meta['redirects'] = [
+                    {'url': hop.url, 'status': hop.status_code} for hop in final.history
+                ]
+                meta['final_url'] = final.url
+            return success, error, meta
+
+        except requests.ConnectTimeout:
+            return False, "Connection timed out", {}
         except requests.Timeout:
-            result = (False, "Timeout")
-            self.external_url_cache[url] = result
-            return result
+            return False, "Timeout", {}
         except requests.ConnectionError:
-            result = (False, "Connection failed")
-            self.external_url_cache[url] = result
-            return result
+            return False, "Connection failed", {}
         except Exception as e:
-            result = (False, str(e))
-            self.external_url_cache[url] = result
-            return result
+            return False, str(e), {}
 
     def validate_links_in_file(self, file_path):
         """Validate all links in a single file"""
@@ -203,7 +1164,31 @@ class LinkValidator:
                         **link,
                         'error': error
                     })
-                    self.results['broken_internal_links'].append({
+
+            elif link['type'] == 'anchor':
+                # Same-page section link: checked against this file's headings
+                page = file_path.relative_to(self.wiki_root).as_posix()
+                valid, error = self.validate_anchor(page, split_fragment(link['url'])[1])
+                results['internal_links'].append(link)
+
+                if not valid:
+                    results['broken_internal'].append({
+                        **link,
+                        'error': error
+                    })
+
+            elif link['type'] == 'relative':
+                # ../ssi, medicaid.md, ./index: resolved against this file's
+                # directory, then checked exactly like an absolute link
+                page = file_path.relative_to(self.wiki_root).as_posix()
+                target = resolve_relative(link['url'], page)
+                if target is None:
+                    continue  # tel:, ftp: and other non-path schemes
+                valid, error = self.validate_internal_link(target, file_path)
+                results['internal_links'].append(link)
+
+                if not valid:
+                    results['broken_internal'].append({
                         **link,
                         'error': error
                     })
@@ -214,85 +1199,659 @@ class LinkValidator:
 
         return results
 
-    def scan_all_files(self):
-        """Scan all markdown files for links"""
+    def scan_all_files(self, since=None):
+        """Scan all markdown files for links
+
+        With ``since`` (a git ref) and a link index from an earlier run, only
+        files changed since that ref - plus every file linking to a page that
+        was added, deleted or renamed - are re-read; everything else is taken
+        from the index. The report is the same as a full scan's.
+
+        Returns every file's results, except with a stream: then findings
+        go only to the stream and are merely counted, no file's links are
+        kept past its turn, and an empty list is returned.
+        """
         print("\n" + "=" * 80)
         print("DISABILITY WIKI - LINK VALIDATOR")
         print("=" * 80)
 
         md_files = self.find_markdown_files()
         self.results['files_scanned'] = len(md_files)
+        # One directory walk up front; link targets are then set lookups
+        self.use_pages(self.build_page_index())
 
-        print(f"\nScanning {len(md_files)} files for links...")
+        index = self.load_link_index() if since else None
+        rescan = self._files_to_rescan(index, since) if index else None
+        if rescan is None:
+            print(f"\nScanning {len(md_files)} files for links...")
+        else:
+            print(f"\nIncremental scan since {since}: "
+                  f"re-reading {len(rescan)} changed or affected file(s)...")
 
-        all_internal_links = []
+        internal_links = 0
         all_external_links = []
         file_results = []
+        links_by_section = {}
 
-        # Scan all files
-        for i, md_file in enumerate(md_files, 1):
+        index_keys = [f.relative_to(self.wiki_root).as_posix() for f in md_files]
+        reuse = {
+            key for key in index_keys
+            if rescan is not None and key not in rescan and key in index['files']
+        }
+        resumed = {}
+        if self.journal:
+            self.journal.start(self.wiki_root, self.pages, resume=self.resume)
+            for f, key in zip(md_files, index_keys):
+                result = self.journal.resumed_file(key, f) if key not in reuse else None
+                if result is not None:
+                    resumed[key] = result
+        index_out = self.open_link_index() if self.index_path else None
+        fresh = self._read_files([f for f, key in zip(md_files, index_keys)
+                                  if key not in reuse and key not in resumed])
+
+        # Scan all files, merging reused and freshly read results in file order
+        for i, key in enumerate(index_keys, 1):
             if i % 50 == 0 or i == len(md_files):
                 print(f"  Processed {i}/{len(md_files)} files...", end='\r')
 
-            file_result = self.validate_links_in_file(md_file)
-            file_results.append(file_result)
-
-            all_internal_links.extend(file_result['internal_links'])
+            if key in reuse:
+                file_result = index['files'][key]
+            elif key in resumed:
+                file_result = resumed[key]
+            else:
+                file_result = next(fresh)
+                if self.journal:
+                    self.journal.file_done(key, md_files[i - 1], file_result,
+                                           self._anchored_pages(key, file_result))
+            if index_out:
+                index_out.add(key, file_result)
+
+            broken_internal = self.suggest_repairs(file_result['broken_internal'], key)
+            if self.stream:
+                for broken in broken_internal:
+                    self.stream.write({'kind': 'broken_internal', **broken})
+                self.streamed['broken_internal'] += len(broken_internal)
+            else:
+                file_results.append(file_result)
+                self.results['broken_internal_links'].extend(broken_internal)
+
+            internal_links += len(file_result['internal_links'])
             all_external_links.extend(file_result['external_links'])
+            section = section_of(key)
+            links_by_section[section] = (links_by_section.get(section, 0)
+                                         + len(file_result['internal_links'])
+                                         + len(file_result['external_links']))
 
         print(f"  Processed {len(md_files)}/{len(md_files)} files... Done!")
 
-        self.results['internal_links_checked'] = len(all_internal_links)
+        if index_out:
+            index_out.close()
+
+        self.results['internal_links_checked'] = internal_links
         self.results['external_links_checked'] = len(all_external_links)
+        self.results['links_by_section'] = links_by_section
 
         print(f"\n{Colors.CYAN}Links Found:{Colors.NC}")
-        print(f"  Internal: {len(all_internal_links)}")
+        print(f"  Internal: {internal_links}")
         print(f"  External: {len(all_external_links)}")
 
-        # Validate external links (batch with threading)
+        if self.shard:
+            # Totals above describe the whole tree, as in every shard's
+            # report; only this shard's hosts are probed
+            index_, count = self.shard
+            all_external_links = [link for link in all_external_links
+                                  if shard_of(link['url'], count) == index_]
+            self.results['shard'] = {
+                'index': index_,
+                'count': count,
+                'commit': (self._git('rev-parse', 'HEAD') or '').strip() or None,
+                'external_links': len(all_external_links),
+            }
+            print(f"  Shard {index_}/{count}: {len(all_external_links)} external link(s) "
+                  f"on this shard's hosts")
+
+        # Validate external links (batch with threading or asyncio)
         if all_external_links and REQUESTS_AVAILABLE:
             print(f"\n{Colors.CYAN}Validating external links...{Colors.NC}")
-            self.validate_external_links_batch(all_external_links)
+            if self.engine == 'async':
+                self.validate_external_links_async(all_external_links)
+            else:
+                self.validate_external_links_batch(all_external_links)
+
+        if self.shard:
+            # Per-URL verdicts travel with the shard so the merged run can
+            # still record them (findings history)
+            self.results['shard']['verdicts'] = {
+                url: list(self.external_url_cache[url])
+                for url in sorted({link['url'] for link in all_external_links})
+                if url in self.external_url_cache
+            }
 
         return file_results
 
+    def _anchored_pages(self, key, file_result):
+        """Other pages whose headings this file's #fragment links depend on"""
+        pages = set()
+        for link in file_result['internal_links']:
+            if link['type'] == 'anchor' or '#' not in link['url']:
+                continue
+            page = self.routes.resolve(link_route(link, key))
+            if page is not None and page != key:
+                pages.add(page)
+        return sorted(pages)
+
+    def _read_files(self, md_files):
+        """Yield validate_links_in_file() results, in order, for these files
+
+        With jobs > 1 the files are spread over a process pool. map() hands
+        results back in submission order, so the report is identical to a
+        serial run whatever order the workers finish in.
+        """
+        if self.jobs <= 1 or len(md_files) < 2:
+            for md_file in md_files:
+                yield self.validate_links_in_file(md_file)
+            return
+
+        chunksize = max(1, len(md_files) // (self.jobs * 8))
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_scan_worker,
+            initargs=(str(self.wiki_root), self.pages)
+        ) as pool:
+            yield from pool.map(_scan_file_in_worker, md_files, chunksize=chunksize)
+
+    def _git(self, *args):
+        """Run a git command in the wiki root; stdout, or None on failure"""
+        try:
+            proc = subprocess.run(
+                ['git', '-c', 'core.quotePath=false', *args], cwd=self.wiki_root,
+                capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return proc.stdout
+
+    def load_link_index(self):
+        """Load the persisted link index, or None if missing or unreadable"""
+        if not self.index_path or not self.index_path.exists():
+            print(f"{Colors.YELLOW}No link index yet - running a full scan{Colors.NC}")
+            return None
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.YELLOW}Unreadable link index ({e}) - running a full scan{Colors.NC}")
+            return None
+        if index.get('version') != 2 or index.get('wiki_root') != str(self.wiki_root.resolve()):
+            print(f"{Colors.YELLOW}Link index is for another tree - running a full scan{Colors.NC}")
+            return None
+        for file_result in index['files'].values():
+            for kind in ('internal_links', 'external_links'):
+                file_result[kind] = [LinkRecord.from_dict(d) for d in file_result[kind]]
+        return index
+
+    def open_link_index(self):
+        """A LinkIndexWriter for this run's per-file results (see there)"""
+        status = self._git('status', '--porcelain', '--untracked-files=all', '--', '.')
+        return LinkIndexWriter(self.index_path, {
+            'version': 2,
+            'wiki_root': str(self.wiki_root.resolve()),
+            'commit': (self._git('rev-parse', 'HEAD') or '').strip() or None,
+            # Uncommitted paths are re-read next time: the index holds their
+            # working-tree state, which a diff against the commit can't see
+            'dirty': self._git_paths(status, porcelain=True) if status else [],
+        })
+
+    def _git_paths(self, output, porcelain=False):
+        """Wiki-root-relative paths from `git status --porcelain` output"""
+        prefix = (self._git('rev-parse', '--show-prefix') or '').strip()
+        paths = []
+        for line in output.splitlines():
+            path = line[3:] if porcelain else line
+            if ' -> ' in path:
+                path = path.split(' -> ', 1)[1]
+            path = path.strip('"')
+            if path.startswith(prefix):
+                paths.append(path[len(prefix):])
+        return paths
+
+    def _files_to_rescan(self, index, since):
+        """Files to re-read since a git ref, or None to fall back to a full scan"""
+        base = self._git('rev-parse', '--verify', f'{since}^{{commit}}')
+        if base is None:
+            print(f"{Colors.YELLOW}Cannot resolve git ref {since!r} - running a full scan{Colors.NC}")
+            return None
+        base = base.strip()
+        if index.get('commit') and index['commit'] != base:
+            # The index describes its own commit; diffing from anywhere else
+            # would miss changes in between
+            print(f"{Colors.YELLOW}Link index was built at {index['commit'][:10]}, "
+                  f"not {since}; diffing from the index commit{Colors.NC}")
+            base = index['commit']
+
+        diff = self._git('diff', '--name-status', '-M', '--relative', base, '--', '.')
+        untracked = self._git('ls-files', '--others', '--exclude-standard', '--', '.')
+        if diff is None or untracked is None:
+            print(f"{Colors.YELLOW}git diff failed - running a full scan{Colors.NC}")
+            return None
+
+        rescan = set(index.get('dirty', []))
+        moved_routes = set()
+        edited_routes = {route_key(path) for path in rescan}
+        for line in diff.splitlines():
+            status, *paths = line.split('\t')
+            if status[0] in 'AM':
+                rescan.add(paths[-1])
+                edited_routes.add(route_key(paths[-1]))
+            if status[0] in 'ADRC':
+                # A page appeared or disappeared: every link to it may flip
+                moved_routes.update(route_key(p) for p in paths)
+            if status[0] in 'RC':
+                rescan.add(paths[1])
+        for path in untracked.splitlines():
+            rescan.add(path)
+            moved_routes.add(route_key(path))
+
+        backlinks = index.get('backlinks', {})
+        for route in moved_routes:
+            rescan.update(backlinks.get(route, []))
+        # An edited page may have renamed a heading that deep links point at
+        anchor_backlinks = index.get('anchor_backlinks', {})
+        for route in edited_routes:
+            rescan.update(anchor_backlinks.get(route, []))
+
+        return {path for path in rescan if path.endswith('.md')}
+
     def validate_external_links_batch(self, external_links):
         """Validate external links in parallel"""
-        # Get unique URLs
-        unique_urls = list(set(link['url'] for link in external_links))
+        # One probe per probe key, however many spellings of it are linked
+        unique_urls = self._probe_keys(external_links)
 
         print(f"  Checking {len(unique_urls)} unique external URLs...")
+        self._index_occurrences(external_links)
+        pending = self._plan_external(unique_urls, external_links)
+
+        # Use thread pool for parallel requests. The dispatcher hands a URL to
+        # a worker only when its host has a free slot (AimdLimit, up to
+        # per_host: halved by a 429/503, grown back by successes) and its
+        # next start is due (host_delay apart, or the host's backoff). A
+        # throttled URL goes back in the queue; workers never wait one out,
+        # so other hosts' URLs carry on meanwhile
+        queue = deque((url, 0) for url in pending)
+        backoff = HostBackoff()
+        limits = {}
+        busy = {}
+        in_flight = {}
+        completed = 0
+        with self.dns, ThreadPoolExecutor(max_workers=10) as executor:
+            while queue or in_flight:
+                now = time.monotonic()
+                parked = deque()
+                while queue:
+                    url, attempt = queue.popleft()
+                    host = url_host(url)
+                    if host in self.breaker.tripped:
+                        # An open circuit answers without a request: no slot, no wait
+                        self.validate_external_link(url, attempt=attempt)
+                        completed += 1
+                        continue
+                    limit = limits.get(host)
+                    if limit is None:
+                        limit = limits[host] = AimdLimit(self.per_host)
+                    if backoff.ready_at(host) > now or busy.get(host, 0) >= limit.allowed:
+                        parked.append((url, attempt))
+                        continue
+                    busy[host] = busy.get(host, 0) + 1
+                    backoff.spaced(host, self.host_delay, now)
+                    future = executor.submit(self.validate_external_link, url, attempt=attempt)
+                    in_flight[future] = (url, attempt)
+                queue = parked
+
+                # Sleep until a parked host's start is due; a URL waiting for
+                # a slot wakes the loop when a probe of its host finishes
+                wake = min((backoff.ready_at(url_host(url)) - now for url, _ in queue
+                            if backoff.ready_at(url_host(url)) > now), default=None)
+                if not in_flight:
+                    time.sleep(wake)
+                    continue
+                done, _ = wait(in_flight, timeout=wake, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, attempt = in_flight.pop(future)
+                    host = url_host(url)
+                    busy[host] -= 1
+                    try:
+                        future.result()
+                    except Throttled as e:
+                        self.requeued += 1
+                        limits[host].on_throttle()
+                        backoff.throttled(host, e.retry_after, attempt)
+                        queue.append((url, attempt + 1))
+                        continue
+                    limits[host].on_success()
+                    completed += 1
+                    if completed % 10 == 0 or completed == len(pending):
+                        print(f"    Checked {completed}/{len(pending)} URLs...", end='\r')
+
+        self.sessions.close()
+        print(f"    Checked {len(unique_urls)}/{len(unique_urls)} URLs... Done!")
+        self._report_short_circuits()
+        self._report_requeues()
 
-        # Use thread pool for parallel requests
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_url = {
-                executor.submit(self.validate_external_link, url): url
-                for url in unique_urls
-            }
+        self._record_external_results(external_links)
 
-            completed = 0
-            for future in as_completed(future_to_url):
-                completed += 1
-                if completed % 10 == 0 or completed == len(unique_urls):
-                    print(f"    Checked {completed}/{len(unique_urls)} URLs...", end='\r')
+    def validate_external_links_async(self, external_links):
+        """Validate external links with asyncio and per-host politeness
+
+        Unlike the thread pool, there is no fixed sleep after each request:
+        a global semaphore bounds total requests in flight, and each host gets
+        its own concurrency cap and start spacing (see HostThrottle). Slow
+        hosts only hold up their own queue, so total run time tracks the
+        slowest host rather than the number of URLs.
+        """
+        unique_urls = self._probe_keys(external_links)
+
+        print(f"  Checking {len(unique_urls)} unique external URLs "
+              f"(async, {self.concurrency} total / {self.per_host} per host)...")
+        self._index_occurrences(external_links)
+        pending = self._plan_external(unique_urls, external_links)
+
+        if pending:
+            with self.dns:
+                asyncio.run(self._check_urls_async(pending))
+            self.sessions.close()
 
         print(f"    Checked {len(unique_urls)}/{len(unique_urls)} URLs... Done!")
+        self._report_short_circuits()
+        self._report_requeues()
+
+        self._record_external_results(external_links)
+
+    async def _check_urls_async(self, urls, timeout=10):
+        """Probe URLs concurrently, caching each result as it completes"""
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(self.concurrency)
+        throttles = {}
+        completed = 0
+
+        # requests is blocking, so probes run on worker threads; asyncio only
+        # decides when each one is allowed to start
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+
+            async def check(url):
+                nonlocal completed
+                host = url_host(url)
+                throttle = throttles.get(host)
+                if throttle is None:
+                    throttle = throttles[host] = HostThrottle(self.per_host, self.host_delay)
+
+                # A host whose circuit is open gets no request (and no wait).
+                # A 429/503 re-queues the URL behind the host's backoff, up
+                # to MAX_ATTEMPTS; meanwhile other hosts' URLs carry on
+                result = self.breaker.verdict(host)
+                attempt = 0
+                while result is None:
+                    final = attempt + 1 >= MAX_ATTEMPTS
+                    await throttle.acquire()
+                    throttled = None
+                    try:
+                        await throttle.wait_turn()
+                        async with limit:
+                            result = await loop.run_in_executor(
+                                executor, self._check_url, url, timeout, final
+                            )
+                    except Throttled as e:
+                        throttled = e
+                        self.requeued += 1
+                    finally:
+                        await throttle.release(throttled, attempt)
+                    attempt += 1
+
+                self._settle(url, result)
+                completed += 1
+                if completed % 10 == 0 or completed == len(urls):
+                    print(f"    Checked {completed}/{len(urls)} URLs...", end='\r')
+
+            await asyncio.gather(*(check(url) for url in urls))
+
+    def _probe_keys(self, external_links):
+        """Unique probe keys of these links, in first-seen order"""
+        keys = {link['url']: probe_key(link['url']) for link in external_links}
+        unique = list(dict.fromkeys(keys.values()))
+        if len(unique) < len(keys):
+            print(f"  {len(keys)} distinct URLs canonicalise to {len(unique)} probes")
+        return unique
+
+    def _report_short_circuits(self):
+        """Note hosts whose circuit opened, in the console and the JSON report"""
+        skipped = self.breaker.short_circuited
+        if not skipped:
+            return
+        self.results['short_circuited_hosts'] = {
+            host: {'error': self.breaker.tripped[host][1], 'urls_skipped': count}
+            for host, count in sorted(skipped.items())
+        }
+        print(f"    {Colors.YELLOW}{len(skipped)} unreachable host(s); "
+              f"{sum(skipped.values())} URL(s) given the host's verdict unprobed{Colors.NC}")
+
+    def _report_requeues(self):
+        """Note probes that hit 429/503 and were retried, rather than reported"""
+        if not self.requeued:
+            return
+        self.results['requeued_after_throttle'] = self.requeued
+        print(f"    {self.requeued} probe(s) answered 429/503 and were re-queued "
+              f"behind the host's Retry-After")
+
+    def _settle(self, url, result):
+        """Record a URL's verdict for this run: report, journal, stream"""
+        self.external_url_cache[url] = result
+        if self.journal:
+            self.journal.verdict(url, result, self.redirects.get(url))
+        self._stream_verdict(url, result)
+
+    def _plan_external(self, unique_urls, external_links):
+        """Decide which URLs to probe this run; seed the rest from the cache"""
+        if self.journal and self.journal.verdicts:
+            # Verdicts reached before the interrupted run died come first:
+            # they are this run's answers, whatever the cache says since
+            for url in unique_urls:
+                if url in self.journal.verdicts:
+                    self.external_url_cache[url] = self.journal.verdicts[url]
+                    if url in self.journal.redirects:
+                        self.redirects[url] = self.journal.redirects[url]
+                    self._stream_verdict(url, self.external_url_cache[url])
+            unique_urls = [url for url in unique_urls if url not in self.external_url_cache]
+
+        if self.schedule_days and self.url_cache:
+            if self.journal and self.journal.due is not None:
+                due = self.journal.due
+                self.results['schedule'] = self.journal.schedule
+            else:
+                due = self.schedule_urls(unique_urls, external_links)
+                if self.journal:
+                    self.journal.planned(due, self.results['schedule'])
+            self._load_cached_verdicts([url for url in unique_urls if url not in due],
+                                       stale_ok=True)
+            return [url for url in unique_urls if url in due]
+
+        self._load_cached_verdicts(unique_urls)
+        return [url for url in unique_urls if url not in self.external_url_cache]
+
+    def schedule_urls(self, unique_urls, external_links, now=None):
+        """Pick tonight's share of a rolling check cycle
+
+        Always due: URLs linked from a crisis/ page (hotlines must be
+        confirmed daily) and URLs whose last verdict was a failure. The rest
+        are ranked by time since their last check, boosted by how many pages
+        link to them, and the top 1/schedule_days of them are due. URLs never
+        checked rank first. Everything not due keeps its cached verdict,
+        however old.
+        """
+        now = now or time.time()
+        pages = {}
+        crisis = set()
+        for link in external_links:
+            key = probe_key(link['url'])
+            pages.setdefault(key, set()).add(link['file'])
+            if 'crisis' in Path(link['file']).parts:
+                crisis.add(key)
+
+        due = set(crisis)
+        failed = set()
+        ranked = []
+        for url in unique_urls:
+            if url in crisis:
+                continue
+            cached = self.url_cache.get(url, now=now)
+            if cached and not cached['success']:
+                failed.add(url)
+                continue
+            age = now - cached['checked_at'] if cached else math.inf
+            ranked.append((age * (1 + math.log2(len(pages[url]))), url))
+        due |= failed
+
+        budget = math.ceil(len(ranked) / self.schedule_days)
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        rotating = {url for _, url in ranked[:budget]}
+        due |= rotating
+
+        self.results['schedule'] = {
+            'cycle_days': self.schedule_days,
+            'crisis': len(crisis),
+            'recently_failed': len(failed),
+            'rotating': len(rotating),
+            'deferred': len(unique_urls) - len(due),
+        }
+        print(f"    Schedule (1/{self.schedule_days} per run): {len(crisis)} crisis, "
+              f"{len(failed)} recently failed, {len(rotating)} rotating; "
+              f"{len(unique_urls) - len(due)} deferred to cached verdicts")
+        return due
+
+    def _load_cached_verdicts(self, urls, stale_ok=False):
+        """Seed external_url_cache with still-fresh verdicts from disk"""
+        if not self.url_cache:
+            return 0
+
+        hits = 0
+        for url in urls:
+            cached = self.url_cache.get(url)
+            if cached and (cached['fresh'] or stale_ok):
+                self.external_url_cache[url] = (cached['success'], cached['error'])
+                if cached['final_url']:
+                    self.redirects[url] = redirect_entry(cached['final_url'], cached['redirects'])
+                if self.journal:
+                    # The cache entry may expire before a resumed run reads it
+                    self.journal.verdict(url, self.external_url_cache[url], self.redirects.get(url))
+                self._stream_verdict(url, self.external_url_cache[url])
+                hits += 1
+
+        if hits:
+            print(f"    {hits} URL verdicts {'reused' if stale_ok else 'still fresh'} "
+                  f"from {self.url_cache.path.name}")
+        return hits
+
+    def _index_occurrences(self, external_links):
+        """Remember where each URL appears, for streaming its verdict"""
+        self._occurrences = {}
+        if self.stream:
+            for link in external_links:
+                self._occurrences.setdefault(probe_key(link['url']), []).append(link)
+
+    def _stream_verdict(self, url, result):
+        """Stream a failed URL's finding for every place it is linked from"""
+        valid, error = result
+        if self.stream and not valid:
+            for link in self._occurrences.get(url, ()):
+                self.stream.finding('broken_external', link, error)
+
+    def _record_external_results(self, external_links):
+        """Add every occurrence of a failed URL to the broken external list
+
+        Verdicts are per probe key; each link as written gets its key's
+        verdict (and redirect chain). Also files the redirect chains seen
+        for these URLs into the report.
+        """
+        for url in {link['url'] for link in external_links}:
+            key = probe_key(url)
+            if key != url and key in self.external_url_cache:
+                self.external_url_cache[url] = self.external_url_cache[key]
+                if key in self.redirects:
+                    self.redirects[url] = self.redirects[key]
+
+        linked = {link['url'] for link in external_links}
+        redirects = {url: self.redirects[url] for url in sorted(linked & self.redirects.keys())}
+        if redirects:
+            self.results['redirects'] = redirects
+            permanent = sum(1 for entry in redirects.values() if entry['permanent'])
+            print(f"    {len(redirects)} URL(s) redirect ({permanent} permanently) - "
+                  f"see 'redirects' in the report")
 
-        # Now categorize broken links
         for link in external_links:
             url = link['url']
             if url in self.external_url_cache:
                 valid, error = self.external_url_cache[url]
-                if not valid:
+                if not valid and self.stream:
+                    self.streamed['broken_external'] += 1
+                elif not valid:
                     self.results['broken_external_links'].append({
                         **link,
                         'error': error
                     })
 
+    def merge_shard_reports(self, reports):
+        """Combine the JSON reports of a --shard i/N run into this validator's results
+
+        Every shard scanned the whole tree, so internal results and link
+        totals come from any one of them; broken external links, redirects
+        and short-circuited hosts are the union. Raises ValueError unless
+        the reports are exactly shards 1..N of one run over the same commit.
+        """
+        if not reports:
+            raise ValueError("no shard reports to merge")
+        shards = [report.get('shard') for report in reports]
+        if None in shards:
+            raise ValueError("not a --shard report (no 'shard' section)")
+        count = shards[0]['count']
+        if sorted(s['index'] for s in shards) != list(range(1, count + 1)) or \
+                any(s['count'] != count for s in shards):
+            got = ', '.join(f"{s['index']}/{s['count']}" for s in shards)
+            raise ValueError(f"need shards 1..{count} of {count} exactly once; got {got}")
+        if len({s['commit'] for s in shards}) > 1:
+            raise ValueError("shards were run on different commits")
+
+        base = reports[0]
+        for key in ('files_scanned', 'internal_links_checked', 'external_links_checked',
+                    'broken_internal_links', 'links_by_section'):
+            if key in base:
+                self.results[key] = base[key]
+
+        broken_external = [link for report in reports for link in report['broken_external_links']]
+        broken_external.sort(key=lambda link: (link['file'], link['line'], link['url']))
+        self.results['broken_external_links'] = broken_external
+
+        for key in ('redirects', 'short_circuited_hosts'):
+            merged = {}
+            for report in reports:
+                merged.update(report.get(key, {}))
+            if merged:
+                self.results[key] = dict(sorted(merged.items()))
+
+        schedules = [report['schedule'] for report in reports if 'schedule' in report]
+        if schedules:
+            self.results['schedule'] = {
+                key: schedules[0][key] if key == 'cycle_days' else sum(s[key] for s in schedules)
+                for key in schedules[0]
+            }
+
+        for report in reports:
+            for url, verdict in report['shard'].get('verdicts', {}).items():
+                self.external_url_cache[url] = tuple(verdict)
+
+        self.results['merged_shards'] = count
+
     def generate_report(self):
         """Generate and print validation report"""
-        broken_internal = len(self.results['broken_internal_links'])
-        broken_external = len(self.results['broken_external_links'])
+        broken_internal = self.broken_count('broken_internal')
+        broken_external = self.broken_count('broken_external')
         total_broken = broken_internal + broken_external
 
         print("\n" + "=" * 80)
@@ -313,9 +1872,11 @@ class LinkValidator:
                 print(f"{Colors.RED}✗ Broken internal links: {broken_internal}{Colors.NC}")
             if broken_external > 0:
                 print(f"{Colors.YELLOW}⚠ Broken external links: {broken_external}{Colors.NC}")
+            if self.stream:
+                print(f"  Listed in {self.stream.path}")
 
         # Broken internal links (high priority)
-        if broken_internal > 0:
+        if self.results['broken_internal_links']:
             print(f"\n{Colors.RED}Broken Internal Links:{Colors.NC}")
             print("-" * 80)
 
@@ -332,9 +1893,11 @@ class LinkValidator:
                 for link in links:
                     print(f"  Line {link['line']}: [{link['text']}]({link['url']})")
                     print(f"    {Colors.RED}✗ {link['error']}{Colors.NC}")
+                    if link.get('repairs'):
+                        print(f"    Did you mean: {format_suggestions(link['repairs'])}")
 
         # Broken external links (medium priority)
-        if broken_external > 0:
+        if self.results['broken_external_links']:
             print(f"\n{Colors.YELLOW}Broken External Links:{Colors.NC}")
             print("-" * 80)
 
@@ -376,12 +1939,62 @@ class LinkValidator:
         if total_links == 0:
             return 100
 
-        broken = len(self.results['broken_internal_links']) + len(self.results['broken_external_links'])
+        broken = self.broken_count('broken_internal') + self.broken_count('broken_external')
         score = ((total_links - broken) / total_links) * 100
         return round(score, 1)
 
+    def broken_count(self, kind):
+        """How many ``broken_internal`` or ``broken_external`` links this run found"""
+        return self.streamed[kind] + len(self.results[f'{kind}_links'])
+
+    def _findings(self):
+        """(kind, link) for each broken link, read back from the stream if there is one"""
+        for kind in ('broken_internal', 'broken_external'):
+            for link in self.results[f'{kind}_links']:
+                yield kind, link
+        if not self.stream:
+            return
+        with open(self.stream.path, encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record['kind'] in self.streamed:
+                    yield record['kind'], record
+
+    def record_history(self, path):
+        """Append this run's broken links and URL verdicts to the findings history
+
+        With a stream, call this once the stream is closed: the findings are
+        read back from it.
+        """
+        findings = (
+            {'kind': kind, 'path': self._page_key(link['file']),
+             'line': link['line'], 'target': link['url'], 'detail': link.get('error')}
+            for kind, link in self._findings()
+        )
+        try:
+            with FindingsHistory(path) as history:
+                history.record_run(
+                    'link_validator', findings,
+                    checked=self.results.get('links_by_section', {}),
+                    verdicts=self.external_url_cache,
+                    score=self.results['summary'].get('health_score'),
+                    summary=self.results['summary'],
+                )
+        except sqlite3.Error as e:
+            print(f"{Colors.RED}✗ Failed to record history: {e}{Colors.NC}")
+            return
+        print(f"{Colors.GREEN}✓ Run recorded in history: {path}{Colors.NC}")
+
+    def _page_key(self, file):
+        """Wiki-root-relative path of a link's ``file`` (which includes the root's name)"""
+        return (self.wiki_root.parent / file).relative_to(self.wiki_root).as_posix()
+
     def save_report(self, output_file=None):
-        """Save detailed report to JSON"""
+        """Save detailed report to JSON
+
+        With a stream, the broken links are in the stream only: the report
+        carries the summary and totals, plus where the findings are.
+        """
         if output_file is None:
             output_file = Path(__file__).parent / "link_validation_report.json"
         else:
@@ -389,7 +2002,12 @@ class LinkValidator:
 
         try:
             with open(output_file, 'w') as f:
-                json.dump(self.results, f, indent=2)
+                if self.stream:
+                    report = {key: value for key, value in self.results.items()
+                              if not key.endswith('_links')}
+                    json.dump({**report, 'findings': str(self.stream.path)}, f)
+                else:
+                    json.dump(self.results, f, indent=2)
 
             print(f"\n{Colors.GREEN}✓ Detailed report saved: {output_file}{Colors.NC}")
 
@@ -400,6 +2018,19 @@ class LinkValidator:
         except Exception as e:
             print(f"\n{Colors.RED}✗ Failed to save report: {e}{Colors.NC}")
 
+    def save_redirect_map(self, output_file):
+        """Save the canonical-URL map: source URL -> final URL after redirects"""
+        canonical = {
+            url: {k: entry[k] for k in ('final_url', 'permanent', 'hops')}
+            for url, entry in self.results.get('redirects', {}).items()
+        }
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(canonical, f, indent=2)
+            print(f"{Colors.GREEN}✓ Redirect map saved: {output_file}{Colors.NC}")
+        except OSError as e:
+            print(f"{Colors.RED}✗ Failed to save redirect map: {e}{Colors.NC}")
+
     def save_text_report(self, output_file):
         """Save human-readable text report"""
         try:
@@ -415,9 +2046,11 @@ class LinkValidator:
                 f.write(f"Files scanned: {self.results['files_scanned']}\n")
                 f.write(f"Internal links: {self.results['internal_links_checked']}\n")
                 f.write(f"External links: {self.results['external_links_checked']}\n")
-                f.write(f"Broken internal: {len(self.results['broken_internal_links'])}\n")
-                f.write(f"Broken external: {len(self.results['broken_external_links'])}\n")
+                f.write(f"Broken internal: {self.broken_count('broken_internal')}\n")
+                f.write(f"Broken external: {self.broken_count('broken_external')}\n")
                 f.write(f"Health score: {self.results['summary']['health_score']}%\n")
+                if self.stream:
+                    f.write(f"Broken links listed in: {self.stream.path}\n")
                 f.write("\n")
 
                 # Broken internal links
@@ -429,6 +2062,8 @@ class LinkValidator:
                         f.write(f"  Text: {link['text']}\n")
                         f.write(f"  URL: {link['url']}\n")
                         f.write(f"  Error: {link['error']}\n")
+                        if link.get('repairs'):
+                            f.write(f"  Did you mean: {format_suggestions(link['repairs'])}\n")
 
                 # Broken external links
                 if self.results['broken_external_links']:
@@ -440,12 +2075,191 @@ class LinkValidator:
                         f.write(f"  URL: {link['url']}\n")
                         f.write(f"  Error: {link['error']}\n")
 
+                # Permanent redirects are safe to rewrite to their target
+                permanent = {url: entry for url, entry in self.results.get('redirects', {}).items()
+                             if entry['permanent']}
+                if permanent:
+                    f.write("\n\nPERMANENTLY REDIRECTED EXTERNAL LINKS\n")
+                    f.write("-" * 80 + "\n")
+                    for url, entry in permanent.items():
+                        f.write(f"\n{url}\n")
+                        f.write(f"  -> {entry['final_url']} ({entry['hops']} hop(s))\n")
+
             print(f"{Colors.GREEN}✓ Text report saved: {output_file}{Colors.NC}")
 
         except Exception as e:
             print(f"{Colors.RED}✗ Failed to save text report: {e}{Colors.NC}")
 
 
+class LinkWatcher:
+    """Keeps a scanned tree warm in memory and re-checks only what changes
+
+    Holds every file's links, the page index and the backlink index, and
+    polls file mtimes (stdlib only, so it runs the same on macOS and Linux).
+    A saved page is re-checked on its own; a page that appears, disappears
+    or is renamed, or whose headings change, also re-checks every page
+    linking to it. Each poll prints the links that broke and the links that
+    were fixed. Internal links only.
+    Hidden directories and node_modules are not watched.
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.root = validator.wiki_root
+        self.snapshot = {}
+        self.file_results = {}
+        self.outgoing = {}
+        self.backlinks = {}
+
+    def _snapshot(self):
+        """(mtime, size) for every file under the root, keyed by relative path"""
+        found = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != 'node_modules']
+            rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+            for name in filenames:
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                key = name if rel_dir == '.' else f"{rel_dir}/{name}"
+                found[key] = (st.st_mtime_ns, st.st_size)
+        return found
+
+    def _check(self, key):
+        """Re-read one page; update its links in the backlink index"""
+        file_result = self.validator.validate_links_in_file(self.root / key)
+        self._forget(key)
+        self.file_results[key] = file_result
+        routes = {link_route(link, key) for link in file_result['internal_links']
+                  if link['type'] != 'anchor'}
+        self.outgoing[key] = routes
+        for route in routes:
+            self.backlinks.setdefault(route, set()).add(key)
+        return file_result
+
+    def _forget(self, key):
+        self.file_results.pop(key, None)
+        for route in self.outgoing.pop(key, ()):
+            self.backlinks.get(route, set()).discard(key)
+
+    def prime(self):
+        """Initial full scan into memory; returns the number of broken links"""
+        self.snapshot = self._snapshot()
+        self.validator.use_pages(set(self.snapshot))
+        for key in sorted(k for k in self.snapshot if k.endswith('.md')):
+            self._check(key)
+        return sum(len(r['broken_internal']) for r in self.file_results.values())
+
+    def poll(self):
+        """Re-check what changed since the last poll
+
+        Returns (files re-checked, newly broken links, newly fixed links).
+        """
+        current = self._snapshot()
+        added = current.keys() - self.snapshot.keys()
+        deleted = self.snapshot.keys() - current.keys()
+        modified = {k for k in current.keys() & self.snapshot.keys()
+                    if current[k] != self.snapshot[k]}
+        self.snapshot = current
+        if not (added or deleted or modified):
+            return [], [], []
+
+        self.validator.use_pages(set(current))
+        affected = {k for k in added | modified if k.endswith('.md')}
+        for route in {route_key(k) for k in added | deleted}:
+            affected |= self.backlinks.get(route, set())
+        for key in (modified | deleted) & self.validator.headings.pages.keys():
+            # Pages linking into this one only need a re-check if its
+            # headings (the #fragments they may point at) changed
+            before = self.validator.headings.pages[key]
+            self.validator.headings.forget(key)
+            if key in deleted or self.validator.headings.anchors(key) != before:
+                affected |= self.backlinks.get(route_key(key), set())
+        affected -= deleted
+
+        newly_broken, newly_fixed = [], []
+        for key in deleted:
+            self._forget(key)
+        for key in sorted(affected):
+            before = self.file_results.get(key, {}).get('broken_internal', [])
+            after = self._check(key)['broken_internal']
+            old_urls = {b['url'] for b in before}
+            new_urls = {b['url'] for b in after}
+            newly_broken += [b for b in after if b['url'] not in old_urls]
+            newly_fixed += [b for b in before if b['url'] not in new_urls]
+        return sorted(affected), newly_broken, newly_fixed
+
+    def run(self, interval=0.5):
+        print(f"{Colors.CYAN}Watching {self.root} for changes (Ctrl-C to stop)...{Colors.NC}")
+        started = time.monotonic()
+        broken = self.prime()
+        print(f"  Indexed {len(self.file_results)} pages in "
+              f"{time.monotonic() - started:.2f}s; {broken} broken internal link(s)")
+
+        try:
+            while True:
+                time.sleep(interval)
+                started = time.monotonic()
+                checked, newly_broken, newly_fixed = self.poll()
+                if not checked:
+                    continue
+                stamp = datetime.now().strftime('%H:%M:%S')
+                print(f"\n[{stamp}] Re-checked {len(checked)} file(s) in "
+                      f"{(time.monotonic() - started) * 1000:.0f}ms")
+                for link in newly_broken:
+                    print(f"  {Colors.RED}✗ {link['file']}:{link['line']} "
+                          f"[{link['text']}]({link['url']}) - {link['error']}{Colors.NC}")
+                for link in newly_fixed:
+                    print(f"  {Colors.GREEN}✓ fixed {link['file']}: ({link['url']}){Colors.NC}")
+                if not (newly_broken or newly_fixed):
+                    print("  No change in broken links")
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+
+
+# Per-process validator for --jobs workers (see LinkValidator._read_files)
+_worker_validator = None
+
+
+def _init_scan_worker(wiki_root, pages):
+    global _worker_validator
+    _worker_validator = LinkValidator(wiki_root=wiki_root)
+    _worker_validator.use_pages(pages)
+
+
+def _scan_file_in_worker(md_file):
+    return _worker_validator.validate_links_in_file(md_file)
+
+
+def merge_reports(args):
+    """--merge: one report from the per-shard JSON reports of a sharded run"""
+    reports = []
+    for path in args.merge:
+        try:
+            with open(path, encoding='utf-8') as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}✗ Cannot read shard report {path}: {e}{Colors.NC}")
+            return 2
+
+    validator = LinkValidator(wiki_root=args.wiki_root)
+    try:
+        validator.merge_shard_reports(reports)
+    except ValueError as e:
+        print(f"{Colors.RED}✗ Cannot merge: {e}{Colors.NC}")
+        return 2
+    print(f"Merged {len(reports)} shard report(s)")
+
+    total_broken = validator.generate_report()
+    validator.save_report(output_file=args.output)
+    if args.redirect_map:
+        validator.save_redirect_map(args.redirect_map)
+    if args.history:
+        validator.record_history(args.history)
+    return 0 if total_broken == 0 else 1
+
+
 def main():
     import argparse
 
@@ -467,11 +2281,211 @@ def main():
         default=None,
         help='Output file for report (default: ./link_validation_report.json)'
     )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Stay running: keep the index in memory and re-check internal links '
+             'in files as they are saved (no reports written)'
+    )
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=0.5,
+        metavar='SECONDS',
+        help='How often --watch polls for changes (default: 0.5)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Read and check files in N processes (0 = one per CPU; default: 1)'
+    )
+    parser.add_argument(
+        '--ndjson',
+        default=None,
+        metavar='PATH',
+        help='Also stream one JSON record per finding to PATH as the run goes'
+    )
+    parser.add_argument(
+        '--redirect-map',
+        default=None,
+        metavar='PATH',
+        help='Write the canonical-URL map (source -> final URL, permanent or not) to PATH'
+    )
+    parser.add_argument(
+        '--shard',
+        default=None,
+        metavar='I/N',
+        help='Check only the external URLs whose host hashes to shard I of N '
+             '(1-based); combine the N JSON reports with --merge'
+    )
+    parser.add_argument(
+        '--merge',
+        nargs='+',
+        default=None,
+        metavar='REPORT',
+        help='Merge the JSON reports of a sharded run into one report '
+             '(printed and saved as usual; no files are scanned)'
+    )
+    parser.add_argument(
+        '--history',
+        nargs='?',
+        const=str(HISTORY_PATH),
+        default=None,
+        metavar='PATH',
+        help='Append this run to the findings history database '
+             '(default path: ./.findings_history.sqlite; see scripts/findings_history.py)'
+    )
+    parser.add_argument(
+        '--journal',
+        nargs='?',
+        const=str(JOURNAL_PATH),
+        default=None,
+        metavar='PATH',
+        help='Checkpoint finished files and URL verdicts as the run goes '
+             '(default path: ./.link_journal.ndjson; removed when the run completes)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted --journal run from its journal (and keep '
+             'journaling): unchanged files and URLs already checked are not done again'
+    )
+    parser.add_argument(
+        '--since',
+        default=None,
+        metavar='REF',
+        help='Only re-read files changed since this git ref (and their backlinkers); '
+             'needs the link index from an earlier run'
+    )
+    parser.add_argument(
+        '--index',
+        default=None,
+        help='Link index written by every run (default: ./.link_index.json)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=['threads', 'async'],
+        default='threads',
+        help='External checking engine: threads (a pool of 10) or async; both keep '
+             'to --per-host and --host-delay (default: threads)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=20,
+        help='Async engine: max external requests in flight (default: 20)'
+    )
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        default=2,
+        help='Max requests in flight per host, halved on 429/503 and regrown (default: 2)'
+    )
+    parser.add_argument(
+        '--cache',
+        default=None,
+        help='SQLite verdict cache shared across runs (default: ./.link_cache.sqlite)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Probe every external URL, ignoring and not updating the cache'
+    )
+    parser.add_argument(
+        '--ttl-hours',
+        default='168,24,6',
+        help='Cache TTLs in hours for healthy,dead,transient verdicts (default: 168,24,6)'
+    )
+    parser.add_argument(
+        '--schedule-days',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Rolling schedule: probe crisis and recently failed URLs plus about 1/N '
+             'of the rest each run, stalest and most-linked first (needs the cache)'
+    )
+    parser.add_argument(
+        '--breaker-threshold',
+        type=int,
+        default=3,
+        metavar='N',
+        help='Stop probing a host after N connection failures in a row (0 = never; default: 3)'
+    )
+    parser.add_argument(
+        '--host-delay',
+        type=float,
+        default=0.5,
+        help='Min seconds between requests to one host (default: 0.5)'
+    )
 
     args = parser.parse_args()
 
+    # A limit of 0 would never grant a slot: the run would hang, not fail
+    for flag, value in (('--concurrency', args.concurrency), ('--per-host', args.per_host)):
+        if value < 1:
+            parser.error(f'{flag} must be at least 1')
+    if args.jobs < 0:
+        parser.error('--jobs must be 0 (one per CPU) or more')
+
+    if args.watch:
+        LinkWatcher(LinkValidator(wiki_root=args.wiki_root)).run(args.watch_interval)
+        return 0
+
+    if args.schedule_days and args.no_cache:
+        parser.error('--schedule-days needs the verdict cache; drop --no-cache')
+
+    shard = None
+    if args.shard:
+        try:
+            shard = tuple(int(n) for n in args.shard.split('/'))
+            index_, count = shard
+        except ValueError:
+            parser.error('--shard takes I/N, e.g. 2/4')
+        if not 1 <= index_ <= count:
+            parser.error(f'--shard {args.shard}: I must be between 1 and N')
+
+    if args.merge:
+        return merge_reports(args)
+
+    if args.shard and args.ndjson:
+        parser.error('--ndjson keeps broken links out of the report, which --merge needs; '
+                     'drop one of --shard and --ndjson')
+
+    url_cache = None
+    if not args.no_cache and not args.skip_external:
+        try:
+            healthy, dead, transient = (float(h) * ExternalUrlCache.HOUR
+                                        for h in args.ttl_hours.split(','))
+        except ValueError:
+            parser.error('--ttl-hours takes three comma-separated numbers')
+        url_cache = ExternalUrlCache(
+            args.cache or Path(__file__).parent / ".link_cache.sqlite",
+            ttl_healthy=healthy,
+            ttl_dead=dead,
+            ttl_transient=transient
+        )
+
+    journal_path = args.journal or (JOURNAL_PATH if args.resume else None)
+
     # Create validator
-    validator = LinkValidator(wiki_root=args.wiki_root)
+    validator = LinkValidator(
+        wiki_root=args.wiki_root,
+        engine=args.engine,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        host_delay=args.host_delay,
+        url_cache=url_cache,
+        index_path=args.index or Path(__file__).parent / ".link_index.json",
+        stream=FindingStream(args.ndjson) if args.ndjson else None,
+        jobs=args.jobs or os.cpu_count() or 1,
+        breaker_threshold=args.breaker_threshold,
+        schedule_days=args.schedule_days,
+        shard=shard,
+        journal=RunJournal(journal_path) if journal_path else None,
+        resume=args.resume
+    )
 
     # Skip external validation if requested
     if args.skip_external:
@@ -480,18 +2494,33 @@ def main():
         print(f"{Colors.YELLOW}Skipping external link validation{Colors.NC}")
 
     # Run validation
-    validator.scan_all_files()
+    try:
+        validator.scan_all_files(since=args.since)
+    finally:
+        if validator.journal:
+            validator.journal.close()
+        if url_cache:
+            url_cache.close()
 
     # Generate report
     total_broken = validator.generate_report()
 
+    if validator.stream:
+        validator.stream.write({'kind': 'summary', **validator.results['summary']})
+        validator.stream.close()
+
     # Save detailed report
     validator.save_report(output_file=args.output)
+    if args.redirect_map:
+        validator.save_redirect_map(args.redirect_map)
+    if args.history:
+        validator.record_history(args.history)
+    if validator.journal:
+        validator.journal.finish()
 
     # Exit code: 0 if all links valid, 1 if broken links found
     return 0 if total_broken == 0 else 1
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Offline throughput benchmark for the external-link checkers.
+
+Starts a local stand-in web server and points each checker at a synthetic
+link set (default 100 URLs across 60 hosts, a little over a minute for all
+three engines), then reports URLs/second, p50/p99 time-to-verdict per URL,
+and the peak number of sockets the checker held open to the server. Nothing
+leaves the machine: the fake hostnames (hostNNN.bench.test) resolve to
+127.0.0.1 through a patched resolver, so per-host logic (throttles, circuit
+breaker, session pools) sees one host per name.
+
+Host behaviours, fixed by a stable hash of the host number so runs are
+comparable (shares are of hosts):
+
+  slow        10%  every response takes 0.2-1.0s
+  head405      5%  HEAD -> 405, GET works (tests the GET fallback)
+  redirect     5%  301 -> 302 -> 200 chain
+  throttle     5%  first request per URL -> 429 with Retry-After: 1
+  nxdomain     2%  hostname does not resolve
+  hang         1%  accepts, then says nothing for --hang-seconds
+  ok          72%  immediate 200
+  and on every host, one path in 50 is a 404
+
+Engines: `threads` and `async` (link_validator_agent.py, need `requests`)
+and `claims` (check_claims.check_org_urls, stdlib).
+
+Run:
+  python3 scripts/bench_link_checkers.py                       # all engines
+  python3 scripts/bench_link_checkers.py --engines async --urls 5000 --hosts 300
+  python3 scripts/bench_link_checkers.py --json bench.json     # machine-readable
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS))
+sys.path.insert(0, str(SCRIPTS.parent))
+
+FAKE_DOMAIN = '.bench.test'
+
+# (upper bound of the host's bucket, 0-99, behaviour)
+HOST_MIX = [(10, 'slow'), (15, 'head405'), (20, 'redirect'), (25, 'throttle'),
+            (27, 'nxdomain'), (28, 'hang'), (100, 'ok')]
+
+
+def host_kind(n):
+    # A stable hash, not n % 100: the low-numbered hosts get most of the
+    # URLs, and with fewer than 100 hosts they would all be 'slow'
+    bucket = zlib.crc32(str(n).encode()) % 100
+    for bound, kind in HOST_MIX:
+        if bucket < bound:
+            return kind
+    return 'ok'
+
+
+def host_name(n):
+    prefix = 'nx' if host_kind(n) == 'nxdomain' else 'host'
+    return f"{prefix}{n:03d}{FAKE_DOMAIN}"
+
+
+def build_urls(count, hosts, port, seed=0):
+    """``count`` URLs spread unevenly over ``hosts`` hosts, as real pages are"""
+    rng = random.Random(seed)
+    weights = [1 / (n + 1) ** 0.8 for n in range(hosts)]  # a few big hosts, a long tail
+    urls = []
+    for i in range(count):
+        n = rng.choices(range(hosts), weights)[0]
+        urls.append(f"http://{host_name(n)}:{port}/p/{i}")
+    return urls
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like a real server
+
+    def setup(self):
+        super().setup()
+        with self.server.counter_lock:
+            self.server.active.value += 1
+            self.server.peak.value = max(self.server.peak.value, self.server.active.value)
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            with self.server.counter_lock:
+                self.server.active.value -= 1
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, status, headers=(), body=b''):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def respond(self):
+        host = self.headers.get('Host', '').split(':')[0]
+        # check_claims retries on www.<host>; it is the same host
+        host = host[len('www.'):] if host.startswith('www.') else host
+        try:
+            n = int(host[len('host'):len('host') + 3])
+        except ValueError:
+            n = 99
+        kind = host_kind(n)
+        path = self.path
+
+        if kind == 'hang':
+            time.sleep(self.server.hang_seconds)
+        elif kind == 'slow':
+            time.sleep(0.2 + (zlib.crc32(path.encode()) % 80) / 100)
+        elif kind == 'head405' and self.command == 'HEAD':
+            return self.send(405)
+        elif kind == 'throttle':
+            key = f"{host}{path}"
+            with self.server.seen_lock:
+                first = key not in self.server.seen
+                self.server.seen.add(key)
+            if first:
+                return self.send(429, [('Retry-After', '1')])
+        elif kind == 'redirect' and path.startswith('/p/'):
+            return self.send(301, [('Location', '/r1' + path)])
+        elif kind == 'redirect' and path.startswith('/r1/'):
+            return self.send(302, [('Location', '/final' + path[3:])])
+
+        if path.rsplit('/', 1)[-1].isdigit() and int(path.rsplit('/', 1)[-1]) % 50 == 0:
+            return self.send(404, body=b'gone')
+        self.send(200, [('Content-Type', 'text/html')], b'<html>ok</html>')
+
+    do_HEAD = respond
+    do_GET = respond
+
+
+class QuietServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # A checker giving up on a hanging host closes its end; that's the point
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def serve(port_out, active, peak, hang_seconds, ready):
+    server = QuietServer(('127.0.0.1', 0), FixtureHandler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    server.active, server.peak = active, peak
+    server.counter_lock = threading.Lock()
+    server.seen, server.seen_lock = set(), threading.Lock()
+    server.hang_seconds = hang_seconds
+    port_out.value = server.server_address[1]
+    ready.set()
+    server.serve_forever()
+
+
+class FixtureServer:
+    """The stand-in web server, in its own process so it doesn't share our GIL"""
+
+    def __init__(self, hang_seconds):
+        self.port = multiprocessing.Value('i', 0)
+        self.active = multiprocessing.Value('i', 0)
+        self.peak = multiprocessing.Value('i', 0)
+        ready = multiprocessing.Event()
+        self.process = multiprocessing.Process(
+            target=serve, args=(self.port, self.active, self.peak, hang_seconds, ready),
+            daemon=True
+        )
+        self.process.start()
+        ready.wait(10)
+
+    def reset_peak(self):
+        self.peak.value = self.active.value
+
+    def stop(self):
+        self.process.terminate()
+        self.process.join()
+
+
+def install_fake_resolver():
+    """Resolve *.bench.test to 127.0.0.1 (nx* hosts fail), everything else as usual
+
+    Returns the real socket.getaddrinfo, to put back when done.
+    """
+    real = socket.getaddrinfo
+
+    def getaddrinfo(host, *args, **kwargs):
+        if isinstance(host, str) and host.endswith(FAKE_DOMAIN):
+            if host.startswith(('nx', 'www.nx')):
+                raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+            host = '127.0.0.1'
+        return real(host, *args, **kwargs)
+
+    socket.getaddrinfo = getaddrinfo
+    os.environ['no_proxy'] = os.environ['NO_PROXY'] = '*'
+    return real
+
+
+class Timings:
+    """First-start and last-end time per URL, whatever thread reports them"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.start = {}
+        self.end = {}
+
+    def wrap(self, fn):
+        def timed(url, *args, **kwargs):
+            started = time.perf_counter()
+            with self.lock:
+                self.start.setdefault(url, started)
+            try:
+                return fn(url, *args, **kwargs)
+            finally:
+                with self.lock:
+                    self.end[url] = time.perf_counter()
+        return timed
+
+    def latencies(self):
+        return sorted(self.end[url] - self.start[url] for url in self.end)
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def run_validator(engine, urls, args):
+    import link_validator_agent as lva
+    if not lva.REQUESTS_AVAILABLE:
+        return None, "requests not installed"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        v = lva.LinkValidator(wiki_root=tmp, engine=engine, concurrency=args.concurrency,
+                              per_host=args.per_host, host_delay=args.host_delay)
+        timings = Timings()
+        v._check_url = timings.wrap(v._check_url)
+        links = [lva.LinkRecord(url, url, 'external', i + 1, 'bench.md')
+                 for i, url in enumerate(urls)]
+        if engine == 'async':
+            v.validate_external_links_async(links)
+        else:
+            v.validate_external_links_batch(links)
+        broken = {link['url'] for link in v.results['broken_external_links']}
+    return timings, len(broken)
+
+
+class _Page:
+    """An in-memory page for check_org_urls: one markdown link per URL"""
+
+    def __init__(self, urls, root):
+        self.text = ''.join(f"[l]({url})\n" for url in urls)
+        self.root = root
+
+    def read_text(self, encoding='utf-8'):
+        return self.text
+
+    def relative_to(self, root):
+        return Path('bench.md')
+
+
+def run_claims(urls, args):
+    import check_claims as cc
+    timings = Timings()
+    real = cc._probe_url
+    cc._probe_url = timings.wrap(real)
+    try:
+        findings = cc.check_org_urls([_Page(urls, cc.REPO_ROOT)], args.timeout)
+    finally:
+        cc._probe_url = real
+    return timings, len(findings)
+
+
+def run_engine(engine, urls, args):
+    """(Timings, URLs reported broken) for one engine, or (None, why skipped)"""
+    if engine == 'claims':
+        return run_claims(urls, args)
+    return run_validator(engine, urls, args)
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Benchmark the external-link checkers offline')
+    ap.add_argument('--urls', type=int, default=100)
+    ap.add_argument('--hosts', type=int, default=60)
+    ap.add_argument('--engines', nargs='+', default=['threads', 'async', 'claims'],
+                    choices=['threads', 'async', 'claims'])
+    ap.add_argument('--concurrency', type=int, default=20, help='async engine total limit')
+    ap.add_argument('--per-host', type=int, default=2, help='async engine per-host limit')
+    ap.add_argument('--host-delay', type=float, default=0.5,
+                    help='async engine seconds between starts on one host')
+    ap.add_argument('--timeout', type=int, default=10, help='check_claims probe timeout')
+    ap.add_argument('--hang-seconds', type=float, default=12.0,
+                    help="how long 'hang' hosts stay silent (above the checkers' timeouts)")
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--json', dest='json_out', help='also write results here')
+    args = ap.parse_args()
+
+    install_fake_resolver()
+    server = FixtureServer(args.hang_seconds)
+    urls = build_urls(args.urls, args.hosts, server.port.value, args.seed)
+    print(f"Fixture server on 127.0.0.1:{server.port.value}: "
+          f"{len(urls)} URLs across {len({u.split('/')[2] for u in urls})} hosts\n")
+
+    rows = []
+    try:
+        for engine in args.engines:
+            server.reset_peak()
+            started = time.perf_counter()
+            timings, broken = run_engine(engine, urls, args)
+            elapsed = time.perf_counter() - started
+            if timings is None:
+                print(f"{engine}: skipped ({broken})")
+                rows.append({'engine': engine, 'skipped': broken})
+                continue
+            lat = timings.latencies()
+            rows.append({
+                'engine': engine,
+                'urls': len(urls),
+                'seconds': round(elapsed, 2),
+                'urls_per_second': round(len(urls) / elapsed, 1) if elapsed else 0.0,
+                'p50_ms': round(percentile(lat, 50) * 1000, 1),
+                'p99_ms': round(percentile(lat, 99) * 1000, 1),
+                'peak_sockets': server.peak.value,
+                'reported_broken': broken,
+            })
+    finally:
+        server.stop()
+
+    print(f"\n{'engine':<8} {'urls':>6} {'secs':>8} {'urls/s':>8} {'p50 ms':>8} "
+          f"{'p99 ms':>9} {'sockets':>8} {'broken':>7}")
+    for row in rows:
+        if 'skipped' in row:
+            print(f"{row['engine']:<8} skipped: {row['skipped']}")
+            continue
+        print(f"{row['engine']:<8} {row['urls']:>6} {row['seconds']:>8} "
+              f"{row['urls_per_second']:>8} {row['p50_ms']:>8} {row['p99_ms']:>9} "
+              f"{row['peak_sockets']:>8} {row['reported_broken']:>7}")
+
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump({'urls': args.urls, 'hosts': args.hosts, 'results': rows}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,13 +12,27 @@ USAGE
     python3 scripts/check_accessibility.py                 # all tracked content .md
     python3 scripts/check_accessibility.py media/books.md  # specific files/dirs
     python3 scripts/check_accessibility.py --summary        # counts only
+    python3 scripts/check_accessibility.py --history        # also append the run to
+                                                            # scripts/findings_history.py's db
+    python3 scripts/check_accessibility.py --history DB     # ... a db at DB instead
 
 Scans English + es content; skips frontmatter, fenced code, and non-content trees.
 """
-import os, re, subprocess, sys
+import argparse, os, re, subprocess, sys
 
-args = [a for a in sys.argv[1:] if not a.startswith('--')]
-SUMMARY = '--summary' in sys.argv
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from findings_history import DEFAULT_PATH, FindingsHistory, section_of
+
+ap = argparse.ArgumentParser(description='Content-level accessibility audit of wiki markdown')
+ap.add_argument('paths', nargs='*', metavar='PATH',
+                help='files or directories to check (default: all tracked content .md)')
+ap.add_argument('--summary', action='store_true', help='counts only')
+ap.add_argument('--history', nargs='?', const=str(DEFAULT_PATH), default=None, metavar='DB',
+                help="also append the run to findings_history.py's db "
+                     '(default path: ./.findings_history.sqlite)')
+opts = ap.parse_args()
+args = opts.paths
+SUMMARY = opts.summary
 SKIP = ('backups/', '.claude/', 'docs/', 'node_modules/', 'archetypes/', 'content/',
         'page-review-2026-06-05/', 'scripts/')
 
@@ -111,13 +125,15 @@ def check(path):
 files = target_files()
 total = {}
 flagged_files = 0
+history_findings = []
 for f in sorted(files):
     fs = check(f)
     if not fs:
         continue
     flagged_files += 1
-    for _, cat, _, _ in fs:
+    for ln, cat, issue, _ in fs:
         total[cat] = total.get(cat, 0) + 1
+        history_findings.append({'kind': cat, 'path': f, 'line': ln, 'target': issue, 'detail': issue})
     if not SUMMARY:
         print(f'\n### {f}')
         for ln, cat, issue, fix in fs:
@@ -129,3 +145,16 @@ for cat in sorted(total):
     print(f'  {cat}: {total[cat]}')
 if not total:
     print('  clean — no content-level a11y issues found.')
+
+if opts.history:
+    # Health per section = share of files with no findings
+    checked, flagged = {}, {}
+    for f in files:
+        checked[section_of(f)] = checked.get(section_of(f), 0) + 1
+    for f in {item['path'] for item in history_findings}:
+        flagged[section_of(f)] = flagged.get(section_of(f), 0) + 1
+    with FindingsHistory(opts.history) as history:
+        history.record_run('check_accessibility', history_findings, checked=checked,
+                           flagged=flagged,
+                           summary={'files': len(files), 'flagged_files': flagged_files, **total})
+    print(f'recorded in history: {opts.history}')
@@ -37,9 +37,16 @@ import json
 import os
 import re
 import sys
+import time
+from collections import deque
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
+from findings_history import DEFAULT_PATH as HISTORY_PATH, FindingsHistory, section_of
+from rate_control import (
+    MAX_ATTEMPTS, MAX_RETRY_AFTER, THROTTLE_STATUSES, HostBackoff, Throttled, parse_retry_after,
+)
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 LEDGER = REPO_ROOT / "docs" / "CLAIMS.md"
 
@@ -167,18 +174,171 @@ def iter_content(root: Path, only: list[str] | None = None):
             yield p
 
 
+# Shortest literal worth prefiltering on; a rule without one is tried on
+# every line
+MIN_ANCHOR = 3
+DIGIT_BONUS = 4
+
+# The non-ASCII characters re.IGNORECASE matches to an ASCII letter: dotted
+# and dotless i, long s and the Kelvin sign. Mapped before str.lower(), which
+# leaves ı and ſ alone and turns İ into two characters (i + combining dot),
+# so that folded text keeps every character where it was
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+# An escape that is not a literal character, with its arguments (\x41, \1)
+_SPECIAL_ESCAPE = re.compile(
+    r"\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|N\{[^}]*\}|\d+|[A-Za-z])"
+)
+_COUNT = re.compile(r"\{\d*(?:,\d*)?\}")
+
+
+def fold_case(text: str) -> str:
+    return text.translate(_CASE_FOLD).lower()
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Index just past the character class opening at ``i``."""
+    i += 1
+    if pattern[i:i + 1] == "^":
+        i += 1
+    if pattern[i:i + 1] == "]":
+        i += 1  # a leading ] is a literal
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Index just past the group opening at ``i``."""
+    depth = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i = _skip_class(pattern, i)
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if not depth:
+                return i + 1
+        i += 1
+    return i
+
+
+def literal_anchor(pattern: str) -> str | None:
+    """A literal every match of ``pattern`` must contain, case-folded.
+
+    Only top-level literal runs count: text inside groups and classes, and a
+    character made optional or repeated by a quantifier, may not be in a
+    match. Of those, the longest, with a run holding a digit counted as
+    DIGIT_BONUS characters longer (figures are what the ledger rejects, and
+    a figure is rarer in prose than a word of the same length). None when there
+    is no ASCII run of MIN_ANCHOR characters, when the pattern has a
+    top-level ``|`` (no single run is required), or in verbose mode
+    (whitespace isn't literal).
+    """
+    if re.compile(pattern).flags & re.X:
+        return None
+    runs, run, i = [], "", 0
+    while i < len(pattern):
+        ch = pattern[i]
+        special = _SPECIAL_ESCAPE.match(pattern, i) if ch == "\\" else None
+        count = _COUNT.match(pattern, i) if ch == "{" else None
+        if ch == "|":
+            return None
+        if ch == "\\" and not special:
+            run += pattern[i + 1:i + 2]  # \. \$ \( ...
+            i += 2
+            continue
+        if special or ch in "().[^$":
+            runs.append(run)
+            run = ""
+            if special:
+                i = special.end()
+            elif ch == "(":
+                i = _skip_group(pattern, i)
+            elif ch == "[":
+                i = _skip_class(pattern, i)
+            else:
+                i += 1
+            continue
+        if ch in "?*+" or count:
+            run = run[:-1]  # the quantified character may be absent or repeated
+            runs.append(run)
+            run = ""
+            i = count.end() if count else i + 1
+            continue
+        run += ch
+        i += 1
+    runs.append(run)
+    runs = [fold_case(r) for r in runs if r.isascii() and len(r) >= MIN_ANCHOR]
+    if not runs:
+        return None
+    return max(runs, key=lambda r: len(r) + DIGIT_BONUS * any(c.isdigit() for c in r))
+
+
+def literal_alternation(literals) -> re.Pattern | None:
+    """One regex matching any of ``literals``, shaped as their trie.
+
+    ``a|b|c`` makes the regex engine try every literal at every position;
+    the trie form branches once per character, so a search costs about the
+    same for 10 literals or 1,000.
+    """
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A literal ends here: the rest is optional, and matching the
+        # shorter literal is enough for a prefilter
+        return f"(?:{body})?" if "" in node else body
+
+    return re.compile(emit(trie)) if trie else None
+
+
 def check_regressions(files, led: Ledger) -> list[Finding]:
-    """The core guard: a claim we already rejected must not reappear."""
+    """The core guard: a claim we already rejected must not reappear.
+
+    Each rule's required literal (literal_anchor) goes into one trie-shaped
+    regex run over case-folded text: once per file, then per line of a file
+    it hits. Only lines containing a rule's literal run that rule, so the
+    cost grows with the content, not content x rules. Rules with no usable
+    literal are tried on every line. Findings and their order are the same
+    as trying every rule on every line.
+    """
     out: list[Finding] = []
     if not led.rejected:
         return out
+    anchors = [literal_anchor(rej["raw"]) for rej in led.rejected]
+    prefilter = literal_alternation({a for a in anchors if a})
+    always = [rej for rej, anchor in zip(led.rejected, anchors) if anchor is None]
     for path in files:
         try:
-            lines = path.read_text(encoding="utf-8").splitlines()
+            text = path.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError):
             continue
-        for i, line in enumerate(lines, 1):
-            for rej in led.rejected:
+        folded = fold_case(text)
+        hit = prefilter is not None and prefilter.search(folded) is not None
+        if not hit and not always:
+            continue
+        for i, (line, low) in enumerate(zip(text.splitlines(), folded.splitlines()), 1):
+            if hit and prefilter.search(low):
+                rules = [rej for rej, anchor in zip(led.rejected, anchors)
+                         if anchor is None or anchor in low]
+            else:
+                rules = always
+            for rej in rules:
                 if rej["re"].search(line):
                     out.append(
                         Finding(
@@ -293,7 +453,7 @@ def check_bare_domains(files) -> list[Finding]:
     return out
 
 
-def _probe_url(url: str, timeout: int):
+def _probe_url(url: str, timeout: int, requeue: bool = False):
     """Probe one URL. Returns (kind, detail) or None if it is healthy.
 
     Written the way it is because of a real miss: an earlier version of this
@@ -311,6 +471,10 @@ def _probe_url(url: str, timeout: int):
 
     Absence of a signal is never reported as a dead site. That is the whole
     point of the distinction.
+
+    With ``requeue``, a 429/503 ("slow down", not "gone") raises Throttled
+    carrying the Retry-After, so the caller can ask again later instead of
+    reporting it.
     """
     import socket
     import urllib.error
@@ -346,6 +510,10 @@ def _probe_url(url: str, timeout: int):
                     continue  # method not allowed; retry as GET
                 return ("org-url-dead", f"{url} -> HTTP {status}")
             except urllib.error.HTTPError as exc:
+                if requeue and exc.code in THROTTLE_STATUSES:
+                    wait = parse_retry_after(exc.headers.get("Retry-After") if exc.headers else None)
+                    if (wait or 0) <= MAX_RETRY_AFTER:
+                        raise Throttled(exc.code, wait) from None
                 if exc.code in (401, 403, 429):
                     return ("org-url-blocked", f"{url} -> HTTP {exc.code}")
                 if exc.code in (405, 501) and method == "HEAD":
@@ -374,9 +542,16 @@ def _probe_url(url: str, timeout: int):
 
 
 def check_org_urls(files, timeout: int) -> list[Finding]:
-    """Link rot defense. Off by default; needs network."""
-    out: list[Finding] = []
+    """Link rot defense. Off by default; needs network.
+
+    A URL answered 429/503 goes to the back of the queue and its host is
+    left alone for the Retry-After (or an exponential backoff); other hosts
+    are probed meanwhile. Only after MAX_ATTEMPTS is the 429/503 reported.
+    """
+    from urllib.parse import urlsplit
+
     seen: set[str] = set()
+    queue: deque = deque()
     for path in files:
         try:
             text = path.read_text(encoding="utf-8")
@@ -388,14 +563,35 @@ def check_org_urls(files, timeout: int) -> list[Finding]:
                 continue
             seen.add(url)
             line = text[: m.start()].count("\n") + 1
-            result = _probe_url(url, timeout)
-            if result:
-                kind, detail = result
-                out.append(
-                    Finding("advisory", kind, detail,
-                            str(path.relative_to(REPO_ROOT)), line)
-                )
-    return out
+            queue.append((len(queue), url, path, line, 0))
+
+    def host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    backoff = HostBackoff()
+    found: dict[int, Finding] = {}
+    while queue:
+        now = time.monotonic()
+        ready = next((i for i, item in enumerate(queue)
+                      if backoff.ready_at(host(item[1])) <= now), None)
+        if ready is None:
+            # Every queued URL is on a host that asked us to wait
+            time.sleep(min(backoff.ready_at(host(item[1])) for item in queue) - now)
+            continue
+        order, url, path, line, attempt = queue[ready]
+        del queue[ready]
+        try:
+            result = _probe_url(url, timeout, requeue=attempt + 1 < MAX_ATTEMPTS)
+        except Throttled as exc:
+            backoff.throttled(host(url), exc.retry_after, attempt)
+            queue.append((order, url, path, line, attempt + 1))
+            continue
+        if result:
+            kind, detail = result
+            found[order] = Finding("advisory", kind, detail,
+                                   str(path.relative_to(REPO_ROOT)), line)
+    # Report in document order, however often a URL was re-queued
+    return [found[order] for order in sorted(found)]
 
 
 def score(led: Ledger, blocking: int, advisory: int) -> int:
@@ -424,6 +620,9 @@ def main() -> int:
     ap.add_argument("--max-bare-domains", type=int, default=25,
                     help="cap bare-domain findings (0 disables the check)")
     ap.add_argument("--json", dest="json_out", help="write a JSON report here")
+    ap.add_argument("--history", nargs="?", const=str(HISTORY_PATH), metavar="PATH",
+                    help="append this run to the findings history database "
+                         "(see scripts/findings_history.py)")
     args = ap.parse_args()
 
     led = parse_ledger(LEDGER)
@@ -488,6 +687,22 @@ def main() -> int:
             encoding="utf-8",
         )
 
+    if args.history:
+        checked: dict[str, int] = {}
+        for p in files:
+            section = section_of(p.relative_to(REPO_ROOT).as_posix())
+            checked[section] = checked.get(section, 0) + 1
+        with FindingsHistory(args.history) as history:
+            history.record_run(
+                "check_claims",
+                # Claim findings have no separate target; the detail names the rule
+                [{**asdict(f), "target": f.detail} for f in findings],
+                checked=checked,
+                score=score(led, len(blocking), len(advisory)),
+                summary={"scanned": len(files), "blocking": len(blocking),
+                         "advisory": len(advisory)},
+            )
+
     if blocking:
         return 1
     if args.strict and advisory:
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Findings history: one SQLite file every validator appends its runs to.
+
+Each checker writes a throwaway report (link_validation_report.json,
+claim_report.json, stdout from check_accessibility.py, ...), so "when did this
+link break?" meant digging through old CI logs. With --history, a checker also
+appends its run here:
+
+  runs          one row per run: tool, time, commit, score
+  findings      what the run flagged, keyed by a line-independent fingerprint
+                (tool, kind, path, target) so an edit above a broken link does
+                not make it look new
+  section_stats per top-level section: items checked and items flagged
+  url_verdicts  per-URL pass/fail for tools that probe URLs
+
+Queries (also on the command line):
+
+  python3 scripts/findings_history.py first-broken [--tool link_validator]
+  python3 scripts/findings_history.py trend [--tool ...] [--section crisis]
+  python3 scripts/findings_history.py flapping [--runs 10] [--min-flips 2]
+
+The database is local state (gitignored); CI can cache it between runs.
+"""
+
+import argparse
+import json
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PATH = REPO_ROOT / '.findings_history.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    started REAL NOT NULL,
+    git_commit TEXT,
+    score REAL,
+    summary TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_tool ON runs (tool, started);
+
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    fingerprint TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    path TEXT,
+    line INTEGER,
+    target TEXT,
+    detail TEXT,
+    section TEXT
+);
+CREATE INDEX IF NOT EXISTS findings_run ON findings (run_id);
+CREATE INDEX IF NOT EXISTS findings_fingerprint ON findings (fingerprint, run_id);
+
+CREATE TABLE IF NOT EXISTS section_stats (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    section TEXT NOT NULL,
+    checked INTEGER NOT NULL,
+    flagged INTEGER NOT NULL,
+    PRIMARY KEY (run_id, section)
+);
+
+CREATE TABLE IF NOT EXISTS url_verdicts (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    url TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    error TEXT,
+    PRIMARY KEY (url, run_id)
+);
+"""
+
+
+def section_of(path):
+    """Top-level section of a repo-relative content path ('' for root pages)"""
+    path = str(path)
+    if path.startswith('./'):
+        path = path[2:]
+    return path.split('/', 1)[0] if '/' in path else ''
+
+
+def current_commit(cwd=REPO_ROOT):
+    try:
+        proc = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=cwd,
+                              capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip() or None
+
+
+class FindingsHistory:
+    """Append-only run history shared by the validators (SQLite, WAL)"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_run(self, tool, findings, checked=None, verdicts=None, score=None,
+                   summary=None, commit=None, started=None, flagged=None):
+        """Append one run; returns its id
+
+        ``findings`` are dicts with ``kind`` and optionally ``path``,
+        ``line``, ``target`` (what is broken: a URL, a rule) and ``detail``.
+        ``checked`` maps section -> items checked, for the per-section
+        health trend; ``flagged`` (section -> items flagged) defaults to the
+        number of findings, for tools that can flag one item many times.
+        ``verdicts`` maps URL -> (success, error).
+        """
+        started = time.time() if started is None else started
+        with self.db:
+            run_id = self.db.execute(
+                "INSERT INTO runs (tool, started, git_commit, score, summary) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (tool, started, commit if commit is not None else current_commit(),
+                 score, json.dumps(summary) if summary is not None else None)
+            ).lastrowid
+
+            counted = {}
+            rows = []
+            for f in findings:
+                path = f.get('path') or ''
+                section = f.get('section', section_of(path))
+                target = f.get('target') or ''
+                fingerprint = '\x1f'.join((tool, f['kind'], path, target))
+                rows.append((run_id, fingerprint, f['kind'], path, f.get('line'),
+                             target, f.get('detail'), section))
+                counted[section] = counted.get(section, 0) + 1
+            self.db.executemany(
+                "INSERT INTO findings (run_id, fingerprint, kind, path, line, target, "
+                "detail, section) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+            if checked is not None:
+                flagged = counted if flagged is None else flagged
+                self.db.executemany(
+                    "INSERT INTO section_stats (run_id, section, checked, flagged) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(run_id, section, count, flagged.get(section, 0))
+                     for section, count in checked.items()]
+                )
+
+            if verdicts:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO url_verdicts (run_id, url, success, error) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(run_id, url, 1 if ok else 0, error)
+                     for url, (ok, error) in verdicts.items()]
+                )
+        return run_id
+
+    def latest_run(self, tool):
+        return self.db.execute(
+            "SELECT * FROM runs WHERE tool = ? ORDER BY started DESC, id DESC LIMIT 1", (tool,)
+        ).fetchone()
+
+    def first_seen_broken(self, tool):
+        """Findings of the tool's latest run, with when each started failing
+
+        "Started" is the first run of the current streak: a link that was
+        fixed and broke again dates from the second breakage.
+        """
+        latest = self.latest_run(tool)
+        if latest is None:
+            return []
+        return [dict(row) for row in self.db.execute(
+            """
+            SELECT f.kind, f.path, MIN(f.line) AS line, f.target, f.detail,
+                   (SELECT MIN(r.started) FROM runs r JOIN findings p ON p.run_id = r.id
+                     WHERE p.fingerprint = f.fingerprint AND r.tool = :tool
+                       AND r.started > COALESCE((
+                           SELECT MAX(c.started) FROM runs c
+                            WHERE c.tool = :tool AND c.started < :now
+                              AND NOT EXISTS (SELECT 1 FROM findings x
+                                               WHERE x.run_id = c.id
+                                                 AND x.fingerprint = f.fingerprint)
+                       ), 0)) AS first_seen
+              FROM findings f
+             WHERE f.run_id = :run
+             GROUP BY f.fingerprint
+             ORDER BY first_seen, f.path, line
+            """,
+            {'tool': tool, 'run': latest['id'], 'now': latest['started']}
+        )]
+
+    def health_trend(self, tool, section=None, limit=30):
+        """(started, section, health) per run, oldest first
+
+        Health is the share of checked items not flagged, 0-100. Without a
+        section, all sections of a run are pooled.
+        """
+        where, params = "r.tool = ?", [tool]
+        if section is not None:
+            where += " AND s.section = ?"
+            params.append(section)
+        rows = self.db.execute(
+            f"""
+            SELECT * FROM (
+                SELECT r.id, r.started, SUM(s.checked) AS checked, SUM(s.flagged) AS flagged
+                  FROM runs r JOIN section_stats s ON s.run_id = r.id
+                 WHERE {where}
+                 GROUP BY r.id ORDER BY r.started DESC LIMIT ?
+            ) ORDER BY started
+            """, params + [limit]
+        ).fetchall()
+        return [
+            (row['started'], section,
+             100.0 if not row['checked'] else
+             round(100 * (row['checked'] - row['flagged']) / row['checked'], 1))
+            for row in rows
+        ]
+
+    def flapping_urls(self, runs=10, min_flips=2):
+        """URLs whose verdict changed at least min_flips times in the last N runs"""
+        return [dict(row) for row in self.db.execute(
+            """
+            WITH recent AS (
+                SELECT id FROM runs
+                 WHERE id IN (SELECT DISTINCT run_id FROM url_verdicts)
+                 ORDER BY started DESC LIMIT ?
+            ), seq AS (
+                SELECT v.url, v.success, v.error, v.run_id,
+                       LAG(v.success) OVER (PARTITION BY v.url ORDER BY v.run_id) AS prev
+                  FROM url_verdicts v JOIN recent ON recent.id = v.run_id
+            )
+            SELECT url, SUM(prev IS NOT NULL AND prev != success) AS flips,
+                   COUNT(*) AS checks, SUM(success) AS passes
+              FROM seq GROUP BY url HAVING flips >= ?
+             ORDER BY flips DESC, url
+            """, (runs, min_flips)
+        )]
+
+
+def _when(ts):
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Query the validators' findings history")
+    ap.add_argument('--db', default=str(DEFAULT_PATH), help='history database')
+    sub = ap.add_subparsers(dest='query', required=True)
+    first = sub.add_parser('first-broken', help="when each current finding started")
+    first.add_argument('--tool', default='link_validator')
+    trend = sub.add_parser('trend', help='health score per run')
+    trend.add_argument('--tool', default='link_validator')
+    trend.add_argument('--section')
+    trend.add_argument('--limit', type=int, default=30)
+    flap = sub.add_parser('flapping', help='URLs that keep changing verdict')
+    flap.add_argument('--runs', type=int, default=10)
+    flap.add_argument('--min-flips', type=int, default=2)
+    args = ap.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"No history at {args.db} - run a validator with --history first")
+        return 1
+    with FindingsHistory(args.db) as history:
+        if args.query == 'first-broken':
+            for row in history.first_seen_broken(args.tool):
+                loc = f"{row['path']}:{row['line']}" if row['line'] else row['path']
+                print(f"{_when(row['first_seen'])}  {row['kind']}  {loc}  {row['target']}")
+        elif args.query == 'trend':
+            for started, _, health in history.health_trend(args.tool, args.section, args.limit):
+                print(f"{_when(started)}  {health:5.1f}")
+        else:
+            for row in history.flapping_urls(args.runs, args.min_flips):
+                print(f"{row['flips']} flips ({row['passes']}/{row['checks']} ok)  {row['url']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Heading-slug index: which #fragments each page actually has.
+
+A deep link like /rights/us/ada#title-ii only works if the ADA page renders a
+heading whose id is `title-ii`. Screen reader users jump straight to that
+section; when the heading is renamed the link silently lands at the top of a
+long page instead. The link validators strip the fragment before checking the
+page exists, so nothing caught this.
+
+Ids are computed the way the site renderer computes them (Astro's heading ids,
+which use github-slugger on the heading's text):
+
+  - lowercase; drop everything that is not a letter, digit, mark, `_`, `-` or
+    a plain space; spaces become `-`
+  - a repeated slug on one page gets `-1`, `-2`, ... in document order
+  - the page's leading `# Title` is stripped at build time
+    (site/src/remark-strip-h1.mjs), so it has no id
+  - `{#custom-id}` is NOT special: the renderer slugs it as heading text
+  - Starlight gives every page a `_top` anchor
+
+Raw HTML `id="..."`/`name="..."` attributes count as anchors too.
+
+Run: python3 scripts/heading_index.py path/to/page.md   (prints its anchors)
+"""
+
+import html
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from urllib.parse import unquote
+
+# Anchors every rendered page has regardless of content.
+BUILTIN_ANCHORS = frozenset({'_top'})
+
+ATX_HEADING = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+SETEXT_UNDERLINE = re.compile(r'^ {0,3}(=+|-+)[ \t]*$')
+FENCE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+HTML_ID = re.compile(r'<[a-zA-Z][^>]*?\s(?:id|name)=["\']([^"\']+)["\']')
+
+# Lines that cannot be the text of a setext heading (block starts).
+NOT_PARAGRAPH = re.compile(r'^ {0,3}(?:[#>|*+-]|\d+[.)]\s|<)')
+
+IMAGE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+LINK = re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])')
+CODE = re.compile(r'`+([^`]*)`+')
+TAG = re.compile(r'<[^>]+>')
+ESCAPE = re.compile(r'\\([!-/:-@\[-`{-~])')
+EMPHASIS_UNDERSCORE = re.compile(r'(?<![^\W_])_+|_+(?![^\W_])')
+
+
+def slugify(text):
+    """github-slugger's slug() for one heading's plain text"""
+    kept = []
+    for ch in text.lower():
+        if ch == ' ' or ch == '-' or ch == '_':
+            kept.append(ch)
+        elif unicodedata.category(ch)[0] in 'LMN':
+            kept.append(ch)
+    return ''.join(kept).replace(' ', '-')
+
+
+def heading_text(inline):
+    """Plain text of a heading's inline markdown, as the renderer sees it"""
+    text = IMAGE.sub('', inline)
+    text = LINK.sub(r'\1', text)
+    text = CODE.sub(r'\1', text)
+    text = TAG.sub('', text)
+    text = EMPHASIS_UNDERSCORE.sub('', text)
+    text = text.replace('*', '')
+    text = ESCAPE.sub(r'\1', text)
+    return html.unescape(text).strip()
+
+
+def strip_frontmatter(content):
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) == 3:
+            return parts[2]
+    return content
+
+
+def heading_slugs(content):
+    """Every anchor id a page renders, from its markdown source"""
+    lines = strip_frontmatter(content).split('\n')
+    headings = []  # (level, inline text, is the page's first block)
+    fence = None
+    blocks = 0     # non-blank lines seen so far
+    prev = ''      # previous line, if it could be a setext heading's text
+    for line in lines:
+        if fence:
+            if line.strip().startswith(fence):
+                fence = None
+        elif FENCE.match(line):
+            fence = FENCE.match(line).group(1)[:3]
+        elif ATX_HEADING.match(line):
+            m = ATX_HEADING.match(line)
+            headings.append((len(m.group(1)), m.group(2) or '', blocks == 0))
+        elif (SETEXT_UNDERLINE.match(line) and prev.strip()
+                and not NOT_PARAGRAPH.match(prev)):
+            level = 1 if line.strip()[0] == '=' else 2
+            headings.append((level, prev.strip(), blocks == 1))
+            prev = ''
+            continue
+        else:
+            if line.strip():
+                blocks += 1
+            prev = line
+            continue
+        blocks += 1
+        prev = ''
+
+    slugs = set(BUILTIN_ANCHORS)
+    seen = {}
+    for level, inline, is_first in headings:
+        if level == 1 and is_first:
+            continue  # stripped by remark-strip-h1 before ids are assigned
+        base = slugify(heading_text(inline))
+        slug = base
+        while slug in seen:
+            seen[base] += 1
+            slug = f"{base}-{seen[base]}"
+        seen[slug] = 0
+        slugs.add(slug)
+
+    slugs.update(HTML_ID.findall(content))
+    return frozenset(slugs)
+
+
+class HeadingIndex:
+    """Per-page anchor sets, parsed once per page and looked up in O(1)
+
+    Keys are page paths relative to ``root``. Pages can be seeded with
+    content the caller has already read (add) to avoid a second read;
+    anything else is read on first lookup. forget() drops a page whose
+    content changed.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.pages = {}
+
+    def add(self, page, content):
+        self.pages[page] = heading_slugs(content)
+        return self.pages[page]
+
+    def forget(self, page):
+        self.pages.pop(page, None)
+
+    def anchors(self, page):
+        """The page's anchor set, or None if it cannot be read"""
+        if page not in self.pages:
+            try:
+                content = (self.root / page).read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                return None
+            self.add(page, content)
+        return self.pages[page]
+
+    def has_anchor(self, page, fragment):
+        """True if the page renders this #fragment (or cannot be read)"""
+        anchors = self.anchors(page)
+        return anchors is None or fragment in anchors
+
+
+def split_fragment(url):
+    """('path', 'fragment') for a link URL; fragment is '' when absent"""
+    path, _, fragment = url.partition('#')
+    return path, unquote(fragment)
+
+
+if __name__ == '__main__':
+    for arg in sys.argv[1:]:
+        print(f"{arg}:")
+        for slug in sorted(heading_slugs(Path(arg).read_text(encoding='utf-8'))):
+            print(f"  #{slug}")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""The site's internal link graph: backlinks, orphans, reachability, centrality.
+
+validate_wiki_links.py resolves every internal link on every published page
+and used to throw the result away. With --graph it hands the resolved links
+to LinkGraph, which keeps them as a sparse adjacency structure (compressed
+sparse rows: one offsets array, one targets array, page ids for nodes) and
+computes:
+
+  backlinks    how many pages link to each page (the reverse CSR)
+  orphans      pages no other page links to and the sidebar doesn't list
+  depth        clicks from the sidebar: a page in docs/migration/nav-export.json
+               is 1 click away, a page it links to 2, ...; Starlight shows the
+               same sidebar in every locale, so a sidebar page's translation
+               counts as listed too
+  centrality   PageRank over the link graph, leaving out links to pages that
+               most pages link to (the "how to contribute" footer), which
+               would otherwise outrank every real hub
+
+The JSON is compact and index-based (every per-page list is aligned with
+"pages"), so a tool loads it with one json.load and no graph rebuild:
+
+  python3 scripts/validate_wiki_links.py --graph             # writes link_graph.json
+  python3 scripts/link_graph.py                              # summary of link_graph.json
+  python3 scripts/link_graph.py --backlinks rights/us/ada.md --clicks 2
+"""
+
+import argparse
+import json
+import sys
+from array import array
+from collections import deque
+from pathlib import Path
+
+from route_manifest import LOCALES, REPO_ROOT
+
+NAV_EXPORT = Path('docs/migration/nav-export.json')
+DEFAULT_PATH = REPO_ROOT / 'link_graph.json'
+
+# Pages deeper than this many clicks from the sidebar are reported
+MAX_CLICKS = 3
+
+# Pages linked from more than this share of pages are site furniture: their
+# backlinks count, but links to them don't feed centrality
+FURNITURE_SHARE = 0.25
+
+# PageRank
+DAMPING = 0.85
+TOLERANCE = 1e-8
+MAX_ITERATIONS = 100
+
+
+def nav_targets(path):
+    """Link targets of the Wiki.js navigation export, in sidebar order
+
+    Routes as exported (/en/home, /en/benefits/index); a missing or
+    unreadable file gives none.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            tree = json.load(f)['data']['navigation']['tree']
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    return [item['target'] for locale in tree for item in locale.get('items', ())
+            if item.get('kind') == 'link' and item.get('target')]
+
+
+class LinkGraph:
+    """Pages and the links between them, as compressed sparse rows
+
+    ``pages`` are page files; ``offsets[i]:offsets[i + 1]`` is the slice of
+    ``targets`` holding the ids page i links to (each once, no self-links).
+    """
+
+    def __init__(self, pages, offsets, targets):
+        self.pages = list(pages)
+        self.ids = {page: i for i, page in enumerate(self.pages)}
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_links(cls, pages, links):
+        """From page files and (source file, target file) pairs; targets
+        that aren't in ``pages`` are added as nodes"""
+        pages = list(dict.fromkeys(pages))
+        ids = {page: i for i, page in enumerate(pages)}
+        out = [set() for _ in pages]
+        for source, target in links:
+            for page in (source, target):
+                if page not in ids:
+                    ids[page] = len(pages)
+                    pages.append(page)
+                    out.append(set())
+            if source != target:
+                out[ids[source]].add(ids[target])
+        offsets, targets = array('I', [0]), array('I')
+        for row in out:
+            targets.extend(sorted(row))
+            offsets.append(len(targets))
+        return cls(pages, offsets, targets)
+
+    def __len__(self):
+        return len(self.pages)
+
+    def links_from(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def reverse(self):
+        """The backlink graph: the same pages, every edge turned around"""
+        counts = [0] * (len(self) + 1)
+        for t in self.targets:
+            counts[t + 1] += 1
+        for i in range(len(self)):
+            counts[i + 1] += counts[i]
+        offsets = array('I', counts)
+        fill = list(counts[:-1])
+        sources = array('I', bytes(4 * len(self.targets)))
+        for i in range(len(self)):
+            for t in self.links_from(i):
+                sources[fill[t]] = i
+                fill[t] += 1
+        return LinkGraph(self.pages, offsets, sources)
+
+    def in_degrees(self):
+        degrees = [0] * len(self)
+        for t in self.targets:
+            degrees[t] += 1
+        return degrees
+
+    def depths(self, seeds):
+        """Clicks from the sidebar per page (seed pages are 1), None if no
+        path reaches it; breadth first over the links"""
+        depth = [None] * len(self)
+        queue = deque()
+        for i in seeds:
+            if depth[i] is None:
+                depth[i] = 1
+                queue.append(i)
+        while queue:
+            i = queue.popleft()
+            for t in self.links_from(i):
+                if depth[t] is None:
+                    depth[t] = depth[i] + 1
+                    queue.append(t)
+        return depth
+
+    def pagerank(self, skip=frozenset()):
+        """PageRank per page, ignoring links to the ``skip`` ids; a page
+        without links shares its rank evenly"""
+        n = len(self)
+        if not n:
+            return []
+        rows = [[t for t in self.links_from(i) if t not in skip] for i in range(n)]
+        rank = [1.0 / n] * n
+        out_degree = [len(row) for row in rows]
+        for _ in range(MAX_ITERATIONS):
+            dangling = sum(r for r, d in zip(rank, out_degree) if not d)
+            base = (1 - DAMPING) / n + DAMPING * dangling / n
+            new = [base] * n
+            for i in range(n):
+                if out_degree[i]:
+                    share = DAMPING * rank[i] / out_degree[i]
+                    for t in rows[i]:
+                        new[t] += share
+            delta = sum(abs(a - b) for a, b in zip(new, rank))
+            rank = new
+            if delta < TOLERANCE:
+                break
+        return rank
+
+    def analyse(self, nav_pages=(), published=None, max_clicks=MAX_CLICKS):
+        """The report document (see save()): ``nav_pages`` are the page
+        files the sidebar lists; orphans and depth are reported for
+        ``published`` pages only (default: every page)"""
+        nav = sorted({self.ids[p] for p in nav_pages if p in self.ids})
+        report_on = (range(len(self)) if published is None
+                     else sorted(self.ids[p] for p in published if p in self.ids))
+        in_degree = self.in_degrees()
+        depth = self.depths(nav)
+        furniture = {i for i, d in enumerate(in_degree) if d > FURNITURE_SHARE * len(report_on)}
+        rank = self.pagerank(skip=furniture)
+        nav_set = set(nav)
+        return {
+            'version': 1,
+            'max_clicks': max_clicks,
+            'pages': self.pages,
+            'offsets': list(self.offsets),
+            'targets': list(self.targets),
+            'backlinks': in_degree,
+            'depth': depth,
+            'centrality': [round(r * len(self), 4) for r in rank],
+            'nav': nav,
+            'published': list(report_on),
+            'orphans': [i for i in report_on if not in_degree[i] and i not in nav_set],
+            'unreachable': [i for i in report_on
+                            if depth[i] is None or depth[i] > max_clicks],
+        }
+
+    @classmethod
+    def load(cls, path):
+        """(graph, report document) from a file written by save()"""
+        with open(path, encoding='utf-8') as f:
+            doc = json.load(f)
+        return cls(doc['pages'], array('I', doc['offsets']), array('I', doc['targets'])), doc
+
+    @staticmethod
+    def save(doc, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(doc, f, separators=(',', ':'), ensure_ascii=False)
+
+
+def nav_pages(resolve, nav_file):
+    """Page files the sidebar lists, in every locale
+
+    ``resolve`` maps a link path to a page file (RouteManifest.resolve).
+    """
+    pages = set()
+    for target in nav_targets(nav_file):
+        page = resolve(target.split('#', 1)[0])
+        if page is None:
+            continue
+        pages.add(page)
+        for locale in LOCALES:
+            translated = resolve(f"{locale}/{page[:-3]}")
+            if translated is not None:
+                pages.add(translated)
+    return pages
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Query a saved link graph')
+    ap.add_argument('graph', nargs='?', default=str(DEFAULT_PATH),
+                    help='written by validate_wiki_links.py --graph (default: link_graph.json)')
+    ap.add_argument('--top', type=int, default=10, help='how many central pages to list')
+    ap.add_argument('--clicks', type=int, help='list pages deeper than this (default: as saved)')
+    ap.add_argument('--backlinks', metavar='PAGE', help='list the pages linking to PAGE')
+    args = ap.parse_args()
+
+    try:
+        graph, doc = LinkGraph.load(args.graph)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read {args.graph}: {e}\nRun: python3 scripts/validate_wiki_links.py --graph")
+        return 1
+    pages, depth = doc['pages'], doc['depth']
+
+    if args.backlinks:
+        i = graph.ids.get(args.backlinks)
+        if i is None:
+            print(f"{args.backlinks}: not in the graph")
+            return 1
+        sources = graph.reverse().links_from(i)
+        print(f"{len(sources)} page(s) link to {args.backlinks}:")
+        for source in sources:
+            print(f"  {pages[source]}")
+        return 0
+
+    clicks = doc['max_clicks'] if args.clicks is None else args.clicks
+    deep = [i for i in doc['published'] if depth[i] is None or depth[i] > clicks]
+    print(f"{len(pages)} pages, {len(doc['targets'])} links, {len(doc['nav'])} in the sidebar")
+    print("\nMost central (PageRank x pages):")
+    for i in sorted(range(len(pages)), key=lambda i: -doc['centrality'][i])[:args.top]:
+        print(f"  {doc['centrality'][i]:7.2f}  {pages[i]} ({doc['backlinks'][i]} backlinks)")
+    print(f"\nOrphans (no backlinks, not in the sidebar): {len(doc['orphans'])}")
+    for i in doc['orphans'][:args.top]:
+        print(f"  {pages[i]}")
+    print(f"\nMore than {clicks} click(s) from the sidebar, or unreachable: {len(deep)}")
+    for i in deep[:args.top]:
+        print(f"  {pages[i]} ({'unreachable' if depth[i] is None else f'{depth[i]} clicks'})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
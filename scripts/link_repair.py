@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Repair suggestions for broken internal links: the page a link probably meant.
+
+Both validators used to stop at "No file found". Most broken links are a
+page that moved, or a slug remembered slightly wrong
+(/history/accommodations-history for /history/accommodations), and the
+2026-06-07 triage (docs/broken-links-triage-2026-06-07.md) matched them to
+the right page by hand. RepairIndex does that lookup:
+
+  1. git rename history: a link to a file's old path suggests where the file
+     lives now (chains of renames followed to the end)
+  2. a trigram index over the last path segment of every page route; a
+     broken link only meets the routes sharing a trigram with it, never the
+     whole route set
+  3. the nearest existing parent section (/rights/understanding-your-rights
+     -> /rights)
+
+Candidates are ranked by slug similarity, how much of the directory they
+share with the link, and how well the link text matches the page's title
+(or slug). Only pages in the link's own locale are suggested.
+
+  python3 scripts/link_repair.py /history/accommodations-history /about
+"""
+
+import argparse
+import re
+import sys
+from collections import Counter
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from link_suggestions import page_route
+from rename_redirects import collapse, git_renames
+from route_manifest import REPO_ROOT, RouteManifest, locale_of, normalise_route
+
+# Suggestions per broken link at most
+MAX_SUGGESTIONS = 3
+
+# Below this score a candidate is a guess, not a suggestion
+MIN_SCORE = 0.45
+
+# Trigram candidates re-ranked per broken link
+SHORTLIST = 25
+
+# Score weights: slug similarity, shared directory, link text vs title
+WEIGHTS = (0.55, 0.2, 0.25)
+
+# Words that say nothing about which page is meant
+STOPWORDS = {'a', 'an', 'and', 'the', 'of', 'for', 'to', 'in', 'on', 'your', 'our',
+             'with', 'about', 'page', 'guide', 'see', 'read', 'more', 'here',
+             'y', 'de', 'la', 'el', 'los', 'las', 'en', 'para', 'su', 'sus'}
+
+WORD = re.compile(r'[a-z0-9]+')
+
+
+def words(text):
+    return {w for w in WORD.findall(text.lower()) if w not in STOPWORDS}
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def slug_of(route):
+    return route.rsplit('/', 1)[-1]
+
+
+def flat_tail(route):
+    """The last two segments as one slug: benefits/us/ssdi -> us-ssdi"""
+    return '-'.join(route.split('/')[-2:])
+
+
+class RepairIndex:
+    """Page routes indexed for "which page did this broken link mean?"
+
+    ``manifest`` is a RouteManifest; ``renames`` are (old file, new file)
+    pairs, oldest first (git_renames); ``titles`` maps page files to their
+    titles, used to score the link text. With ``pages``, only those page
+    files are suggested (e.g. published pages); by default every page in the
+    manifest is.
+    """
+
+    def __init__(self, manifest, renames=(), titles=None, pages=None):
+        self.manifest = manifest
+        self.titles = titles or {}
+        if pages is None:
+            pages = manifest.pages()
+        self.routes = sorted({page_route(f) for f in pages if f.endswith('.md')})
+        self.grams = {}
+        for i, route in enumerate(self.routes):
+            # us-ssdi should find us/ssdi as well as */ssdi
+            for gram in trigrams(slug_of(route)) | trigrams(flat_tail(route)):
+                self.grams.setdefault(gram, []).append(i)
+        self.moved = collapse(renames, manifest)
+
+    @classmethod
+    def build(cls, root, manifest=None, titles=None, pages=None):
+        """With git rename history from ``root`` (one ``git log``)"""
+        root = Path(root)
+        if manifest is None:
+            manifest = RouteManifest.build(root)
+        return cls(manifest, git_renames(root), titles, pages)
+
+    def suggest(self, path, text=''):
+        """[(route, score, reason)] for a broken link path, best first"""
+        target = normalise_route(path)
+        if target.endswith('.md'):
+            target = target[:-3]
+        target = page_route(target + '.md') if target else target
+        if target in self.moved:
+            return [(self.moved[target], 1.0, 'renamed')]
+
+        locale = locale_of(target)
+        slug = slug_of(target)
+        shared = Counter()
+        for gram in trigrams(slug):
+            shared.update(self.grams.get(gram, ()))
+        candidates = {self.routes[i]: 'similar' for i, _ in shared.most_common(SHORTLIST)}
+        parent = self._parent(target)
+        if parent is not None:
+            candidates.setdefault(parent, 'section')
+
+        text_words = words(text)
+        ranked = []
+        for route, reason in candidates.items():
+            if route == target or locale_of(route) != locale:
+                continue
+            score = self._score(target, route, route == parent, text_words)
+            if score >= MIN_SCORE:
+                ranked.append((route, round(score, 2), reason))
+        ranked.sort(key=lambda r: (-r[1], r[0]))
+        return ranked[:MAX_SUGGESTIONS]
+
+    def _parent(self, target):
+        parts = target.split('/')[:-1]
+        while parts:
+            page = self.manifest.resolve('/'.join(parts))
+            if page is not None:
+                return page_route(page)
+            parts.pop()
+        return None
+
+    def _score(self, target, route, is_parent, text_words):
+        target_dirs = target.split('/')[:-1]
+        # A parent section is scored as the directory it is the index of
+        route_dirs = route.split('/') if is_parent else route.split('/')[:-1]
+        common = 0
+        for a, b in zip(target_dirs, route_dirs):
+            if a != b:
+                break
+            common += 1
+        # The slug against the route's slug, and against the route below the
+        # directory they share, flattened (us-ssdi vs us/ssdi)
+        slug = slug_of(target)
+        below = '-'.join(route.split('/')[common:])
+        slug_sim = max(SequenceMatcher(None, slug, slug_of(route)).ratio(),
+                       SequenceMatcher(None, slug, below).ratio() if below else 0.0)
+        dir_sim = common / max(len(target_dirs), len(route_dirs), 1)
+        if not target_dirs and not route_dirs:
+            dir_sim = 1.0
+        page = self.manifest.resolve(route)
+        page_words = words(self.titles.get(page, '')) | words(slug_of(route))
+        want = text_words or words(slug_of(target))
+        text_sim = len(want & page_words) / len(want | page_words) if want and page_words else 0.0
+        w_slug, w_dir, w_text = WEIGHTS
+        return w_slug * slug_sim + w_dir * dir_sim + w_text * text_sim
+
+
+def format_suggestions(suggestions):
+    """'/a (renamed), /b (0.71)' for a report line"""
+    return ', '.join(f"/{route} ({'renamed' if reason == 'renamed' else score})"
+                     for route, score, reason in suggestions)
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Suggest the page a broken internal link meant')
+    ap.add_argument('paths', nargs='+', metavar='PATH', help='broken link paths, e.g. /about')
+    ap.add_argument('--root', default=str(REPO_ROOT), help='content root (default: repo root)')
+    args = ap.parse_args()
+
+    index = RepairIndex.build(args.root)
+    for path in args.paths:
+        print(f"{path} -> {format_suggestions(index.suggest(path)) or 'no suggestion'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Internal-link suggestions: where a page mentions another page but doesn't link it.
+
+validate_wiki_links.py used to look for 11 hard-coded keywords with a
+substring test, so "ada" matched "Adaptive" and "canada", and nothing outside
+the list was ever suggested. This builds one multi-pattern matcher from
+
+  - every published page's title (and `aliases:` in its frontmatter)
+  - the glossary's terms (glossary/terminology.md) and acronyms
+    (glossary/acronyms.md, full term and short form)
+  - a few curated topic aliases (TOPIC_ALIASES)
+
+and scans each page body once. The matcher is Aho-Corasick over word tokens
+rather than characters: a body is split into words and punctuation by one
+regex (C speed), and the automaton steps once per token, so matches always
+fall on word boundaries and a 7 MB corpus is one pass of ~1.5M steps.
+
+A suggestion is only made for text that is not already a link, code, a
+heading or a URL; never to the page itself, or to a page it already links
+to; once per target per page. Patterns carry a locale, and a page only gets
+suggestions in its own locale. All-caps acronyms (ADA, SSI) match
+case-sensitively so "Ada" and "ssi" in prose don't count.
+"""
+
+import re
+from collections import deque
+
+# Curated aliases kept from the original keyword list: topics whose page
+# title doesn't say what people write in prose
+TOPIC_ALIASES = {
+    'SSDI': 'benefits/us/ssdi',
+    'social security': 'benefits/us',
+    'disability rights': 'rights',
+    'ADA': 'rights/us/ada',
+    'Medicaid': 'benefits/us/medicaid',
+    'Medicare': 'benefits/us/medicare',
+    'mental health': 'conditions',
+}
+
+# Titles too generic to suggest on sight
+GENERIC_TITLES = {'home', 'overview', 'introduction', 'resources', 'faq', 'about',
+                  'contact us', 'glossary', 'index', 'inicio', 'recursos', 'contáctanos'}
+
+MIN_TERM_LENGTH = 3
+
+# Suggestions listed per page at most, in document order
+MAX_PER_PAGE = 10
+
+TOKEN = re.compile(r"\w+(?:['’]\w+)*|[^\w\s]")
+
+# Spans that are already links or are not prose: blanked before scanning
+NOT_PROSE = re.compile(
+    r'```.*?```|~~~.*?~~~'                # fenced code
+    r'|`[^`\n]*`'                         # inline code
+    r'|!?\[[^\]]*\]\([^)]*\)'             # [linked text](url), images
+    r'|\[[^\]]*\]\[[^\]]*\]'              # [reference][links]
+    r'|<a\b.*?</a>|<[^>]+>'              # HTML links and tags
+    r'|https?://\S+'                      # bare URLs
+    r'|^ {0,3}#{1,6}[ \t][^\n]*'          # headings
+    r'|^\|?[ \t]*:?-{3,}[^\n]*',          # table rules
+    re.DOTALL | re.MULTILINE
+)
+
+GLOSSARY_TERM = re.compile(r'^\s*[-*]\s+\*\*([^*]+)\*\*', re.MULTILINE)
+ACRONYM_ROW = re.compile(r'^\|\s*([A-Z][A-Za-z0-9&/.-]*)\s*\|\s*([^|]+?)\s*\|', re.MULTILINE)
+PARENTHETICAL = re.compile(r'^(.*?)\s*\(([^)]+)\)\s*$')
+
+
+def tokens(text):
+    return TOKEN.findall(text)
+
+
+def is_acronym(term):
+    return term.isupper() and len(term) <= 6
+
+
+def glossary_terms(text):
+    """Terms defined in glossary/terminology.md, with any (ACRONYM) split off"""
+    terms = []
+    for term in GLOSSARY_TERM.findall(text):
+        term = term.strip()
+        m = PARENTHETICAL.match(term)
+        if m:
+            terms.extend([m.group(1), m.group(2)])
+        else:
+            terms.append(term)
+    return terms
+
+
+def acronym_terms(text):
+    """(acronym, full term) rows of the table in glossary/acronyms.md"""
+    return [(short, full) for short, full in ACRONYM_ROW.findall(text)
+            if short.lower() != 'acronym' and not set(full) <= set('-: ')]
+
+
+def page_route(file):
+    """The canonical route of a page file (no .md, no /index)"""
+    route = file[:-3] if file.endswith('.md') else file
+    if route == 'index':
+        return ''
+    return route[:-len('/index')] if route.endswith('/index') else route
+
+
+def locale_of_route(route, locales):
+    first = route.split('/', 1)[0]
+    return first if first in locales else None
+
+
+class TokenAutomaton:
+    """Aho-Corasick over tokens: find every pattern in one pass over a text
+
+    Patterns are token tuples (lowercased). ``scan`` yields (first token
+    index, token count, pattern id) for every occurrence, overlapping ones
+    included.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        self.lengths = []
+
+    def add(self, pattern_tokens):
+        state = 0
+        for tok in pattern_tokens:
+            nxt = self.goto[state].get(tok)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][tok] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        pattern_id = len(self.lengths)
+        self.lengths.append(len(pattern_tokens))
+        self.out[state].append(pattern_id)
+        return pattern_id
+
+    def finish(self):
+        """Compute failure links (breadth first); call once after adding"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and tok not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(tok, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def scan(self, toks):
+        goto, fail, out, lengths = self.goto, self.fail, self.out, self.lengths
+        state = 0
+        for i, tok in enumerate(toks):
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            for pattern_id in out[state]:
+                n = lengths[pattern_id]
+                yield i - n + 1, n, pattern_id
+
+
+class LinkSuggester:
+    """Page titles, glossary terms and aliases -> the page to link them to"""
+
+    def __init__(self, locales=('es',), default_locale='en'):
+        self.locales = tuple(locales)
+        self.default_locale = default_locale
+        self.automaton = TokenAutomaton()
+        self.patterns = []      # id -> (original tokens or None, route, locale)
+        self.seen = {}          # (lowered tokens, locale) -> id, or None if ambiguous
+
+    def add(self, term, route, title=False):
+        """Suggest ``route`` wherever ``term`` appears (in the route's locale)
+
+        The first source to claim a term keeps it, except that two page
+        titles claiming one term cancel out.
+        """
+        term = term.strip().strip('"\'')
+        if len(term) < MIN_TERM_LENGTH and not is_acronym(term):
+            return
+        if term.lower() in GENERIC_TITLES:
+            return
+        toks = tokens(term)
+        if not toks:
+            return
+        locale = locale_of_route(route, self.locales) or self.default_locale
+        key = (tuple(t.lower() for t in toks), locale)
+        if key in self.seen:
+            known = self.seen[key]
+            if title and known is not None and self.patterns[known][1] != route:
+                # Two pages claim this title: suggesting either would be a guess
+                self.patterns[known] = (self.patterns[known][0], None, locale)
+                self.seen[key] = None
+            return
+        pattern_id = self.automaton.add(key[0])
+        self.patterns.append((tuple(toks) if is_acronym(term) else None, route, locale))
+        self.seen[key] = pattern_id
+
+    @classmethod
+    def build(cls, pages, glossary='', acronyms='', locales=('es',), default_locale='en'):
+        """From (file, frontmatter) pairs and the glossary pages' text
+
+        Titles and aliases go in first, so a glossary term with its own page
+        links to that page rather than to the glossary.
+        """
+        suggester = cls(locales, default_locale)
+        by_title = {}
+        for file, frontmatter in pages:
+            route = page_route(file)
+            title = frontmatter.get('title', '').strip().strip('"\'')
+            if title:
+                # "Supplemental Security Income (SSI)": the title and its
+                # short form, each on its own
+                m = PARENTHETICAL.match(title)
+                for name in (title, m.group(1), m.group(2)) if m else (title,):
+                    suggester.add(name, route, title=True)
+                    by_title.setdefault(name.lower(), route)
+            for alias in re.split(r'[,\[\]]', frontmatter.get('aliases', '')):
+                if alias.strip():
+                    suggester.add(alias, route)
+        for term, route in TOPIC_ALIASES.items():
+            suggester.add(term, route)
+        for term in glossary_terms(glossary):
+            suggester.add(term, by_title.get(term.lower(), 'glossary/terminology'))
+        for short, full in acronym_terms(acronyms):
+            route = by_title.get(full.lower(), 'glossary/acronyms')
+            suggester.add(full, route)
+            suggester.add(short, route)
+        suggester.automaton.finish()
+        return suggester
+
+    def suggest(self, body, file, linked=()):
+        """[(text, route)] for one page body, in document order
+
+        ``linked`` holds the routes the page already links to.
+        """
+        own = page_route(file)
+        locale = locale_of_route(own, self.locales) or self.default_locale
+        # Blank non-prose spans in place (keeping offsets), with a '|' so no
+        # match runs across one
+        prose = NOT_PROSE.sub(lambda m: '|' + ' ' * (len(m.group()) - 1), body)
+        spans = [(m.start(), m.end()) for m in TOKEN.finditer(prose)]
+        toks = [prose[a:b] for a, b in spans]
+        lowered = [t.lower() for t in toks]
+
+        # Leftmost-longest, non-overlapping
+        matches = {}
+        for start, length, pattern_id in self.automaton.scan(lowered):
+            exact, route, pattern_locale = self.patterns[pattern_id]
+            if route is None or pattern_locale != locale:
+                continue
+            if exact is not None and tuple(toks[start:start + length]) != exact:
+                continue
+            if length > matches.get(start, (0,))[0]:
+                matches[start] = (length, route)
+
+        found = []
+        seen_routes = {own, *linked}
+        covered = -1
+        for start in sorted(matches):
+            length, route = matches[start]
+            if start <= covered:
+                continue
+            covered = start + length - 1
+            if route in seen_routes:
+                continue
+            seen_routes.add(route)
+            found.append((prose[spans[start][0]:spans[start + length - 1][1]], route))
+            if len(found) >= MAX_PER_PAGE:
+                break
+        return found
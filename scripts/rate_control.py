@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Backing off from hosts that say "slow down" (HTTP 429 / 503).
+
+A 429 is not a verdict on the URL, it is the host asking us to come back
+later. Both external-link checkers used to report it as final (broken, or
+`org-url-blocked`), so one rate-limited government site could produce dozens
+of false findings in a single run. Shared pieces:
+
+  parse_retry_after  the Retry-After header, as seconds to wait
+  Throttled          raised by a probe that should be re-queued, not reported
+  AimdLimit          additive-increase / multiplicative-decrease limit: halved
+                     on every 429/503, grown back by ~1 per round of successes
+  HostBackoff        per-host "not before" times for probers without an event
+                     loop, so a throttled URL waits at the back of the queue
+                     while other hosts carry on (and request starts on one
+                     host are spaced out)
+
+Stdlib only.
+"""
+
+import email.utils
+import time
+
+# Statuses that mean "too many requests", not "this URL is broken"
+THROTTLE_STATUSES = (429, 503)
+
+# Probe attempts per URL before a 429/503 is reported as the answer
+MAX_ATTEMPTS = 3
+
+# Longer Retry-After than this and we report the answer instead of waiting;
+# a nightly run cannot park a URL for an hour
+MAX_RETRY_AFTER = 120.0
+
+# Wait before retrying when the host sent no Retry-After: BACKOFF_BASE * 2^n
+BACKOFF_BASE = 2.0
+
+
+def parse_retry_after(value, now=None):
+    """Seconds to wait from a Retry-After header value, or None
+
+    Accepts both forms the header allows: delay-seconds and an HTTP-date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+def backoff_delay(retry_after, attempt):
+    """How long to park a throttled URL: the host's ask, else exponential"""
+    if retry_after is not None:
+        return retry_after
+    return BACKOFF_BASE * (2 ** attempt)
+
+
+class Throttled(Exception):
+    """The host answered 429/503; re-queue the URL instead of reporting it"""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AimdLimit:
+    """A per-host concurrency limit that adapts to the host's answers
+
+    Starts at ``ceiling``. Each throttled response halves it (never below
+    ``floor``); each success adds 1/limit, so a full round of successes
+    raises it by about one, back up to the ceiling.
+    """
+
+    def __init__(self, ceiling, floor=1):
+        self.ceiling = max(floor, ceiling)
+        self.floor = floor
+        self.value = float(self.ceiling)
+
+    @property
+    def allowed(self):
+        """Requests that may be in flight right now"""
+        return max(self.floor, int(self.value))
+
+    def on_success(self):
+        self.value = min(self.ceiling, self.value + 1.0 / self.value)
+
+    def on_throttle(self):
+        self.value = max(self.floor, self.value / 2)
+
+
+class HostBackoff:
+    """Per-host earliest next request time, for probers without an event loop"""
+
+    def __init__(self):
+        self.not_before = {}
+
+    def ready_at(self, host):
+        return self.not_before.get(host, 0.0)
+
+    def throttled(self, host, retry_after, attempt, now=None):
+        """Park the host; returns when it may be asked again"""
+        now = time.monotonic() if now is None else now
+        until = now + backoff_delay(retry_after, attempt)
+        self.not_before[host] = max(self.ready_at(host), until)
+        return self.not_before[host]
+
+    def spaced(self, host, interval, now=None):
+        """A request to the host just started: hold the next one back ``interval`` seconds"""
+        now = time.monotonic() if now is None else now
+        self.not_before[host] = max(self.ready_at(host), now + interval)
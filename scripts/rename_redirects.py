@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Redirects for moved pages, from git's rename history.
+
+When a content page moves, every link to its old path and every bookmark of
+it 404s until someone adds a rule to site/public/_redirects by hand. Git
+already knows every move. This reads `git log -M` over the content sections
+(check_claims.CONTENT_DIRS) once, streaming, and turns the renames into a
+redirect table from old route to the route the page has now:
+
+  - chains are collapsed to one hop (a -> b -> c gives a -> c and b -> c)
+  - a page moved back, or an old path a page exists at again, is dropped
+  - a move whose page has since been deleted is dropped
+  - hand-written rules in _redirects win over generated ones
+
+The table is written two ways (--write):
+
+  site/public/_redirects        a generated block (301s, both URL forms), for
+                                the site build / Cloudflare Pages
+  site/public/route-redirects.json
+                                {"redirects": {old: new}}, for the app's
+                                WikiRouter, which has no _redirects handling
+
+validate_wiki_links.py only counts the declared rules, so a link to a moved
+page's old path is broken until --write has run and been committed (its
+"Did you mean" names the page's new route).
+
+  python3 scripts/rename_redirects.py            # print the table
+  python3 scripts/rename_redirects.py --write    # update both files
+  python3 scripts/rename_redirects.py --check    # exit 1 if they are stale
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from check_claims import CONTENT_DIRS
+from link_suggestions import page_route
+from route_manifest import REDIRECTS_FILE, REPO_ROOT, RouteManifest, parse_redirects
+
+JSON_FILE = Path('site/public/route-redirects.json')
+
+BLOCK_START = '# generated: moved pages, from git history (scripts/rename_redirects.py --write)'
+BLOCK_END = '# end generated: moved pages'
+
+
+def git_renames(root, dirs=None):
+    """(old, new) file renames in the history of ``root``, oldest first
+
+    Streams one ``git log``; paths are relative to ``root``. With ``dirs``,
+    only renames under those directories. Outside a git checkout (or without
+    git, or in a shallow clone with no history): no renames.
+    """
+    cmd = ['git', '-c', 'core.quotePath=false', 'log', '--reverse', '--format=',
+           '--name-status', '-M', '--diff-filter=R', '--relative']
+    if dirs:
+        cmd += ['--', *dirs]
+    try:
+        proc = subprocess.Popen(cmd, cwd=root, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, encoding='utf-8')
+    except OSError:
+        return []
+    renames = []
+    with proc:
+        for line in proc.stdout:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) == 3 and fields[0].startswith('R'):
+                renames.append((fields[1], fields[2]))
+    return renames if proc.returncode == 0 else []
+
+
+def collapse(renames, manifest):
+    """Old route -> current route, one hop, for pages that still exist
+
+    ``renames`` are (old file, new file) pairs, oldest first; ``manifest``
+    is the RouteManifest of the tree as it is now.
+    """
+    moved = {}
+    for old, new in renames:
+        if old.endswith('.md') and new.endswith('.md'):
+            moved[page_route(old)] = page_route(new)
+    table = {}
+    for old in moved:
+        if old in manifest.routes:
+            continue  # a page lives at the old path again
+        route, seen = old, {old}
+        while route in moved and moved[route] not in seen:
+            route = moved[route]
+            seen.add(route)
+        if route != old and route in manifest.routes:
+            table[old] = route
+    return table
+
+
+def rename_redirects(root, manifest=None, dirs=CONTENT_DIRS):
+    """The redirect table for ``root``: one git log, chains collapsed"""
+    if manifest is None:
+        manifest = RouteManifest.build(root)
+    return collapse(git_renames(root, dirs), manifest)
+
+
+def without_declared(table, declared):
+    """Drop the routes the hand-written rules already redirect"""
+    sources = {source for source, _ in declared}
+    return {old: new for old, new in table.items() if old not in sources}
+
+
+def redirects_block(table):
+    """The generated _redirects block: both URL forms of each old route
+    (canonical URLs carry a trailing slash, bookmarks may not)"""
+    lines = [BLOCK_START]
+    for old, new in sorted(table.items()):
+        target = f"/{new}/" if new else '/'
+        lines += [f"/{old} {target} 301", f"/{old}/ {target} 301"]
+    lines.append(BLOCK_END)
+    return '\n'.join(lines) + '\n'
+
+
+def with_block(text, table):
+    """_redirects text with the generated block replaced (or appended);
+    an empty table removes the block"""
+    start, end = text.find(BLOCK_START), text.find(BLOCK_END)
+    if start != -1 and end != -1:
+        before, after = text[:start], text[end + len(BLOCK_END):].lstrip('\n')
+    else:
+        before, after = text, ''
+    if not table:
+        return before.rstrip('\n') + '\n' + (f"\n{after}" if after else '')
+    return before.rstrip('\n') + '\n\n' + redirects_block(table) + (f"\n{after}" if after else '')
+
+
+def json_document(table):
+    return json.dumps({'version': 1, 'redirects': dict(sorted(table.items()))},
+                      indent=2, ensure_ascii=False) + '\n'
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Redirects for moved pages, from git history')
+    ap.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument('--write', action='store_true',
+                      help=f"update {REDIRECTS_FILE} and {JSON_FILE}")
+    mode.add_argument('--check', action='store_true',
+                      help='exit 1 if either file is out of date')
+    args = ap.parse_args()
+
+    root = Path(args.root)
+    redirects_path = root / REDIRECTS_FILE
+    json_path = root / JSON_FILE
+    manifest = RouteManifest.build(root)
+    current = redirects_path.read_text(encoding='utf-8') if redirects_path.exists() else ''
+    # Hand-written rules only: the generated block is what we're rebuilding
+    declared = parse_redirects(with_block(current, {}))
+    table = without_declared(rename_redirects(root, manifest), declared)
+
+    if not (args.write or args.check):
+        for old, new in sorted(table.items()):
+            print(f"/{old} -> /{new}")
+        print(f"{len(table)} moved page(s)")
+        return 0
+
+    wanted = {redirects_path: with_block(current, table),
+              json_path: json_document(table) if table or json_path.exists() else None}
+    stale = []
+    for path, text in wanted.items():
+        if text is None:
+            continue
+        existing = path.read_text(encoding='utf-8') if path.exists() else None
+        if existing != text:
+            stale.append(path)
+            if args.write:
+                path.write_text(text, encoding='utf-8')
+    verb = 'Updated' if args.write else 'Out of date'
+    for path in stale:
+        print(f"{verb}: {path.relative_to(root)}")
+    if args.check and stale:
+        print("Run: python3 scripts/rename_redirects.py --write")
+        return 1
+    print(f"{len(table)} moved page(s)" + ('' if stale else ', files up to date'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Route manifest: every URL path the site serves a page at, from one walk.
+
+Both link validators used to answer "does /benefits/us/ssdi exist?" with
+filesystem stats per link occurrence: up to four is_file() candidates in
+link_validator_agent.py, two exists() in validate_wiki_links.py, repeated for
+every page that links to the same place. The manifest walks the tree once and
+turns every lookup into a dict hit. For each markdown page it records the
+routes that reach it:
+
+  benefits/us/ssdi.md    ->  benefits/us/ssdi, benefits/us/ssdi.md
+  benefits/index.md      ->  benefits, benefits/index, benefits/index.md
+  index.md               ->  '' (the site root)
+
+A page file beats a section index for the same route (`x.md` over
+`x/index.md`), as in the validators before it. Locales are path prefixes
+(es/...). Redirects declared in site/public/_redirects resolve to their
+target's page: the live site answers them with a 301, so a link to one still
+works. Wildcard rules (/en/*) are kept as prefix rules.
+
+The same data can be written as JSON for the app (WikiRouter) and the site
+build:
+
+  python3 scripts/route_manifest.py --content --out routes.json
+  python3 scripts/route_manifest.py --resolve /benefits/index.md /home
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+REDIRECTS_FILE = Path('site/public/_redirects')
+
+# Path prefixes that are a locale of the site; everything else is English
+LOCALES = ('es',)
+DEFAULT_LOCALE = 'en'
+
+# Never content, never walked
+PRUNE_DIRS = {'.git', 'node_modules'}
+
+# A redirect pointing at another redirect is followed this many hops
+MAX_REDIRECT_HOPS = 5
+
+
+def walk_files(root, dirs=None):
+    """Every file under root, as posix paths relative to it
+
+    With ``dirs``, only those top-level directories (and root-level files)
+    are walked.
+    """
+    root = Path(root)
+    files = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        if rel_dir == '.':
+            dirnames[:] = [d for d in dirnames
+                           if d not in PRUNE_DIRS and (dirs is None or d in dirs)]
+        else:
+            dirnames[:] = [d for d in dirnames if d not in PRUNE_DIRS]
+        files.update(name if rel_dir == '.' else f"{rel_dir}/{name}" for name in filenames)
+    return files
+
+
+def read_redirects(path):
+    """(source, target) route pairs from a Netlify/Cloudflare _redirects file
+
+    Routes are returned without leading/trailing slashes; a wildcard source
+    keeps its trailing '*'. Missing file: no redirects.
+    """
+    try:
+        text = Path(path).read_text(encoding='utf-8')
+    except OSError:
+        return []
+    return parse_redirects(text)
+
+
+def parse_redirects(text):
+    """(source, target) route pairs from _redirects text (see read_redirects)"""
+    rules = []
+    for line in text.splitlines():
+        fields = line.split('#', 1)[0].split()
+        if len(fields) < 2 or not fields[0].startswith('/'):
+            continue
+        rules.append((fields[0].strip('/'), fields[1].strip('/')))
+    return rules
+
+
+def locale_of(route):
+    """'es' for es/..., else the default locale"""
+    first = route.split('/', 1)[0]
+    return first if first in LOCALES else DEFAULT_LOCALE
+
+
+def is_section_index(file):
+    return file == 'index.md' or file.endswith('/index.md')
+
+
+def normalise_route(path):
+    """A link path (no #fragment, already unquoted) as a manifest key"""
+    path = path.strip('/')
+    if not path:
+        return ''
+    path = posixpath.normpath(path)
+    return '' if path == '.' else path
+
+
+class RouteManifest:
+    """Route -> page file, for every route a page is served at"""
+
+    def __init__(self, files=(), redirects=()):
+        self.routes = {}
+        self.redirects = {}
+        self.redirect_prefixes = {}
+        for file in files:
+            if file.endswith('.md'):
+                self.add(file)
+        for source, target in redirects:
+            if source.endswith('*'):
+                self.redirect_prefixes[source[:-1].rstrip('/')] = target
+            else:
+                self.redirects[source] = target
+
+    @classmethod
+    def build(cls, root, dirs=None, redirects_file=None):
+        """Walk ``root`` once; redirects default to root/site/public/_redirects"""
+        root = Path(root)
+        if redirects_file is None:
+            redirects_file = root / REDIRECTS_FILE
+        return cls(walk_files(root, dirs), read_redirects(redirects_file))
+
+    def add(self, file):
+        self.routes[file] = file
+        self._claim(file[:-3], file)
+        if is_section_index(file):
+            self._claim(file[:-len('index.md')].rstrip('/'), file)
+
+    def _claim(self, route, file):
+        """x.md outranks x/index.md for the bare route x, whatever the order"""
+        current = self.routes.get(route)
+        if current is None or (is_section_index(current) and file == route + '.md'):
+            self.routes[route] = file
+
+    def resolve(self, path):
+        """The page file a link path reaches, following redirects, or None"""
+        route = normalise_route(path)
+        for _ in range(MAX_REDIRECT_HOPS + 1):
+            page = self.routes.get(route)
+            if page is not None:
+                return page
+            target = self._redirect(route)
+            if target is None:
+                return None
+            route = normalise_route(target)
+        return None
+
+    def _redirect(self, route):
+        if route in self.redirects:
+            return self.redirects[route]
+        for prefix, target in self.redirect_prefixes.items():
+            if route == prefix or route.startswith(prefix + '/') or not prefix:
+                rest = route[len(prefix):].lstrip('/')
+                return target.replace(':splat', rest) if ':splat' in target else target
+        return None
+
+    def pages(self, locale=None):
+        """Page files, optionally only one locale's"""
+        files = set(self.routes.values())
+        if locale is not None:
+            files = {f for f in files if locale_of(f) == locale}
+        return files
+
+    def to_json(self):
+        return {
+            'version': 1,
+            'default_locale': DEFAULT_LOCALE,
+            'locales': [DEFAULT_LOCALE, *LOCALES],
+            'routes': dict(sorted(self.routes.items())),
+            'redirects': dict(sorted(self.redirects.items())),
+            'redirect_prefixes': dict(sorted(self.redirect_prefixes.items())),
+        }
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Build the route manifest shared by the link tools')
+    ap.add_argument('--root', default=str(REPO_ROOT), help='content root (default: repo root)')
+    ap.add_argument('--content', action='store_true',
+                    help='only the content sections (check_claims.CONTENT_DIRS) and root pages')
+    ap.add_argument('--out', help='write the manifest as JSON here')
+    ap.add_argument('--resolve', nargs='+', metavar='PATH', help='print the page each path reaches')
+    args = ap.parse_args()
+
+    dirs = None
+    if args.content:
+        from check_claims import CONTENT_DIRS
+        dirs = set(CONTENT_DIRS)
+    manifest = RouteManifest.build(args.root, dirs)
+
+    for path in args.resolve or ():
+        print(f"{path} -> {manifest.resolve(path.split('#', 1)[0]) or 'NOT FOUND'}")
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(manifest.to_json(), f, separators=(',', ':'))
+    if not args.resolve:
+        counts = ', '.join(f"{locale} {len(manifest.pages(locale))}"
+                           for locale in (DEFAULT_LOCALE, *LOCALES))
+        print(f"{len(manifest.pages())} pages ({counts}), {len(manifest.routes)} routes, "
+              f"{len(manifest.redirects) + len(manifest.redirect_prefixes)} redirects"
+              + (f" -> {args.out}" if args.out else ''))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
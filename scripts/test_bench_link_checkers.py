@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Smoke test for bench_link_checkers.py: every engine, a handful of URLs.
+
+Runs the real fixture server and fake resolver, so it needs no network. The
+threads and async engines are skipped without `requests`.
+
+Run: python3 scripts/test_bench_link_checkers.py
+"""
+import argparse
+import os
+import socket
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import bench_link_checkers as bench  # noqa: E402
+
+
+def host_of_kind(kind):
+    return next(n for n in range(1000) if bench.host_kind(n) == kind)
+
+
+class EngineSmokeTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = mock.patch.dict(os.environ)
+        cls.env.start()
+        cls.real_getaddrinfo = bench.install_fake_resolver()
+        cls.server = bench.FixtureServer(hang_seconds=1.0)
+        port = cls.server.port.value
+        ok, head405, redirect, nx = (bench.host_name(host_of_kind(kind))
+                                     for kind in ('ok', 'head405', 'redirect', 'nxdomain'))
+        cls.urls = [f"http://{ok}:{port}/p/1", f"http://{ok}:{port}/p/50",  # 404
+                    f"http://{head405}:{port}/p/2", f"http://{redirect}:{port}/p/3",
+                    f"http://{nx}:{port}/p/4"]
+        cls.args = argparse.Namespace(concurrency=4, per_host=2, host_delay=0, timeout=5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        socket.getaddrinfo = cls.real_getaddrinfo
+        cls.env.stop()
+
+    def run_engine(self, engine):
+        timings, broken = bench.run_engine(engine, self.urls, self.args)
+        if timings is None:
+            self.skipTest(broken)
+        self.assertEqual(len(timings.latencies()), len(self.urls), "a verdict per URL")
+        self.assertEqual(broken, 2, "the 404 and the name that does not resolve")
+
+    def test_threads(self):
+        self.run_engine('threads')
+
+    def test_async(self):
+        self.run_engine('async')
+
+    def test_claims(self):
+        self.run_engine('claims')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Offline regression tests for check_claims._probe_url.
+"""Offline regression tests for check_claims._probe_url and check_regressions.
 
 The URL liveness probe once declared two live sites dead — including a UK
 government-backed equality helpline — because it only tried the apex host and
@@ -10,6 +10,7 @@ Run: python3 scripts/test_check_claims.py
 """
 import socket
 import sys
+import tempfile
 import unittest
 import urllib.error
 import urllib.request
@@ -112,6 +113,128 @@ class ProbeUrlTests(unittest.TestCase):
         self.assertEqual(r[0], "org-url-dead")
 
 
+class ThrottleTests(unittest.TestCase):
+    def test_429_is_requeued_then_answered(self):
+        calls = []
+
+        def busy_once(req, timeout=None):
+            calls.append(req.full_url)
+            if len(calls) == 1:
+                raise urllib.error.HTTPError(req.full_url, 429, "", {"Retry-After": "0"}, None)
+            return FakeResp(200)
+
+        page = cc.REPO_ROOT / "scripts" / "test_check_claims.py"  # any readable file
+        with mock.patch.object(cc, "EXTERNAL_URL_RE", cc.re.compile(r"(https://busy\.example/)")), \
+                mock.patch.object(urllib.request, "urlopen", busy_once), \
+                mock.patch.object(cc.Path, "read_text", return_value="https://busy.example/"):
+            findings = cc.check_org_urls([page], timeout=5)
+        self.assertEqual(findings, [], "a 429 that clears on retry is not a finding")
+        self.assertEqual(len(calls), 2)
+
+    def test_without_requeue_429_is_still_blocked(self):
+        with mock.patch.object(urllib.request, "urlopen",
+                               make_urlopen({"busy.example": ("http", 429)})):
+            r = cc._probe_url("https://busy.example", timeout=5)
+        self.assertEqual(r[0], "org-url-blocked")
+
+
+def ledger(*rules):
+    led = cc.Ledger()
+    for tier, pattern in rules:
+        led.rejected.append({"tier": tier, "re": cc.re.compile(pattern, cc.re.I),
+                             "raw": pattern, "why": "test"})
+    return led
+
+
+class RegressionMatcherTests(unittest.TestCase):
+    """check_regressions prefilters on each rule's literal; the findings must
+    be exactly those of trying every rule on every line."""
+
+    RULES = (
+        ("blocking", r"\$3\.40\s+per\s+hour"),
+        ("advisory", r"(?:86|64)\s*%\s+unemploy"),       # no usable literal
+        ("advisory", r"sweden\s+sterili[sz]ed"),
+        ("advisory", r"colou?r blindness"),
+        ("blocking", r"x{2,3}yyyy"),
+        ("advisory", r"per\s+hour"),
+    )
+    TEXT = (
+        "Workers earned $3.40 per hour in 1986.\n"
+        "Some 86 % unemployment, they said.\n"
+        "SWEDEN STERILIZED thousands.\n"
+        "Sweden \u017fterili\u017fed nobody.\n"
+        "Color blindness, colour blindness, colouur blindness.\n"
+        "xxyyyy and xyyyy\n"
+        "nothing to see here\n"
+    )
+
+    def naive(self, files, led):
+        out = []
+        for path in files:
+            for i, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+                for rej in led.rejected:
+                    if rej["re"].search(line):
+                        out.append((str(path.relative_to(cc.REPO_ROOT)), i,
+                                    f"matches {rej['raw']!r} — {rej['why']}"))
+        return out
+
+    def test_same_findings_as_every_rule_on_every_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            files = [root / "a.md", root / "b.md", root / "c.md"]
+            files[0].write_text(self.TEXT, encoding="utf-8")
+            files[1].write_text("nothing here\n", encoding="utf-8")
+            files[2].write_text("\u0131t was $3.40 per hour\n", encoding="utf-8")
+            for led in (ledger(*self.RULES), ledger(*self.RULES[2:4]), ledger(self.RULES[1])):
+                with mock.patch.object(cc, "REPO_ROOT", root):
+                    got = [(f.path, f.line, f.detail) for f in cc.check_regressions(files, led)]
+                    self.assertEqual(got, self.naive(files, led))
+            self.assertTrue(got, "the unanchored rule still fires")
+
+    def test_characters_ignorecase_maps_to_ascii(self):
+        # Turkish dotted and dotless i, long s, Kelvin sign: re.I matches each
+        # to an ASCII letter; İ.lower() is even two characters long
+        text = ("SWEDEN STERİLİZED them.\n"
+                "Sweden sterılızed them.\n"
+                "Sweden ſteriliſed them.\n"
+                "Kelvin said $3.40 per hour, İİİ per hour.\n"
+                "unrelated\n")
+        rules = ledger(("advisory", r"sweden\s+sterili[sz]ed"), ("blocking", r"kelvin"),
+                       ("advisory", r"per\s+hour"))
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            files = [root / "a.md"]
+            files[0].write_text(text, encoding="utf-8")
+            with mock.patch.object(cc, "REPO_ROOT", root):
+                got = [(f.path, f.line, f.detail) for f in cc.check_regressions(files, rules)]
+                expected = self.naive(files, rules)
+        self.assertEqual(got, expected)
+        self.assertEqual([line for _, line, _ in expected], [1, 2, 3, 4, 4])
+
+    def test_literal_anchor(self):
+        cases = {
+            r"\$3\.40\s+per\s+hour": "$3.40",
+            r"integrated employment.{0,40}1968": "integrated employment",
+            r"\x41bcdef": "bcdef",
+            r"foo|barbaz": None,
+            r"[]abc]defg": "defg",
+            r"x{2,3}yyyy": "yyyy",
+            r"colou?r blindness": "r blindness",
+            r"(?:86|64)\s*%": None,
+            r"(?x) spaced out": None,
+            r"Su\u00e9cia": "cia",
+        }
+        for pattern, anchor in cases.items():
+            self.assertEqual(cc.literal_anchor(pattern), anchor, pattern)
+
+    def test_literal_alternation_finds_prefixes_and_extensions(self):
+        rx = cc.literal_alternation({"14(c)", "140", "400,000", "ussr"})
+        for text in ("a 14(c) certificate", "1400 people", "400,000 pages", "in the ussr"):
+            self.assertIsNotNone(rx.search(text), text)
+        self.assertIsNone(rx.search("14 c and 40,000"))
+        self.assertIsNone(cc.literal_alternation(set()))
+
+
 if __name__ == "__main__":
     import warnings
     # Python 3.14 emits ResourceWarning for the file-like HTTPError objects our
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for the findings history queries the on-call answers come from.
+
+"When did this break?" must date a link from its current breakage, not from a
+breakage that was fixed months ago, and a URL that alternates pass/fail must
+stand out from one that is simply down. In-memory SQLite; no network.
+
+Run: python3 scripts/test_findings_history.py
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import findings_history as fh  # noqa: E402
+
+
+def broken(path, url, line=1):
+    return {'kind': 'broken_internal', 'path': path, 'line': line, 'target': url}
+
+
+class HistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.history = fh.FindingsHistory(':memory:')
+
+    def tearDown(self):
+        self.history.close()
+
+    def run_at(self, day, findings, **kwargs):
+        return self.history.record_run('link_validator', findings, commit='c',
+                                       started=day * 86400, **kwargs)
+
+    def test_first_seen_is_start_of_current_streak(self):
+        self.run_at(1, [broken('crisis/index.md', '/gone')])
+        self.run_at(2, [])
+        self.run_at(3, [broken('crisis/index.md', '/gone', line=9),
+                        broken('rights/ada.md', '/old')])
+        # A line shift is the same finding; it has been broken since day 3
+        self.run_at(4, [broken('crisis/index.md', '/gone', line=12),
+                        broken('rights/ada.md', '/old')])
+        seen = {row['target']: row['first_seen'] / 86400
+                for row in self.history.first_seen_broken('link_validator')}
+        self.assertEqual(seen, {'/gone': 3, '/old': 3})
+
+    def test_health_trend_per_section(self):
+        self.run_at(1, [broken('crisis/a.md', '/x')], checked={'crisis': 10, 'rights': 10})
+        self.run_at(2, [], checked={'crisis': 10, 'rights': 10})
+        self.assertEqual([h for _, _, h in self.history.health_trend('link_validator', 'crisis')],
+                         [90.0, 100.0])
+        self.assertEqual([h for _, _, h in self.history.health_trend('link_validator')],
+                         [95.0, 100.0])
+
+    def test_flapping_urls(self):
+        for day, ok in enumerate([True, False, True, False], 1):
+            self.run_at(day, [], verdicts={'https://flaky.example/': (ok, None),
+                                           'https://down.example/': (False, 'HTTP 404')})
+        self.assertEqual([(r['url'], r['flips']) for r in self.history.flapping_urls()],
+                         [('https://flaky.example/', 3)])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
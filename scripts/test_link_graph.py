@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Tests for the link-graph analytics written by validate_wiki_links.py --graph.
+
+Run: python3 scripts/test_link_graph.py
+"""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import link_graph as lg  # noqa: E402
+from route_manifest import RouteManifest  # noqa: E402
+
+PAGES = ['home.md', 'rights/index.md', 'rights/ada.md', 'rights/deep.md', 'start/contribute.md',
+         'lost.md', 'es/rights/index.md']
+LINKS = [
+    ('home.md', 'rights/index.md'), ('home.md', 'rights/index.md'),  # counted once
+    ('rights/index.md', 'rights/ada.md'), ('rights/ada.md', 'rights/ada.md'),  # self-link
+    ('rights/ada.md', 'rights/deep.md'), ('rights/deep.md', 'rights/extra.md'),
+    *((page, 'start/contribute.md') for page in PAGES if page != 'start/contribute.md'),
+]
+
+
+class LinkGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.graph = lg.LinkGraph.from_links(PAGES, LINKS)
+        self.doc = self.graph.analyse({'home.md', 'es/rights/index.md'}, published=PAGES,
+                                      max_clicks=3)
+
+    def names(self, ids):
+        return [self.graph.pages[i] for i in ids]
+
+    def test_adjacency_and_backlinks(self):
+        ids = self.graph.ids
+        self.assertEqual(self.names(self.graph.links_from(ids['home.md'])),
+                         ['rights/index.md', 'start/contribute.md'])
+        self.assertEqual(self.names(self.graph.links_from(ids['rights/ada.md'])),
+                         ['rights/deep.md', 'start/contribute.md'])
+        self.assertIn('rights/extra.md', self.graph.pages)  # a target becomes a node
+        self.assertEqual(self.names(self.graph.reverse().links_from(ids['rights/deep.md'])),
+                         ['rights/ada.md'])
+        self.assertEqual(self.doc['backlinks'][ids['start/contribute.md']], 6)
+
+    def test_orphans_and_clicks_from_the_sidebar(self):
+        self.assertEqual(self.names(self.doc['orphans']), ['lost.md'])
+        depth = dict(zip(self.graph.pages, self.doc['depth']))
+        self.assertEqual([depth[p] for p in ('home.md', 'rights/index.md', 'rights/ada.md',
+                                             'rights/deep.md', 'lost.md')], [1, 2, 3, 4, None])
+        self.assertEqual(self.names(self.doc['unreachable']), ['rights/deep.md', 'lost.md'])
+
+    def test_site_furniture_does_not_feed_centrality(self):
+        rank = dict(zip(self.graph.pages, self.doc['centrality']))
+        self.assertGreater(rank['rights/ada.md'], rank['start/contribute.md'])
+
+    def test_saved_graph_loads_without_a_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'graph.json'
+            lg.LinkGraph.save(self.doc, path)
+            self.assertNotIn(', ', path.read_text(encoding='utf-8'))
+            graph, doc = lg.LinkGraph.load(path)
+        self.assertEqual(doc, json.loads(json.dumps(self.doc)))
+        self.assertEqual(list(graph.targets), list(self.graph.targets))
+
+    def test_nav_export_targets_and_their_translations(self):
+        nav = {'data': {'navigation': {'tree': [{'locale': 'en', 'items': [
+            {'kind': 'header', 'target': None},
+            {'kind': 'link', 'target': '/en/rights/index'},
+            {'kind': 'link', 'target': '/en/missing'},
+        ]}]}}}
+        routes = RouteManifest(['rights/index.md', 'es/rights/index.md'], [('en/*', ':splat')])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'nav.json'
+            path.write_text(json.dumps(nav), encoding='utf-8')
+            pages = lg.nav_pages(routes.resolve, path)
+        self.assertEqual(pages, {'rights/index.md', 'es/rights/index.md'})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
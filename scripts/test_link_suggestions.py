@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for the link-suggestion matcher behind validate_wiki_links.py.
+
+A suggestion nobody wants is worse than none: "ada" inside "Canada", text
+that is already a link, and a title two pages share must not produce one.
+
+Run: python3 scripts/test_link_suggestions.py
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import link_suggestions as ls  # noqa: E402
+
+PAGES = [
+    ('benefits/us/ssi.md', {'title': 'Supplemental Security Income (SSI)'}),
+    ('rights/us/ada.md', {'title': 'Americans with Disabilities Act'}),
+    ('housing/fair-housing.md', {'title': 'Fair Housing Act'}),
+    ('rights/us/fair-housing.md', {'title': 'Fair Housing Act'}),
+    ('conditions/index.md', {'title': 'Conditions', 'aliases': '[chronic illness, long covid]'}),
+    ('es/conditions/index.md', {'title': 'Condiciones'}),
+]
+ACRONYMS = """
+| Acronym | Full Term                       | Notes |
+|---------|---------------------------------|-------|
+| ADA     | Americans with Disabilities Act | US    |
+| IEP     | Individualized Education Program| US    |
+"""
+
+
+class SuggestionTests(unittest.TestCase):
+    def setUp(self):
+        self.suggester = ls.LinkSuggester.build(PAGES, acronyms=ACRONYMS)
+
+    def suggest(self, body, page='start/faq.md', linked=()):
+        return self.suggester.suggest(body, page, linked)
+
+    def test_word_boundaries_case_and_longest_match(self):
+        body = ("In Canada, Ada applied for SSI under the Americans with Disabilities "
+                "Act; see the ADA and an IEP.")
+        self.assertEqual(self.suggest(body), [
+            ('SSI', 'benefits/us/ssi'),
+            ('Americans with Disabilities Act', 'rights/us/ada'),
+            ('IEP', 'glossary/acronyms'),
+        ])
+
+    def test_linked_code_and_headings_are_not_prose(self):
+        body = ("## Supplemental Security Income\n"
+                "[SSI](/benefits/us/ssi) and `SSI` are linked or code; "
+                "long covid is not.\n")
+        self.assertEqual(self.suggest(body), [('long covid', 'conditions')])
+        self.assertEqual(self.suggest(body, linked={'conditions'}), [])
+        self.assertEqual(self.suggest(body, page='conditions/index.md'), [])
+
+    def test_shared_titles_and_other_locales_are_skipped(self):
+        self.assertEqual(self.suggest('The Fair Housing Act and Conditions.'),
+                         [('Conditions', 'conditions')])
+        self.assertEqual(self.suggest('Conditions y condiciones.', page='es/start/faq.md'),
+                         [('condiciones', 'es/conditions')])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,25 +1,37 @@
 #!/usr/bin/env python3
 """
 Internal Link Validator for Disability Wiki (Wiki.js content)
-Checks English markdown pages for broken internal links and missing descriptions.
+Checks English and Spanish markdown pages for broken internal links, broken
+#section links and missing descriptions.
 
 Content lives at the repository root (benefits/, rights/, crisis/, ...), so
-BASE_DIR is the repo root (this file is in scripts/). Non-content trees and the
-Spanish locale are excluded so the broken-link total is trustworthy.
+BASE_DIR is the repo root (this file is in scripts/). Non-content trees are
+excluded so the broken-link total is trustworthy. The Spanish locale (es/) is
+checked in the same run against the same route manifest, with its own totals:
+--strict gates English, --strict-es gates Spanish as well. A Spanish page
+linking to an English page that has a Spanish version is reported as a
+cross-locale link (advisory).
 """
 
 import re
 import sys
+import time
 from pathlib import Path
 from collections import defaultdict
 
+from findings_history import DEFAULT_PATH as HISTORY_PATH, FindingsHistory, section_of
+from heading_index import HeadingIndex, split_fragment
+from link_graph import DEFAULT_PATH as GRAPH_PATH, NAV_EXPORT, LinkGraph, nav_pages
+from link_repair import RepairIndex, format_suggestions
+from link_suggestions import LinkSuggester, page_route
+from route_manifest import DEFAULT_LOCALE, LOCALES, RouteManifest, locale_of
+
 # Repo root is the parent of scripts/. Content pages live directly under it.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# Directories that are not English content pages — excluded from the scan so
+# Directories that are not content pages — excluded from the scan so
 # the totals reflect real, fixable links rather than locale/docs/backup noise.
 EXCLUDE_DIRS = {
-    'es',                     # Spanish locale (separate tree; /es/* links)
     'docs', 'scripts', 'backups', 'node_modules', '.git', '.claude',
     'archetypes',             # template scaffolding
     'page-review-2026-06-05', # point-in-time review snapshot
@@ -81,44 +93,88 @@ def normalize_wiki_path(link_url):
         path = path[:-3]
     return path  # repo-root-relative, no extension
 
+_routes = None
+
+
+def routes():
+    """The route manifest for BASE_DIR, built on first use (one tree walk)
+
+    Only redirects declared in site/public/_redirects count: a link to a
+    moved page's old path 404s on the site until its redirect ships
+    (rename_redirects.py --write), however the move shows in git history.
+    """
+    global _routes
+    if _routes is None:
+        _routes = RouteManifest.build(BASE_DIR)
+    return _routes
+
+def resolve_page(path):
+    """The repo-relative file (``path.md`` or ``path/index.md``) a page link
+    serves, or None if neither exists. The site root is ``index.md``. A
+    route the site redirects (site/public/_redirects) serves its target."""
+    return routes().resolve(path)
+
 def check_link_exists(path):
-    """A page link resolves if ``path.md`` or ``path/index.md`` exists."""
+    """A page link resolves if ``path.md`` or ``path/index.md`` exists, or
+    ``path`` redirects to one in site/public/_redirects."""
     if not path:
         return True  # bare "/" -> site root
-    if (BASE_DIR / f"{path}.md").exists():
-        return True
-    if (BASE_DIR / path / "index.md").exists():
-        return True
-    return False
-
-def find_potential_links(content, all_pages):
-    """Find potential internal links based on content keywords"""
-    suggestions = []
-    content_lower = content.lower()
-
-    # Common disability wiki topics that should be linked
-    topic_keywords = {
-        'ssdi': '/benefits/us/ssdi',
-        'social security': '/benefits/us',
-        'disability rights': '/rights',
-        'ada': '/rights/us/ada',
-        'medicaid': '/benefits/us/medicaid',
-        'medicare': '/benefits/us/medicare',
-        'housing': '/housing',
-        'employment': '/employment',
-        'education': '/education',
-        'crisis': '/crisis',
-        'mental health': '/conditions',
-    }
-
-    for keyword, suggested_link in topic_keywords.items():
-        # Check if keyword appears but link doesn't
-        if keyword in content_lower and suggested_link not in content:
-            suggestions.append(f"Consider linking '{keyword}' to {suggested_link}")
-
-    return suggestions
+    return resolve_page(path) is not None
+
+def translation_of(target, locale):
+    """The ``locale`` version of a page route, if that page exists
+
+    ``target`` is a normalized route in another locale (e.g. ``crisis``);
+    the Spanish version of ``crisis`` is ``es/crisis``.
+    """
+    if locale == DEFAULT_LOCALE or locale_of(target) == locale:
+        return None
+    route = f"{locale}/{target}" if target else locale
+    return route if resolve_page(route) else None
+
+def build_suggester(md_files):
+    """One link-suggestion matcher for every published page's title, the
+    glossary and its acronyms (see link_suggestions.py)"""
+    pages = []
+    for md_file in md_files:
+        frontmatter, _ = extract_frontmatter(md_file.read_text(encoding='utf-8'))
+        if frontmatter.get('published', '').strip().lower() == 'true':
+            pages.append((md_file.relative_to(BASE_DIR).as_posix(), frontmatter))
+
+    def read(rel):
+        path = BASE_DIR / rel
+        return path.read_text(encoding='utf-8') if path.exists() else ''
+
+    return LinkSuggester.build(pages, read('glossary/terminology.md'),
+                               read('glossary/acronyms.md'), LOCALES, DEFAULT_LOCALE)
+
+def find_potential_links(content, suggester, page, linked=()):
+    """Internal-link suggestions for one page body: mentions of another
+    page's title or a glossary term that are not linked yet"""
+    return [f"Consider linking '{text}' to /{route}"
+            for text, route in suggester.suggest(content, page, linked)]
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Check wiki pages for broken internal and #section links"
+    )
+    parser.add_argument('--strict', action='store_true',
+                        help='Exit 1 on broken internal links in English pages')
+    parser.add_argument('--strict-es', action='store_true',
+                        help='Exit 1 on broken internal links in Spanish pages too')
+    parser.add_argument('--strict-anchors', action='store_true',
+                        help='Exit 1 on broken #section links in the gated locales')
+    parser.add_argument('--history', nargs='?', const=str(HISTORY_PATH), default=None,
+                        metavar='PATH',
+                        help='Append this run to the findings history database '
+                             '(default path: ./.findings_history.sqlite)')
+    parser.add_argument('--graph', nargs='?', const=str(GRAPH_PATH), default=None,
+                        metavar='PATH',
+                        help='Write the internal link graph (default path: ./link_graph.json)')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("DISABILITY WIKI - INTERNAL LINK VALIDATOR")
     print("=" * 80)
@@ -132,9 +188,20 @@ def main():
     print(f"Found {len(md_files)} content markdown files (excluding {', '.join(sorted(EXCLUDE_DIRS))})\n")
 
     broken_links = []
+    broken_anchors = []
+    cross_locale = []
+    # (page, page it links to) for every working internal link, for --graph
+    graph_links = []
+    # Per-locale totals, so each locale can be gated on its own
+    totals = {locale: defaultdict(int) for locale in (DEFAULT_LOCALE, *LOCALES)}
     all_links = []
+    anchor_links = 0
+    links_by_section = defaultdict(int)
+    headings = HeadingIndex(BASE_DIR)
+    suggester = build_suggester(md_files)
     files_without_description = []
     suggestions_by_file = defaultdict(list)
+    titles = {}
     scanned = 0
 
     # Check each file
@@ -152,6 +219,10 @@ def main():
         if frontmatter.get('published', '').strip().lower() != 'true':
             continue
         scanned += 1
+        locale = locale_of(rel_path.as_posix())
+        counts = totals[locale]
+        counts['pages'] += 1
+        titles[rel_path.as_posix()] = frontmatter.get('title', '').strip('"\'')
 
         # Check for missing description
         if not frontmatter.get('description') or frontmatter.get('description').strip() == '':
@@ -159,44 +230,155 @@ def main():
 
         # Extract links from body
         links = extract_links(body)
+        headings.add(rel_path.as_posix(), content)
+        linked = set()
 
         for text, url in links:
-            if is_internal_link(url):
+            fragment = split_fragment(url)[1]
+            if url.startswith('#'):
+                # Same-page section link: must match one of this page's headings
+                anchor_links += 1
+                links_by_section[section_of(rel_path.as_posix())] += 1
+                if not headings.has_anchor(rel_path.as_posix(), fragment):
+                    counts['broken_anchors'] += 1
+                    broken_anchors.append({
+                        'file': str(rel_path),
+                        'locale': locale,
+                        'text': text,
+                        'url': url,
+                        'target': f"{rel_path.as_posix()}#{fragment}"
+                    })
+            elif is_internal_link(url):
                 all_links.append((str(rel_path), text, url))
+                links_by_section[section_of(rel_path.as_posix())] += 1
+                counts['links'] += 1
 
                 # Normalize and check
                 target = normalize_wiki_path(url)
+                linked.add(page_route(resolve_page(target) or f"{target}.md"))
 
                 if not check_link_exists(target):
+                    counts['broken'] += 1
                     broken_links.append({
                         'file': str(rel_path),
+                        'locale': locale,
                         'text': text,
                         'url': url,
                         'target': f"{target}.md"
                     })
+                    continue
+
+                page = resolve_page(target)
+                if page:
+                    graph_links.append((rel_path.as_posix(), page))
+
+                translated = translation_of(target, locale)
+                if translated:
+                    # Works, but sends a Spanish reader to the English page
+                    counts['cross_locale'] += 1
+                    cross_locale.append({
+                        'file': str(rel_path),
+                        'locale': locale,
+                        'text': text,
+                        'url': url,
+                        'target': f"/{translated}"
+                    })
+
+                if fragment:
+                    # Deep link: the page exists, the section must too
+                    anchor_links += 1
+                    if page and not headings.has_anchor(page, fragment):
+                        counts['broken_anchors'] += 1
+                        broken_anchors.append({
+                            'file': str(rel_path),
+                            'locale': locale,
+                            'text': text,
+                            'url': url,
+                            'target': f"{page}#{fragment}"
+                        })
 
         # Find suggestions
-        suggestions = find_potential_links(body, md_files)
+        suggestions = find_potential_links(body, suggester, rel_path.as_posix(), linked)
         if suggestions:
             suggestions_by_file[str(rel_path)] = suggestions
 
+    # Likely intended page for each broken link: git renames, then similar
+    # published routes (see link_repair.py)
+    if broken_links:
+        repairs = RepairIndex.build(BASE_DIR, routes(), titles, pages=titles)
+        for link in broken_links:
+            link['repairs'] = repairs.suggest(normalize_wiki_path(link['url']), link['text'])
+
     # Report results
     print("=" * 80)
     print("LINK VALIDATION RESULTS")
     print("=" * 80)
 
+    # Locales whose broken links fail --strict; the others are listed as
+    # advisory so a passing run doesn't read as a failure
+    gated = {DEFAULT_LOCALE} | ({'es'} if args.strict_es else set())
+
     if broken_links:
-        print(f"\n❌ {len(broken_links)} BROKEN INTERNAL LINKS FOUND:\n")
-        for link in broken_links[:10]:  # Show first 10
+        for locale in totals:
+            in_locale = [link for link in broken_links if link['locale'] == locale]
+            if not in_locale:
+                print(f"\n✓ No broken internal links in {locale} pages\n")
+                continue
+            if locale in gated:
+                print(f"\n❌ {len(in_locale)} BROKEN INTERNAL LINKS FOUND in {locale} pages:\n")
+            else:
+                print(f"\n⚠️  {len(in_locale)} broken internal links in {locale} pages "
+                      f"(advisory: gated only with --strict-{locale}):\n")
+            for link in in_locale[:10]:  # Show first 10
+                print(f"File: {link['file']}")
+                print(f"  Text: '{link['text']}'")
+                print(f"  URL: {link['url']}")
+                print(f"  Target not found: {link['target']}")
+                if link['repairs']:
+                    print(f"  Did you mean: {format_suggestions(link['repairs'])}")
+                print()
+
+            if len(in_locale) > 10:
+                print(f"  ... and {len(in_locale) - 10} more (see report file)\n")
+
+        moved = sum(1 for link in broken_links
+                    if link['repairs'] and link['repairs'][0][2] == 'renamed')
+        if moved:
+            print(f"  {moved} of these point at a page's old path (moved in git history):"
+                  " fix the links, or declare the redirects with"
+                  " python3 scripts/rename_redirects.py --write\n")
+    else:
+        print("\n✓ No broken internal links found!\n")
+
+    # Section (#anchor) links whose heading is missing or was renamed
+    if broken_anchors:
+        if args.strict_anchors:
+            print(f"❌ {len(broken_anchors)} BROKEN SECTION LINKS (no such heading):\n")
+        else:
+            print(f"⚠️  {len(broken_anchors)} broken section links (no such heading; "
+                  f"advisory: gated only with --strict-anchors):\n")
+        for link in broken_anchors[:10]:
             print(f"File: {link['file']}")
             print(f"  Text: '{link['text']}'")
             print(f"  URL: {link['url']}")
-            print(f"  Target not found: {link['target']}\n")
+            print(f"  Heading not found: {link['target']}\n")
 
-        if len(broken_links) > 10:
-            print(f"  ... and {len(broken_links) - 10} more (see report file)\n")
+        if len(broken_anchors) > 10:
+            print(f"  ... and {len(broken_anchors) - 10} more (see report file)\n")
     else:
-        print("\n✓ No broken internal links found!\n")
+        print("✓ No broken section links found!\n")
+
+    # Links that work but cross into the other locale's version of a page
+    if cross_locale:
+        print(f"⚠️  {len(cross_locale)} CROSS-LOCALE LINKS (a translated page exists):\n")
+        for link in cross_locale[:10]:
+            print(f"File: {link['file']}")
+            print(f"  Text: '{link['text']}'")
+            print(f"  URL: {link['url']}")
+            print(f"  Use instead: {link['target']}\n")
+
+        if len(cross_locale) > 10:
+            print(f"  ... and {len(cross_locale) - 10} more (see report file)\n")
 
     # Report missing descriptions
     print("=" * 80)
@@ -217,9 +399,17 @@ def main():
     print("=" * 80)
     print(f"Published content pages scanned: {scanned} (of {len(md_files)} candidate files)")
     print(f"Total internal links: {len(all_links)}")
-    print(f"Broken links: {len(broken_links)}")
+    print(f"Broken links: {len(broken_links)} "
+          f"({sum(totals[locale]['broken'] for locale in gated)} gated)")
+    print(f"Section links checked: {anchor_links}")
+    print(f"Broken section links: {len(broken_anchors)}")
     print(f"Files missing descriptions: {len(files_without_description)}")
     print(f"Files with link suggestions: {len(suggestions_by_file)}")
+    print(f"Cross-locale links: {len(cross_locale)}")
+    for locale, counts in totals.items():
+        advisory = '' if locale in gated else ' (advisory)'
+        print(f"  [{locale}]{advisory} pages: {counts['pages']}, internal links: {counts['links']}, "
+              f"broken: {counts['broken']}, broken section links: {counts['broken_anchors']}")
 
     # Suggestions sample
     if suggestions_by_file:
@@ -246,6 +436,26 @@ def main():
                 f.write(f"  Text: '{link['text']}'\n")
                 f.write(f"  URL: {link['url']}\n")
                 f.write(f"  Target: {link['target']}\n")
+                if link['repairs']:
+                    f.write(f"  Did you mean: {format_suggestions(link['repairs'])}\n")
+
+        if broken_anchors:
+            f.write(f"\nBROKEN SECTION LINKS ({len(broken_anchors)} found):\n")
+            f.write("-" * 80 + "\n")
+            for link in broken_anchors:
+                f.write(f"\nFile: {link['file']}\n")
+                f.write(f"  Text: '{link['text']}'\n")
+                f.write(f"  URL: {link['url']}\n")
+                f.write(f"  Heading not found: {link['target']}\n")
+
+        if cross_locale:
+            f.write(f"\nCROSS-LOCALE LINKS ({len(cross_locale)} found):\n")
+            f.write("-" * 80 + "\n")
+            for link in cross_locale:
+                f.write(f"\nFile: {link['file']}\n")
+                f.write(f"  Text: '{link['text']}'\n")
+                f.write(f"  URL: {link['url']}\n")
+                f.write(f"  Use instead: {link['target']}\n")
 
         f.write("\n" + "=" * 80 + "\n")
         f.write(f"FILES MISSING DESCRIPTIONS ({len(files_without_description)}):\n")
@@ -268,17 +478,69 @@ def main():
         f.write(f"Published content pages scanned: {scanned} (of {len(md_files)} candidates)\n")
         f.write(f"Total internal links: {len(all_links)}\n")
         f.write(f"Broken links: {len(broken_links)}\n")
+        f.write(f"Section links checked: {anchor_links}\n")
+        f.write(f"Broken section links: {len(broken_anchors)}\n")
         f.write(f"Files missing descriptions: {len(files_without_description)}\n")
+        f.write(f"Cross-locale links: {len(cross_locale)}\n")
+        for locale, counts in totals.items():
+            f.write(f"  [{locale}] pages: {counts['pages']}, internal links: {counts['links']}, "
+                    f"broken: {counts['broken']}, "
+                    f"broken section links: {counts['broken_anchors']}\n")
 
     print(f"\n✓ Detailed report saved to: {report_file}")
     print()
 
+    # --history [PATH]: append this run to the shared findings history database
+    if args.history:
+        findings = [
+            {'kind': kind, 'path': link['file'], 'target': link['url'],
+             'detail': f"not found: {link['target']}"}
+            for kind, group in (('broken_internal', broken_links),
+                                ('broken_section', broken_anchors),
+                                ('cross_locale', cross_locale))
+            for link in group
+        ]
+        with FindingsHistory(args.history) as history:
+            history.record_run(
+                'validate_wiki_links', findings, checked=dict(links_by_section),
+                summary={'scanned': scanned, 'internal_links': len(all_links),
+                         'broken_links': len(broken_links),
+                         'broken_section_links': len(broken_anchors),
+                         'locales': {locale: dict(counts) for locale, counts in totals.items()}},
+            )
+        print(f"✓ Run recorded in history: {args.history}")
+
+    # --graph [PATH]: the internal link graph with backlinks, orphans, clicks
+    # from the sidebar and centrality (see link_graph.py)
+    if args.graph:
+        started = time.perf_counter()
+        graph = LinkGraph.from_links(titles, graph_links)
+        doc = graph.analyse(nav_pages(resolve_page, BASE_DIR / NAV_EXPORT), published=titles)
+        LinkGraph.save(doc, args.graph)
+        print(f"✓ Link graph: {len(graph)} pages, {len(doc['targets'])} links, "
+              f"{len(doc['orphans'])} orphans, {len(doc['unreachable'])} more than "
+              f"{doc['max_clicks']} clicks from the sidebar "
+              f"({(time.perf_counter() - started) * 1000:.0f}ms) -> {args.graph}")
+
     # CI gate: with --strict, exit non-zero when broken internal links exist so
     # a GitHub Action can block the merge (publishing = merge to main, no review
     # gate otherwise). Missing-description and suggestion output stay advisory.
-    if '--strict' in sys.argv and broken_links:
-        print(f"✗ STRICT: {len(broken_links)} broken internal link(s) — failing.")
-        sys.exit(1)
+    # Broken section links are advisory under --strict until the existing ones
+    # (mostly `{#id}` heading suffixes the site does not support) are fixed;
+    # --strict-anchors gates on them too. The Spanish locale is gated only with
+    # --strict-es until its existing broken links are fixed.
+    if args.strict or args.strict_es:
+        failing = {locale: totals[locale]['broken'] for locale in sorted(gated)
+                   if totals[locale]['broken']}
+        if failing:
+            detail = ', '.join(f"{n} in {locale}" for locale, n in failing.items())
+            print(f"✗ STRICT: broken internal link(s) ({detail}) — failing.")
+            sys.exit(1)
+    if args.strict_anchors:
+        failing = sum(totals[locale]['broken_anchors'] for locale in gated)
+        if failing:
+            print(f"✗ STRICT: {failing} broken section link(s) — failing.")
+            sys.exit(1)
 
 if __name__ == '__main__':
     main()
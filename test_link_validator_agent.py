@@ -0,0 +1,817 @@
+#!/usr/bin/env python3
+"""Offline tests for link_validator_agent.LinkValidator.
+
+The external-link engines are exercised with the HTTP probe stubbed out, so
+these run anywhere with no sockets and no `requests` install. They pin the
+politeness guarantees the nightly run depends on: a host is never hit harder
+than its limit, however many of its URLs a page links to.
+
+Run: python3 test_link_validator_agent.py
+"""
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import link_validator_agent as lva  # noqa: E402
+from heading_index import heading_slugs  # noqa: E402  (scripts/, on the path via lva)
+from route_manifest import RouteManifest, parse_redirects  # noqa: E402
+import rename_redirects  # noqa: E402
+import validate_wiki_links  # noqa: E402
+
+
+def external(url, file='wiki/page.md', line=1):
+    return {'text': url, 'url': url, 'type': 'external', 'line': line, 'file': file}
+
+
+def offline_validator(**kwargs):
+    """A LinkValidator whose resolver says every host exists, without the network."""
+    v = lva.LinkValidator(wiki_root='.', **kwargs)
+    v.dns.resolves = lambda host: True
+    return v
+
+
+class RecordingProbe:
+    """Stand-in for LinkValidator._probe_external that records concurrency."""
+
+    def __init__(self, delay=0.02, dead=()):
+        self.delay = delay
+        self.dead = set(dead)
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.max_per_host = {}
+        self.max_total = 0
+        self.starts = {}
+
+    def __call__(self, url, timeout=10, extra_headers=None):
+        host = lva.urlparse(url).hostname
+        with self.lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.max_per_host[host] = max(self.max_per_host.get(host, 0), self.in_flight[host])
+            self.max_total = max(self.max_total, sum(self.in_flight.values()))
+            self.starts.setdefault(host, []).append(time.monotonic())
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight[host] -= 1
+        if url in self.dead:
+            return False, "HTTP 404", {'status': 404}
+        return True, None, {'status': 200}
+
+
+class AsyncEngineTests(unittest.TestCase):
+    def run_async(self, links, probe, **kwargs):
+        v = offline_validator(engine='async', **kwargs)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        return v
+
+    def test_per_host_and_global_limits_hold(self):
+        links = [external(f"https://host{h}.example/p{i}") for h in range(4) for i in range(6)]
+        probe = RecordingProbe()
+        v = self.run_async(links, probe, concurrency=3, per_host=2, host_delay=0)
+        self.assertEqual(len(v.external_url_cache), 24)
+        self.assertLessEqual(max(probe.max_per_host.values()), 2)
+        self.assertLessEqual(probe.max_total, 3)
+
+    def test_host_spacing_between_request_starts(self):
+        links = [external(f"https://slow.example/p{i}") for i in range(4)]
+        probe = RecordingProbe(delay=0)
+        self.run_async(links, probe, concurrency=10, per_host=4, host_delay=0.05)
+        starts = probe.starts['slow.example']
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertTrue(all(g >= 0.04 for g in gaps), gaps)
+
+    def test_every_occurrence_of_dead_url_is_reported(self):
+        dead = "https://gone.example/x"
+        links = [external(dead, 'a.md'), external(dead, 'b.md'), external("https://ok.example/")]
+        v = self.run_async(links, RecordingProbe(delay=0, dead=[dead]), host_delay=0)
+        broken = v.results['broken_external_links']
+        self.assertEqual(sorted(b['file'] for b in broken), ['a.md', 'b.md'])
+        self.assertEqual(broken[0]['error'], "HTTP 404")
+
+
+class HostFailureTests(unittest.TestCase):
+    def test_circuit_opens_after_threshold(self):
+        links = [external(f"https://gone.example/deep/{i}") for i in range(10)]
+        probe = mock.Mock(return_value=(False, "Connection failed", {}))
+        v = offline_validator(engine='async', per_host=1, host_delay=0, breaker_threshold=3)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(probe.call_count, 3)
+        self.assertEqual(len(v.results['broken_external_links']), 10)
+        self.assertEqual(v.results['short_circuited_hosts']['gone.example']['urls_skipped'], 7)
+
+    def test_http_errors_do_not_trip_the_circuit(self):
+        links = [external(f"https://live.example/{i}") for i in range(5)]
+        probe = mock.Mock(return_value=(False, "HTTP 404", {'status': 404}))
+        v = offline_validator(engine='async', per_host=1, host_delay=0, breaker_threshold=2)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(probe.call_count, 5)
+
+    def test_unresolvable_host_is_looked_up_once_and_never_probed(self):
+        v = lva.LinkValidator(wiki_root='.', engine='async', host_delay=0)
+        real = mock.Mock(side_effect=lva.socket.gaierror(lva.socket.EAI_NONAME,
+                                                          "Name or service not known"))
+        v.dns._getaddrinfo = real
+        links = [external(f"https://nxdomain.example/{i}") for i in range(4)]
+        probe = mock.Mock(side_effect=AssertionError("probed a host with no DNS"))
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(real.call_count, 1)
+        self.assertEqual({b['error'] for b in v.results['broken_external_links']},
+                         {'DNS lookup failed'})
+
+    def test_temporary_resolver_failure_is_not_a_verdict(self):
+        v = lva.LinkValidator(wiki_root='.', engine='async', host_delay=0)
+        again = lva.socket.gaierror(lva.socket.EAI_AGAIN, "Temporary failure in name resolution")
+        real = mock.Mock(side_effect=again)
+        v.dns._getaddrinfo = real
+        links = [external(f"https://flaky.example/{i}") for i in range(4)]
+        probe = mock.Mock(return_value=(True, None, {'status': 200}))
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(probe.call_count, 4, "the probe decides, not the local resolver")
+        self.assertEqual(real.call_count, 4, "a temporary failure is not memoised")
+        self.assertEqual(v.results['broken_external_links'], [])
+        self.assertEqual(v.breaker.tripped, {})
+
+    def test_proxied_urls_skip_the_local_lookup(self):
+        v = lva.LinkValidator(wiki_root='.', engine='async', host_delay=0)
+        v.dns._getaddrinfo = mock.Mock(side_effect=AssertionError("resolved a proxied host"))
+        fake = mock.Mock()
+        fake.utils.get_environ_proxies.return_value = {'https': 'http://proxy.example:3128'}
+        probe = mock.Mock(return_value=(True, None, {'status': 200}))
+        with mock.patch.object(lva, 'requests', fake, create=True), \
+                mock.patch.object(lva, 'REQUESTS_AVAILABLE', True), \
+                mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async([external("https://behind.example/")])
+        self.assertEqual(probe.call_count, 1)
+        self.assertEqual(v.results['broken_external_links'], [])
+
+    def test_resolver_cache_reuses_answer_across_ports(self):
+        dns = lva.DnsCache()
+        answer = [(2, 1, 6, '', ('192.0.2.7', 0))]
+        dns._getaddrinfo = mock.Mock(return_value=answer)
+        https = dns.getaddrinfo('Host.example', 443, 0, 1)
+        http = dns.getaddrinfo('host.example', 80, 0, 1)
+        self.assertEqual(dns._getaddrinfo.call_count, 1)
+        self.assertEqual(https[0][4], ('192.0.2.7', 443))
+        self.assertEqual(http[0][4], ('192.0.2.7', 80))
+
+
+class ThrottleTests(unittest.TestCase):
+    def throttling_probe(self, throttled_times, retry_after):
+        seen = {}
+
+        def probe(url, timeout=10, extra_headers=None):
+            seen[url] = seen.get(url, 0) + 1
+            if seen[url] <= throttled_times:
+                return False, "HTTP 429", {'status': 429, 'retry_after': retry_after}
+            return True, None, {'status': 200}
+        return probe, seen
+
+    def test_429_is_requeued_not_reported(self):
+        links = [external(f"https://busy.example/p{i}") for i in range(4)]
+        probe, seen = self.throttling_probe(1, 0.01)
+        v = offline_validator(engine='async', per_host=4, host_delay=0)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(v.results['broken_external_links'], [])
+        self.assertEqual(set(seen.values()), {2})
+        self.assertEqual(v.results['requeued_after_throttle'], 4)
+
+    def test_threads_engine_requeues_instead_of_sleeping_in_a_worker(self):
+        links = [external(f"https://busy.example/p{i}") for i in range(3)]
+        links += [external(f"https://calm.example/p{i}") for i in range(3)]
+        probe, seen = self.throttling_probe(1, 0.2)
+        probe_calls = mock.Mock(side_effect=lambda url, *a, **k: probe(url))
+        sleeps = []
+        real_sleep = time.sleep
+
+        def sleep(seconds):
+            sleeps.append((threading.current_thread() is threading.main_thread(), seconds))
+            real_sleep(min(seconds, 0.01))
+
+        v = offline_validator(host_delay=0)
+        with mock.patch.object(lva, 'REQUESTS_AVAILABLE', True), \
+                mock.patch.object(v, '_proxied', lambda url: False), \
+                mock.patch.object(v, '_probe_external', probe_calls), \
+                mock.patch.object(lva.time, 'sleep', sleep):
+            v.validate_external_links_batch(links)
+        self.assertEqual(v.results['broken_external_links'], [])
+        self.assertEqual(set(seen.values()), {2})
+        self.assertEqual(v.results['requeued_after_throttle'], 6)
+        # Backoff and spacing are the dispatcher's; workers never pause
+        self.assertEqual([seconds for main, seconds in sleeps if not main], [])
+
+    def test_threads_engine_caps_each_host_and_halves_on_throttle(self):
+        links = [external(f"https://{host}.example/p{i}") for host in ('busy', 'calm')
+                 for i in range(8)]
+        first, after = RecordingProbe(delay=0.02), RecordingProbe(delay=0.02)
+        throttled = []
+
+        def probe(url, timeout=10, extra_headers=None):
+            busy = url.startswith('https://busy.')
+            if busy and not throttled:
+                throttled.append(time.monotonic() + 0.1)
+                return False, "HTTP 429", {'status': 429, 'retry_after': 0.1}
+            # Probes of busy.example started once its Retry-After has passed
+            resumed = busy and throttled and time.monotonic() >= throttled[0]
+            return (after if resumed else first)(url)
+
+        v = offline_validator(per_host=4, host_delay=0)
+        with mock.patch.object(lva, 'REQUESTS_AVAILABLE', True), \
+                mock.patch.object(v, '_proxied', lambda url: False), \
+                mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_batch(links)
+        self.assertEqual(len(v.external_url_cache), 16)
+        self.assertEqual(v.results['requeued_after_throttle'], 1)
+        self.assertEqual(first.max_per_host['calm.example'], 4)
+        # Halved from 4 to 2, then grown to ~3.2 by the first wave's three successes
+        self.assertEqual(after.max_per_host['busy.example'], 3)
+
+    def test_aimd_halves_on_throttle_and_recovers(self):
+        limit = lva.AimdLimit(4)
+        limit.on_throttle()
+        limit.on_throttle()
+        self.assertEqual(limit.allowed, 1)
+        for _ in range(3):
+            limit.on_success()
+        self.assertEqual(limit.allowed, 2)  # about +1 per round of successes
+        for _ in range(10):
+            limit.on_success()
+        self.assertEqual(limit.allowed, 4)
+
+    def test_long_retry_after_and_last_attempt_are_the_answer(self):
+        links = [external("https://slow.example/a")]
+        probe, seen = self.throttling_probe(99, 3600)
+        v = offline_validator(engine='async', host_delay=0)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(seen, {"https://slow.example/a": 1})
+        self.assertEqual(v.results['broken_external_links'][0]['error'], "HTTP 429")
+
+        probe, seen = self.throttling_probe(99, 0)
+        v = offline_validator(engine='async', host_delay=0)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(seen, {"https://slow.example/a": lva.MAX_ATTEMPTS})
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, url=None, history=()):
+        self.status_code = status
+        self.headers = headers or {}
+        self.url = url
+        self.history = list(history)
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+        return False
+
+
+class PooledProbeTests(unittest.TestCase):
+    def probe(self, head, get):
+        session = mock.Mock()
+        session.head.return_value = head
+        session.get.return_value = get
+        v = lva.LinkValidator(wiki_root='.')
+        with mock.patch.object(v.sessions, 'get', return_value=session) as for_host:
+            result = v._probe_external("https://nohead.example/page")
+        for_host.assert_called_once_with('nohead.example')
+        return result, session
+
+    def test_head_rejected_falls_back_to_one_byte_get(self):
+        head, get = FakeResponse(405), FakeResponse(206, {'ETag': '"e"'})
+        (ok, error, meta), session = self.probe(head, get)
+        self.assertTrue(ok)
+        self.assertEqual(meta['etag'], '"e"')
+        self.assertEqual(session.get.call_args.kwargs['headers']['Range'], 'bytes=0-0')
+        self.assertTrue(head.closed and get.closed, "response not released to the pool")
+
+    def test_empty_body_range_not_satisfiable_is_alive(self):
+        (ok, error, meta), _ = self.probe(FakeResponse(501), FakeResponse(416))
+        self.assertTrue(ok)
+        self.assertIsNone(error)
+
+
+class RedirectTests(unittest.TestCase):
+    def test_chain_and_final_url_are_kept(self):
+        hops = [FakeResponse(301, url="http://org.example/a"),
+                FakeResponse(302, url="https://org.example/a")]
+        head = FakeResponse(200, url="https://www.org.example/a/", history=hops)
+        session = mock.Mock()
+        session.head.return_value = head
+        v = offline_validator()
+        with mock.patch.object(v.sessions, 'get', return_value=session):
+            self.assertEqual(v._check_url("http://org.example/a"), (True, None))
+        entry = v.redirects["http://org.example/a"]
+        self.assertEqual(entry['final_url'], "https://www.org.example/a/")
+        self.assertEqual([h['status'] for h in entry['chain']], [301, 302])
+        self.assertFalse(entry['permanent'])
+
+    def test_permanent_redirect_is_revalidated_at_its_target(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = lva.ExternalUrlCache(Path(tmp) / "cache.sqlite")
+            chain = [{'url': "http://old.example/", 'status': 301}]
+            cache.put("http://old.example/", True, None, 200, etag='"x"',
+                      now=time.time() - 365 * 24 * cache.HOUR,
+                      final_url="https://new.example/", redirects=chain)
+            v = offline_validator(url_cache=cache)
+            probe = mock.Mock(return_value=(True, None, {'status': 304}))
+            with mock.patch.object(v, '_probe_external', probe):
+                v._check_url("http://old.example/")
+            self.assertEqual(probe.call_args.args[0], "https://new.example/")
+            self.assertTrue(v.redirects["http://old.example/"]['permanent'])
+            self.assertEqual(cache.get("http://old.example/")['final_url'], "https://new.example/")
+            cache.close()
+
+
+class StreamingTests(unittest.TestCase):
+    def test_link_record_reads_like_the_old_dict(self):
+        link = lva.LinkRecord('SSI', '/benefits/us/ssi', 'internal', 3, 'wiki/a.md')
+        self.assertEqual({**link, 'error': 'x'}['url'], '/benefits/us/ssi')
+        self.assertEqual(json.loads(json.dumps(dict(link)))['line'], 3)
+        self.assertFalse(hasattr(link, '__dict__'))
+        other = lva.LinkRecord('t', '/x', 'internal', 9, ''.join(['wiki/', 'a.md']))
+        self.assertIs(link.file, other.file)
+
+    def test_broken_external_streams_once_per_occurrence(self):
+        dead = "https://gone.example/x"
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "findings.ndjson"
+            stream = lva.FindingStream(out)
+            v = offline_validator(engine='async', host_delay=0, stream=stream)
+            links = [external(dead, 'a.md'), external(dead, 'b.md', 7), external("https://ok.example/")]
+            with mock.patch.object(v, '_probe_external', RecordingProbe(delay=0, dead=[dead])):
+                v.validate_external_links_async(links)
+            stream.close()
+            records = [json.loads(line) for line in out.read_text().splitlines()]
+        self.assertEqual([(r['kind'], r['file'], r['line']) for r in records],
+                         [('broken_external', 'a.md', 1), ('broken_external', 'b.md', 7)])
+
+
+class ProbeKeyTests(unittest.TestCase):
+    def test_only_rewrites_that_cannot_change_the_answer(self):
+        self.assertEqual(lva.probe_key('HTTPS://SSA.gov:443/disability?utm_source=x&lang=es#apply'),
+                         'https://ssa.gov/disability?lang=es')
+        self.assertEqual(lva.probe_key('http://ssa.gov'), 'http://ssa.gov/')
+        self.assertEqual(lva.probe_key('https://ssa.gov/%7euser/a%2fb'), 'https://ssa.gov/~user/a%2Fb')
+        self.assertEqual(lva.probe_key('https://ssa.gov:8443/x?fbclid=1'), 'https://ssa.gov:8443/x')
+        # Each of these may be a different page or server: never merged
+        distinct = ['http://ssa.gov/x', 'https://ssa.gov/x', 'https://ssa.gov/x/',
+                    'https://www.ssa.gov/x', 'https://ssa.gov/X', 'https://ssa.gov/x?id=1']
+        self.assertEqual(len({lva.probe_key(u) for u in distinct}), len(distinct))
+
+    def test_one_probe_verdict_reported_at_every_spelling(self):
+        links = [external('https://ssa.gov/gone#top', line=1),
+                 external('https://SSA.gov/gone?utm_medium=email', line=2),
+                 external('https://ssa.gov:443/gone', line=3),
+                 external('https://ssa.gov/gone/', line=4)]
+        probe = RecordingProbe(delay=0, dead={'https://ssa.gov/gone', 'https://ssa.gov/gone/'})
+        v = offline_validator(engine='async', host_delay=0)
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async(links)
+        self.assertEqual(len(probe.starts['ssa.gov']), 2)
+        self.assertEqual([b['line'] for b in v.results['broken_external_links']], [1, 2, 3, 4])
+
+
+class UrlCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = lva.ExternalUrlCache(Path(self.tmp.name) / "cache.sqlite")
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_ttl_depends_on_verdict_class(self):
+        hour = lva.ExternalUrlCache.HOUR
+        then = time.time() - 12 * hour
+        self.cache.put("https://a.example/", True, None, 200, now=then)
+        self.cache.put("https://b.example/", False, "HTTP 404", 404, now=then)
+        self.cache.put("https://c.example/", False, "Timeout", now=then)
+        self.cache.put("https://d.example/", False, "DNS lookup failed", now=then)
+        self.assertTrue(self.cache.get("https://a.example/")['fresh'])
+        self.assertTrue(self.cache.get("https://b.example/")['fresh'])
+        self.assertFalse(self.cache.get("https://c.example/")['fresh'])
+        self.assertFalse(self.cache.get("https://d.example/")['fresh'])
+
+    def test_fresh_entry_is_not_probed(self):
+        self.cache.put("https://ok.example/", True, None, 200)
+        v = offline_validator(engine='async', url_cache=self.cache)
+        probe = mock.Mock(side_effect=AssertionError("fresh URL was probed"))
+        with mock.patch.object(v, '_probe_external', probe):
+            v.validate_external_links_async([external("https://ok.example/")])
+        self.assertEqual(v.external_url_cache["https://ok.example/"], (True, None))
+
+    def test_expired_entry_revalidates_conditionally(self):
+        url = "https://ok.example/page"
+        old = time.time() - 30 * 24 * lva.ExternalUrlCache.HOUR
+        self.cache.put(url, True, None, 200, etag='"v1"',
+                       last_modified="Mon, 01 Jun 2026 00:00:00 GMT", now=old)
+        v = offline_validator(url_cache=self.cache)
+        probe = mock.Mock(return_value=(True, None, {'status': 304}))
+        with mock.patch.object(v, '_probe_external', probe):
+            self.assertEqual(v._check_url(url), (True, None))
+        sent = probe.call_args.args[2]
+        self.assertEqual(sent['If-None-Match'], '"v1"')
+        self.assertIn('If-Modified-Since', sent)
+        entry = self.cache.get(url)
+        self.assertTrue(entry['fresh'])
+        self.assertEqual(entry['etag'], '"v1"')
+
+
+class ScheduleTests(unittest.TestCase):
+    def test_crisis_and_failed_always_due_rest_rotates_stalest_first(self):
+        day = 24 * lva.ExternalUrlCache.HOUR
+        now = time.time()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = lva.ExternalUrlCache(Path(tmp) / "cache.sqlite")
+            cache.put("https://hotline.example/", True, None, 200, now=now - 3600)
+            cache.put("https://dead.example/", False, "HTTP 404", 404, now=now - 3600)
+            for i in range(14):
+                cache.put(f"https://gov.example/{i}", True, None, 200, now=now - i * day)
+            links = [external("https://hotline.example/", 'wiki/crisis/us.md'),
+                     external("https://dead.example/", 'wiki/benefits/ssi.md'),
+                     external("https://never.example/", 'wiki/benefits/ssi.md')]
+            links += [external(f"https://gov.example/{i}", 'wiki/rights/ada.md') for i in range(14)]
+            # Linked from many pages: outranks a slightly staler single-page URL
+            links += [external("https://gov.example/10", f'wiki/p{n}.md') for n in range(8)]
+            unique = list(dict.fromkeys(link['url'] for link in links))
+
+            v = lva.LinkValidator(wiki_root='.', url_cache=cache, schedule_days=7)
+            due = v.schedule_urls(unique, links, now=now)
+            cache.close()
+
+        # 15 rotating URLs / 7 nights -> 3 due: never-checked, then by score
+        self.assertEqual(due, {"https://hotline.example/", "https://dead.example/",
+                               "https://never.example/", "https://gov.example/10",
+                               "https://gov.example/13"})
+        self.assertEqual(v.results['schedule']['deferred'], 12)
+
+
+class AnchorTests(unittest.TestCase):
+    """#fragments must match heading ids the way the site renderer makes them."""
+
+    def test_slugs_follow_the_renderer(self):
+        slugs = heading_slugs(
+            "---\ntitle: X\n---\n# Page Title\n\n## Title II — Public Services\n"
+            "## FAQ\n## FAQ\n### [Linked](/x) `code` *em*\n```\n## In a fence\n```\n"
+            "## EU {#european-union}\n<a id=\"custom\"></a>\n")
+        self.assertEqual(slugs, {'_top', 'title-ii--public-services', 'faq', 'faq-1',
+                                 'linked-code-em', 'eu-european-union', 'custom'})
+
+    def test_same_page_and_cross_page_fragments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / 'ada.md').write_text("# ADA\n\n## Title II\n", encoding='utf-8')
+            (root / 'ssi.md').write_text(
+                "## Apply\n[a](#apply) [b](#gone) [c](/ada#title-ii) [d](/ada#title-iii)\n",
+                encoding='utf-8')
+            v = lva.LinkValidator(wiki_root=root)
+            result = v.validate_links_in_file(root / 'ssi.md')
+        self.assertEqual([(b['url'], b['error']) for b in result['broken_internal']],
+                         [('#gone', "No heading '#gone' in ssi.md"),
+                          ('/ada#title-iii', "No heading '#title-iii' in ada.md")])
+
+
+class RouteManifestTests(unittest.TestCase):
+    def test_aliases_precedence_and_redirects(self):
+        routes = RouteManifest(
+            ['rights/ada/index.md', 'rights/ada.md', 'benefits/index.md', 'es/home.md',
+             'logo.png'],
+            [('home', ''), ('es', 'es/home'), ('old/ada', 'rights/ada/'),
+             ('en/*', ':splat'), ('loop', 'loop')]
+        )
+        self.assertEqual(routes.resolve('rights/ada'), 'rights/ada.md')  # x.md over x/index.md
+        self.assertEqual(routes.resolve('rights/ada/index'), 'rights/ada/index.md')
+        for path in ('benefits', 'benefits/', 'benefits/index', 'benefits/index.md',
+                     'en/benefits', 'benefits/../benefits'):
+            self.assertEqual(routes.resolve(path), 'benefits/index.md', path)
+        self.assertEqual(routes.resolve('es'), 'es/home.md')
+        self.assertEqual(routes.resolve('old/ada'), 'rights/ada.md')
+        self.assertIsNone(routes.resolve('logo.png'))
+        self.assertIsNone(routes.resolve('loop'))
+        self.assertIsNone(routes.resolve('missing'))
+
+
+class ScanTests(unittest.TestCase):
+    """--since and --jobs scans must report exactly what a plain full scan does."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "wiki"
+        self.root.mkdir()
+        self.git('init', '-q')
+        self.write('benefits/ssi.md', 'See [SSDI](/benefits/ssdi) and [home](/index).\n')
+        self.write('benefits/ssdi.md', 'Back to [SSI](/benefits/ssi).\n')
+        self.write('index.md', '[Benefits](/benefits/ssi)\n')
+        for n in range(5):
+            self.write(f'other/page{n}.md', '[Home](/index)\n')
+        self.commit()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def git(self, *args):
+        subprocess.run(['git', '-c', 'user.name=t', '-c', 'user.email=t@t', *args],
+                       cwd=self.root, check=True, capture_output=True)
+
+    def write(self, rel, text):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+
+    def commit(self):
+        self.git('add', '-A')
+        self.git('commit', '-qm', 'x')
+
+    def scan(self, since=None):
+        v = lva.LinkValidator(wiki_root=self.root, index_path=Path(self.tmp.name) / "index.json")
+        reads = []
+        real = v.validate_links_in_file
+        with mock.patch.object(v, 'validate_links_in_file',
+                               side_effect=lambda f: reads.append(f.name) or real(f)):
+            v.scan_all_files(since=since)
+        return v, reads
+
+    def test_rename_rescans_only_backlinkers(self):
+        self.scan()
+        self.git('mv', 'benefits/ssdi.md', 'benefits/ssdi-old.md')
+        self.commit()
+        v, reads = self.scan(since='HEAD~1')
+        self.assertEqual(sorted(reads), ['ssdi-old.md', 'ssi.md'])
+        full, _ = self.scan()
+        self.assertEqual(v.results['broken_internal_links'], full.results['broken_internal_links'])
+        self.assertEqual(len(v.results['broken_internal_links']), 1)
+
+    def test_new_page_fixes_links_broken_for_want_of_it(self):
+        self.write('other/page0.md', '[Soon](/housing)\n')
+        self.commit()
+        v, _ = self.scan()
+        self.assertEqual(len(v.results['broken_internal_links']), 1)
+        self.write('housing.md', 'Housing\n')
+        v, reads = self.scan(since='HEAD')
+        self.assertEqual(sorted(reads), ['housing.md', 'page0.md'])
+        self.assertEqual(v.results['broken_internal_links'], [])
+
+    def test_broken_links_suggest_renamed_and_similar_pages(self):
+        self.write('other/page1.md', '[Typo](/benefits/sssi)\n[Section](/benefits/gone)\n')
+        self.git('mv', 'benefits/ssdi.md', 'benefits/ssdi-old.md')
+        self.commit()
+        self.git('mv', 'benefits/ssdi-old.md', 'benefits/disability-insurance.md')
+        self.commit()
+        v, _ = self.scan()
+        repairs = {link['url']: [route for route, _, _ in link['repairs']]
+                   for link in v.results['broken_internal_links']}
+        self.assertEqual(repairs['/benefits/ssdi'], ['benefits/disability-insurance'])
+        self.assertEqual(repairs['/benefits/sssi'][0], 'benefits/ssi')
+        self.assertEqual(repairs['/benefits/gone'], [])
+
+    def test_rename_redirects_collapse_to_one_hop(self):
+        self.git('mv', 'benefits/ssdi.md', 'benefits/ssdi-old.md')
+        self.git('mv', 'other/page0.md', 'other/gone.md')
+        self.commit()
+        self.git('mv', 'benefits/ssdi-old.md', 'benefits/disability-insurance.md')
+        self.git('rm', '-q', 'other/gone.md')
+        self.write('other/page0.md', 'Back again\n')
+        self.commit()
+        table = rename_redirects.rename_redirects(self.root, dirs=None)
+        self.assertEqual(table, {'benefits/ssdi': 'benefits/disability-insurance',
+                                 'benefits/ssdi-old': 'benefits/disability-insurance'})
+        text = rename_redirects.with_block('/home / 301\n', table)
+        self.assertIn('/benefits/ssdi/ /benefits/disability-insurance/ 301', text)
+        self.assertEqual(rename_redirects.with_block(text, table), text)
+        self.assertEqual(parse_redirects(rename_redirects.with_block(text, {})), [('home', '')])
+
+    def test_moved_page_resolves_only_once_its_redirect_is_declared(self):
+        self.git('mv', 'benefits/ssdi.md', 'benefits/disability-insurance.md')
+        self.commit()
+
+        def exists(route):
+            with mock.patch.object(validate_wiki_links, 'BASE_DIR', self.root), \
+                    mock.patch.object(validate_wiki_links, '_routes', None):
+                return validate_wiki_links.check_link_exists(route)
+
+        self.assertFalse(exists('benefits/ssdi'), "git history alone is not a redirect")
+        table = rename_redirects.rename_redirects(self.root, dirs=None)
+        self.write('site/public/_redirects', rename_redirects.with_block('', table))
+        self.assertTrue(exists('benefits/ssdi'))
+
+    def test_parallel_scan_matches_serial(self):
+        for n in range(5):
+            self.write(f'other/page{n}.md', f'[Gone](/missing/{n})\n[Home](/index)\n')
+        serial = lva.LinkValidator(wiki_root=self.root)
+        serial_files = serial.scan_all_files()
+        parallel = lva.LinkValidator(wiki_root=self.root, jobs=2)
+        parallel_files = parallel.scan_all_files()
+        self.assertEqual(parallel.results['broken_internal_links'],
+                         serial.results['broken_internal_links'])
+        self.assertEqual([f['file'] for f in parallel_files], [f['file'] for f in serial_files])
+        self.assertEqual(len(parallel.results['broken_internal_links']), 5)
+
+    def test_ndjson_run_keeps_counts_not_links(self):
+        for n in range(3):
+            self.write(f'other/page{n}.md', f'[Gone](/missing/{n})\n[Home](/index)\n')
+        out = Path(self.tmp.name)
+        v = lva.LinkValidator(wiki_root=self.root, index_path=out / "index.json",
+                              stream=lva.FindingStream(out / "findings.ndjson"))
+        self.assertEqual(v.scan_all_files(), [])
+        self.assertEqual(v.results['broken_internal_links'], [])
+        self.assertEqual(v.generate_report(), 3)
+        v.stream.close()
+        v.save_report(out / "report.json")
+        v.record_history(out / "history.sqlite")
+
+        report = json.loads((out / "report.json").read_text())
+        self.assertEqual(report['summary']['broken_internal'], 3)
+        self.assertNotIn('broken_internal_links', report)
+        with lva.FindingsHistory(out / "history.sqlite") as history:
+            self.assertEqual(sorted(f['target'] for f in history.first_seen_broken('link_validator')),
+                             ['/missing/0', '/missing/1', '/missing/2'])
+        full = lva.LinkValidator(wiki_root=self.root, index_path=out / "index.json")
+        index = full.load_link_index()
+        self.assertEqual(len(index['files']), 8)
+        self.assertEqual(index['backlinks'][''],
+                         ['benefits/ssi.md'] + [f'other/page{n}.md' for n in range(5)])
+
+    def test_watch_reports_newly_broken_and_fixed(self):
+        watcher = lva.LinkWatcher(lva.LinkValidator(wiki_root=self.root))
+        self.assertEqual(watcher.prime(), 0)
+        self.assertEqual(watcher.poll(), ([], [], []))
+
+        (self.root / 'benefits/ssdi.md').unlink()
+        checked, broken, fixed = watcher.poll()
+        self.assertEqual(checked, ['benefits/ssi.md'])
+        self.assertEqual([b['url'] for b in broken], ['/benefits/ssdi'])
+
+        self.write('benefits/ssdi.md', 'Back again.\n')
+        self.write('other/page1.md', '[Home](/index)\n[Nowhere](/nowhere)\n')
+        checked, broken, fixed = watcher.poll()
+        self.assertEqual(checked, ['benefits/ssdi.md', 'benefits/ssi.md', 'other/page1.md'])
+        self.assertEqual([b['url'] for b in broken], ['/nowhere'])
+        self.assertEqual([f['url'] for f in fixed], ['/benefits/ssdi'])
+
+    def test_relative_links_resolve_against_the_source_directory(self):
+        self.write('benefits/us/medicaid.md', '## Apply\n')
+        self.write('benefits/us/ssi.md', '[a](medicaid.md) [b](./medicaid#apply) '
+                   '[c](../ssdi) [d](../../../index.md) [e](medicaid#gone) [f](../us) '
+                   '[g](tel:988)\n')
+        v = lva.LinkValidator(wiki_root=self.root)
+        v.use_pages(v.build_page_index())
+        result = v.validate_links_in_file(self.root / 'benefits/us/ssi.md')
+        self.assertEqual(len(result['internal_links']), 6)
+        self.assertEqual([(b['url'], b['error']) for b in result['broken_internal']],
+                         [('medicaid#gone', "No heading '#gone' in benefits/us/medicaid.md"),
+                          ('../us', 'No file found at benefits/us')])
+
+    def test_rename_rescans_relative_linkers(self):
+        self.write('benefits/ssdi.md', 'Back to [SSI](ssi.md).\n')
+        self.commit()
+        self.scan()
+        self.git('mv', 'benefits/ssi.md', 'benefits/ssi-old.md')
+        self.commit()
+        v, reads = self.scan(since='HEAD~1')
+        self.assertEqual(sorted(reads), ['index.md', 'ssdi.md', 'ssi-old.md'])
+        self.assertEqual(sorted(b['url'] for b in v.results['broken_internal_links']),
+                         ['/benefits/ssi', 'ssi.md'])
+
+    def test_heading_edit_rescans_deep_linkers(self):
+        self.write('benefits/ssdi.md', '## Eligibility\nBack to [SSI](/benefits/ssi).\n')
+        self.write('other/page0.md', '[Who](/benefits/ssdi#eligibility)\n')
+        self.commit()
+        self.scan()
+        self.write('benefits/ssdi.md', '## Who qualifies\nBack to [SSI](/benefits/ssi).\n')
+        self.commit()
+        v, reads = self.scan(since='HEAD~1')
+        self.assertEqual(sorted(reads), ['page0.md', 'ssdi.md'])
+        self.assertEqual([b['url'] for b in v.results['broken_internal_links']],
+                         ['/benefits/ssdi#eligibility'])
+
+    def test_shard_reports_merge_to_the_unsharded_report(self):
+        urls = [f"https://host{h}.example/p{i}" for h in range(6) for i in range(2)]
+        self.write('other/page0.md', ''.join(f"[l]({u})\n" for u in urls) + '[x](/gone)\n')
+        self.commit()
+        dead = urls[1::3]
+
+        def run(shard=None):
+            v = lva.LinkValidator(wiki_root=self.root, engine='async', host_delay=0, shard=shard)
+            with mock.patch.object(lva, 'REQUESTS_AVAILABLE', True), \
+                    mock.patch.object(v, '_probe_external', RecordingProbe(delay=0, dead=dead)), \
+                    mock.patch.object(v, '_proxied', lambda url: False), \
+                    mock.patch.object(v.dns, 'resolves', lambda host: True):
+                v.scan_all_files()
+            v.generate_report()
+            return v
+
+        whole = run()
+        shards = [run((i, 3)) for i in (1, 2, 3)]
+        hosts = [{lva.url_host(u) for u in s.results['shard']['verdicts']} for s in shards]
+        self.assertEqual(sum(len(h) for h in hosts), 6)  # every host on exactly one shard
+        self.assertEqual(set().union(*hosts), {lva.url_host(u) for u in urls})
+
+        merged = lva.LinkValidator(wiki_root=self.root)
+        merged.merge_shard_reports([json.loads(json.dumps(s.results)) for s in reversed(shards)])
+        merged.generate_report()
+        self.assertEqual(merged.results['summary'], whole.results['summary'])
+        self.assertEqual(sorted(b['url'] for b in merged.results['broken_external_links']),
+                         sorted(dead))
+        with self.assertRaises(ValueError):
+            merged.merge_shard_reports([s.results for s in shards[:2]])
+
+    def test_resume_after_crash_skips_finished_work(self):
+        urls = [f"https://host{h}.example/p{i}" for h in range(3) for i in range(3)]
+        self.write('other/page0.md', ''.join(f"[l]({u})\n" for u in urls) + '[x](/gone)\n')
+        journal_path = Path(self.tmp.name) / "journal.ndjson"
+
+        def run(resume=False):
+            probe = RecordingProbe(delay=0, dead=urls[::4])
+            v = lva.LinkValidator(wiki_root=self.root, engine='async', host_delay=0,
+                                  journal=lva.RunJournal(journal_path), resume=resume)
+            reads = []
+            real = v.validate_links_in_file
+            with mock.patch.object(lva, 'REQUESTS_AVAILABLE', True), \
+                    mock.patch.object(v, '_probe_external', probe), \
+                    mock.patch.object(v, '_proxied', lambda url: False), \
+                    mock.patch.object(v.dns, 'resolves', lambda host: True), \
+                    mock.patch.object(v, 'validate_links_in_file',
+                                      side_effect=lambda f: reads.append(f.name) or real(f)):
+                v.scan_all_files()
+            v.journal.close()
+            v.generate_report()
+            probed = sum(len(starts) for starts in probe.starts.values())
+            return v, reads, probed
+
+        whole, _, _ = run()
+        # Killed after every file and four verdicts, mid-way through a fifth
+        lines = journal_path.read_text().splitlines()
+        files = [line for line in lines if '"kind": "file"' in line]
+        verdicts = [line for line in lines if '"kind": "verdict"' in line]
+        journal_path.write_text('\n'.join(lines[:1] + files + verdicts[:4]) + '\n'
+                                + verdicts[4][:20])
+
+        self.write('other/page1.md', '[Home](/index)\n[Moved](/elsewhere)\n')
+        resumed, reads, probed = run(resume=True)
+        self.assertEqual(reads, ['page1.md'])
+        self.assertEqual(probed, len(urls) - 4)
+        self.assertEqual(resumed.results['broken_external_links'],
+                         whole.results['broken_external_links'])
+        self.assertEqual(resumed.results['summary']['broken_internal'],
+                         whole.results['summary']['broken_internal'] + 1)
+
+    def test_resume_rechecks_links_into_a_changed_page(self):
+        self.write('benefits/ssdi.md', '# SSDI\n\n## Apply\n')
+        self.write('other/page0.md', '[How](/benefits/ssdi#apply)\n')
+        journal_path = Path(self.tmp.name) / "journal.ndjson"
+
+        def run(resume=False):
+            v = lva.LinkValidator(wiki_root=self.root, journal=lva.RunJournal(journal_path),
+                                  resume=resume)
+            reads = []
+            real = v.validate_links_in_file
+            with mock.patch.object(v, 'validate_links_in_file',
+                                   side_effect=lambda f: reads.append(f.name) or real(f)):
+                v.scan_all_files()
+            v.journal.close()
+            return v, reads
+
+        run()
+        self.write('benefits/ssdi.md', '# SSDI\n\n## How to apply\n')
+        resumed, reads = run(resume=True)
+        self.assertEqual(sorted(reads), ['page0.md', 'ssdi.md'])
+        self.assertEqual([b['url'] for b in resumed.results['broken_internal_links']],
+                         ['/benefits/ssdi#apply'])
+
+    def test_index_records_backlinks(self):
+        self.scan()
+        index = json.loads((Path(self.tmp.name) / "index.json").read_text())
+        self.assertEqual(index['backlinks']['benefits/ssi'], ['benefits/ssdi.md', 'index.md'])
+
+
+class CommandLineTests(unittest.TestCase):
+    def test_limits_that_would_hang_or_crash_are_rejected(self):
+        for argv in (['--concurrency', '0'], ['--per-host', '0'], ['--jobs', '-3']):
+            stderr = io.StringIO()
+            with mock.patch.object(sys, 'argv', ['link_validator_agent.py', *argv]), \
+                    contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as cm:
+                lva.main()
+            self.assertEqual(cm.exception.code, 2, argv)
+            self.assertIn(argv[0], stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)